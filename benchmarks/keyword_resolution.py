@@ -0,0 +1,142 @@
+"""Measures how keyword resolution scales with the number of keywords.
+
+For each size N a project is generated with ``--keywords N``, i.e. a library
+and a resource file with N normal and N embedded-argument keywords each, and
+the following are timed:
+
+* parse: building the resource file and the suite tree from disk
+* import: importing the library and creating its keywords
+* lookups: finding normal and embedded-argument keywords by name, per lookup
+* dry run: ``robot --dryrun`` of the generated suite, which resolves every call
+
+    python benchmarks/keyword_resolution.py --sizes 10 --sizes 100 --sizes 1000
+"""
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+import click
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from robot_generator import (  # noqa: E402
+    STRESS_LIBRARY_NAME,
+    STRESS_RESOURCE_NAME,
+    generate_project,
+)
+
+
+def timed(function, repeat=1):
+    """Returns the best wall time of ``repeat`` calls in seconds, and the last result."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def lookup_time(finder, names):
+    """Returns the mean time of resolving each of ``names`` with ``finder`` in seconds."""
+    started = time.perf_counter()
+    for name in names:
+        if not finder(name):
+            raise AssertionError(f"Keyword '{name}' not found.")
+    return (time.perf_counter() - started) / len(names)
+
+
+def measure(size, lookups, repeat):
+    import robot
+    from robot.running import ResourceFileBuilder, TestLibrary, TestSuiteBuilder
+
+    with tempfile.TemporaryDirectory() as project_dir:
+        generate_project(project_dir, keywords=size, echo=lambda message: None)
+        library_path = os.path.join(project_dir, "libraries", STRESS_LIBRARY_NAME)
+        resource_path = os.path.join(project_dir, "resources", STRESS_RESOURCE_NAME)
+        tests_dir = os.path.join(project_dir, "tests")
+
+        def parse():
+            TestSuiteBuilder().build(tests_dir)
+            return ResourceFileBuilder().build(resource_path)
+
+        def import_library():
+            # Import the module again each time instead of reusing sys.modules.
+            sys.modules.pop(os.path.splitext(STRESS_LIBRARY_NAME)[0], None)
+            return TestLibrary.from_name(library_path)
+
+        parse_time, resource = timed(parse, repeat)
+        import_time, library = timed(import_library, repeat)
+        indexes = [i * size // lookups + 1 for i in range(lookups)]
+        result = {
+            "keywords": size,
+            "parse": parse_time,
+            "import": import_time,
+            "resource normal lookup": lookup_time(
+                resource.find_keywords, [f"Resource Keyword {i}" for i in indexes]
+            ),
+            "resource embedded lookup": lookup_time(
+                resource.find_keywords,
+                [f"Resource Keyword {i} With value {i} Argument" for i in indexes],
+            ),
+            "library normal lookup": lookup_time(
+                library.find_keywords, [f"Library Keyword {i}" for i in indexes]
+            ),
+            "library embedded lookup": lookup_time(
+                library.find_keywords,
+                [f"Library Keyword {i} With value {i} Argument" for i in indexes],
+            ),
+        }
+        result["dry run"], _ = timed(
+            lambda: robot.run(
+                tests_dir,
+                dryrun=True,
+                output="NONE",
+                log="NONE",
+                report="NONE",
+                pythonpath=[project_dir],
+                stdout=io.StringIO(),
+            ),
+            repeat,
+        )
+    return result
+
+
+@click.command()
+@click.option(
+    "--sizes",
+    type=click.IntRange(min=1),
+    multiple=True,
+    default=(10, 100, 1000),
+    show_default=True,
+    help="Numbers of normal and embedded keywords to generate; repeat for several sizes.",
+)
+@click.option("--lookups", type=click.IntRange(min=1), default=200, show_default=True)
+@click.option("--repeat", type=click.IntRange(min=1), default=3, show_default=True)
+@click.option("--json", "json_path", default=None, help="Also write the results as JSON.")
+def main(sizes, lookups, repeat, json_path):
+    results = [measure(size, lookups, repeat) for size in sizes]
+    click.echo(
+        f"{'keywords':>9}{'parse ms':>10}{'import ms':>10}"
+        f"{'res us':>9}{'res emb us':>11}{'lib us':>9}{'lib emb us':>11}{'dry run ms':>11}"
+    )
+    for result in results:
+        click.echo(
+            f"{result['keywords']:>9}"
+            f"{result['parse'] * 1e3:>10.1f}"
+            f"{result['import'] * 1e3:>10.1f}"
+            f"{result['resource normal lookup'] * 1e6:>9.1f}"
+            f"{result['resource embedded lookup'] * 1e6:>11.1f}"
+            f"{result['library normal lookup'] * 1e6:>9.1f}"
+            f"{result['library embedded lookup'] * 1e6:>11.1f}"
+            f"{result['dry run'] * 1e3:>11.1f}"
+        )
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
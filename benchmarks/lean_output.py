@@ -0,0 +1,100 @@
+"""Compares the default --run result output with the --lean profile.
+
+Generates a project, runs it with the default options (TRACE log level, log.html
+and report.html written by robot) and with --lean (INFO log level, output.xml
+only, log and report rendered afterwards by rebot with passed keywords removed),
+and prints the wall time and output sizes of both.
+
+    python benchmarks/lean_output.py --suites 200 --tests-per-suite 20
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import click
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from robot_generator import (  # noqa: E402
+    LEAN_REBOT_OPTIONS,
+    generate_project,
+    robot_arguments,
+)
+
+RESULT_FILES = ("output.xml", "log.html", "report.html")
+
+
+def timed(command):
+    started = time.perf_counter()
+    subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - started
+
+
+def result_sizes(results_dir):
+    return {
+        name: os.path.getsize(os.path.join(results_dir, name))
+        for name in RESULT_FILES
+        if os.path.exists(os.path.join(results_dir, name))
+    }
+
+
+def measure(project_dir, lean):
+    results_dir = os.path.join(project_dir, "results-lean" if lean else "results-default")
+    run_arguments = robot_arguments(project_dir, results_dir, {"lean": lean})
+    measurement = {"run": timed(["robot", *run_arguments, f"{project_dir}/tests"])}
+    measurement["output.xml"] = result_sizes(results_dir)["output.xml"]
+    if lean:
+        measurement["reports"] = timed(
+            [
+                "rebot",
+                *LEAN_REBOT_OPTIONS,
+                "--outputdir",
+                results_dir,
+                os.path.join(results_dir, "output.xml"),
+            ]
+        )
+    measurement["sizes"] = result_sizes(results_dir)
+    return measurement
+
+
+@click.command()
+@click.option("--suites", type=click.IntRange(min=1), default=100, show_default=True)
+@click.option("--tests-per-suite", type=click.IntRange(min=1), default=20, show_default=True)
+@click.option("--json", "json_path", default=None, help="Also write the results as JSON.")
+def main(suites, tests_per_suite, json_path):
+    with tempfile.TemporaryDirectory() as project_dir:
+        generate_project(
+            project_dir,
+            with_lib=True,
+            with_resource=True,
+            suites=suites,
+            tests_per_suite=tests_per_suite,
+            echo=lambda message: None,
+        )
+        results = {"default": measure(project_dir, False), "lean": measure(project_dir, True)}
+
+    default, lean = results["default"], results["lean"]
+    click.echo(f"{suites} suites x {tests_per_suite} tests")
+    click.echo(f"{'':24}{'default':>12}{'lean':>12}{'saved':>8}")
+    rows = [
+        ("run time (s)", default["run"], lean["run"]),
+        ("output.xml (KiB)", default["output.xml"] / 1024, lean["output.xml"] / 1024),
+        (
+            "all results (KiB)",
+            sum(default["sizes"].values()) / 1024,
+            sum(lean["sizes"].values()) / 1024,
+        ),
+    ]
+    for label, before, after in rows:
+        click.echo(f"{label:24}{before:12.2f}{after:12.2f}{1 - after / before:8.0%}")
+    click.echo(f"{'lean reports later (s)':24}{'':12}{lean['reports']:12.2f}")
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Benchmark suite for the generator, compared against a JSON baseline.
+
+Measures ``create_robot_project`` for small, medium and huge projects,
+rendering only with ``--dry-run``, write throughput on tmpfs and on disk, and an
+end-to-end ``--run``. Each metric is the median of ``--repeat`` rounds.
+
+    python benchmarks/run_benchmarks.py --save-baseline       # record a baseline
+    python benchmarks/run_benchmarks.py --threshold 15        # compare against it
+
+Compared runs exit with status 1 when any metric is more than ``--threshold``
+percent worse than the baseline. Baselines are machine specific, so record one
+on the machine that runs the comparison.
+"""
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+import click
+from click.testing import CliRunner
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from robot_generator import create_robot_project  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+TMPFS_DIR = "/dev/shm"
+
+# name: (create_robot_project arguments, projects timed per round)
+# Fast cases are timed over several projects so that timer noise stays small.
+GENERATION_BENCHMARKS = {
+    "generate small": (["--with-lib", "--with-resource"], 50),
+    "generate medium": (["--with-lib", "--with-resource", "--suites", "100"], 5),
+    "generate huge": (["--with-lib", "--with-resource", "--suites", "5000"], 1),
+    "render huge (dry run)": (["--with-lib", "--with-resource", "--suites", "5000", "--dry-run"], 1),
+    "run small": (["--with-lib", "--with-resource", "--suites", "5", "--run", "--in-process"], 1),
+}
+THROUGHPUT_ARGUMENTS = ["--with-lib", "--with-resource", "--suites", "2000", "--tests-per-suite", "50"]
+
+
+def invoke(project_dir, arguments):
+    """Runs ``create_robot_project`` into a fresh ``project_dir`` and returns the wall time."""
+    shutil.rmtree(project_dir, ignore_errors=True)
+    started = time.perf_counter()
+    result = CliRunner().invoke(create_robot_project, ["--project-dir", project_dir, *arguments])
+    elapsed = time.perf_counter() - started
+    if result.exit_code != 0:
+        raise click.ClickException(f"create_robot_project {' '.join(arguments)} failed:\n{result.output}")
+    return elapsed
+
+
+def tree_size(directory):
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(directory)
+        for name in names
+    )
+
+
+def measure_time(arguments, projects, repeat):
+    """Returns the median over ``repeat`` rounds of the mean time per generated project."""
+    with tempfile.TemporaryDirectory() as work_dir:
+        project_dir = os.path.join(work_dir, "project")
+        return statistics.median(
+            sum(invoke(project_dir, arguments) for _ in range(projects)) / projects
+            for _ in range(repeat)
+        )
+
+
+def measure_throughput(base_dir, repeat):
+    """Returns the MB/s of writing a large project below ``base_dir``."""
+    with tempfile.TemporaryDirectory(dir=base_dir) as work_dir:
+        project_dir = os.path.join(work_dir, "project")
+        rates = []
+        for _ in range(repeat):
+            elapsed = invoke(project_dir, THROUGHPUT_ARGUMENTS)
+            rates.append(tree_size(project_dir) / elapsed / 1e6)
+        return statistics.median(rates)
+
+
+def run_benchmarks(repeat, disk_dir):
+    """Returns ``{name: {"value", "unit", "higher_is_better"}}`` for every benchmark."""
+    results = {}
+    for name, (arguments, projects) in GENERATION_BENCHMARKS.items():
+        click.echo(f"Measuring {name}...")
+        results[name] = {
+            "value": measure_time(arguments, projects, repeat),
+            "unit": "s",
+            "higher_is_better": False,
+        }
+    targets = {"write throughput (disk)": disk_dir}
+    if os.path.isdir(TMPFS_DIR) and os.access(TMPFS_DIR, os.W_OK):
+        targets["write throughput (tmpfs)"] = TMPFS_DIR
+    else:
+        click.echo(f"Skipping tmpfs throughput: {TMPFS_DIR} is not writable.")
+    for name, base_dir in targets.items():
+        click.echo(f"Measuring {name}...")
+        results[name] = {
+            "value": measure_throughput(base_dir, repeat),
+            "unit": "MB/s",
+            "higher_is_better": True,
+        }
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Yields ``(name, result, baseline, change percent, regressed)`` for metrics in both."""
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before, after = baseline[name]["value"], result["value"]
+        # Positive changes are always regressions, whichever way the metric points.
+        change = (before - after if result["higher_is_better"] else after - before) / before * 100
+        yield name, result, baseline[name], change, change > threshold
+
+
+@click.command()
+@click.option("--repeat", type=click.IntRange(min=1), default=3, show_default=True)
+@click.option(
+    "--baseline",
+    "baseline_path",
+    type=click.Path(dir_okay=False),
+    default=DEFAULT_BASELINE,
+    show_default=True,
+    help="JSON baseline to compare against or to save.",
+)
+@click.option("--save-baseline", is_flag=True, help="Save the results as the new baseline.")
+@click.option(
+    "--threshold",
+    type=click.FloatRange(min=0),
+    default=20.0,
+    show_default=True,
+    help="Fail when a metric is this many percent worse than the baseline.",
+)
+@click.option(
+    "--disk-dir",
+    type=click.Path(exists=True, file_okay=False),
+    default=tempfile.gettempdir(),
+    show_default=True,
+    help="Directory on the disk used for the disk write throughput.",
+)
+@click.option("--json", "json_path", default=None, help="Also write the results as JSON.")
+def main(repeat, baseline_path, save_baseline, threshold, disk_dir, json_path):
+    results = run_benchmarks(repeat, disk_dir)
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if save_baseline or not os.path.exists(baseline_path):
+        with open(baseline_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        for name, result in results.items():
+            click.echo(f"{name:28}{result['value']:10.3f} {result['unit']}")
+        click.echo(f"Baseline written to: {baseline_path}")
+        return
+
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = []
+    for name, result, before, change, regressed in compare(results, baseline, threshold):
+        click.echo(
+            f"{name:28}{result['value']:10.3f} {result['unit']:5}"
+            f"(baseline {before['value']:.3f}, {change:+.1f}%){'  REGRESSED' if regressed else ''}"
+        )
+        if regressed:
+            regressions.append(name)
+    if regressions:
+        raise click.ClickException(
+            f"{len(regressions)} metrics regressed more than {threshold:g}%: {', '.join(regressions)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
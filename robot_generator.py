@@ -1,29 +1,143 @@
-import click
-import subprocess
-import webbrowser
 import os
+import sys
+import json
+import io
+import importlib
+import importlib.util
+import contextlib
+import functools
+import hashlib
+import re
+import time
+import itertools
+import posixpath
+import queue
+import threading
 
-# === Base template with placeholders ===
-BASE_ROBOT_TEMPLATE = """
+
+def _lazy_import(name):
+    """Returns module ``name`` without running it; it is loaded on first attribute access."""
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# click is only needed by the command line, so generate() works without it.
+try:
+    click = sys.modules.get("click") or _lazy_import("click")
+except ModuleNotFoundError:
+    click = None
+
+
+# === Suite sections, rendered one chunk at a time ===
+SETTINGS_SECTION = """
 *** Settings ***
 Documentation   This is an auto-generated Robot Framework test suite.
 {settings_block}
+"""
 
+VARIABLES_SECTION = """
 *** Variables ***
-${{SOME_VARIABLE}}      Hello from some placeholder variable!
+${SOME_VARIABLE}      Hello from some placeholder variable!
+"""
 
+TEST_CASES_HEADER = """
 *** Test Cases ***
-{test_cases}
+"""
 
+KEYWORDS_SECTION = """
 *** Keywords ***
 Some Local Keyword
-    Log    ${{SOME_VARIABLE}}
-    Should Not Be Empty    ${{SOME_VARIABLE}}    msg=Expected non-empty value!
-    Should Be Equal As Strings    ${{SOME_VARIABLE}}    Hello from some placeholder variable!
-    ...    msg=Expected string 'Hello from some placeholder variable!', got '${{SOME_VARIABLE}}'
-    Should Contain    ${{SOME_VARIABLE}}    Hello    msg=Expected string to contain 'Hello', got '${{SOME_VARIABLE}}'
+    Log    ${SOME_VARIABLE}
+    Should Not Be Empty    ${SOME_VARIABLE}    msg=Expected non-empty value!
+    Should Be Equal As Strings    ${SOME_VARIABLE}    Hello from some placeholder variable!
+    ...    msg=Expected string 'Hello from some placeholder variable!', got '${SOME_VARIABLE}'
+    Should Contain    ${SOME_VARIABLE}    Hello    msg=Expected string to contain 'Hello', got '${SOME_VARIABLE}'
+"""
+
+
+# Applied when log.html and report.html of a --lean run are rendered afterwards.
+# Robot only removes keywords from the log, so this is done by rebot, not robot.
+LEAN_REBOT_OPTIONS = ["--removekeywords", "passed"]
+
+
+# === Profiling listener content ===
+PROFILER_FILE_NAME = "RobotGenProfiler.py"
+PROFILE_CSV_NAME = "profile.csv"
+
+PROFILER_LISTENER_CONTENT = """\"\"\"Records keyword and test timings into a compact CSV file.
+
+Each row is written when an item ends: kind, start time (ns since the epoch),
+elapsed ns, self ns (elapsed minus time spent in child items) and the
+';'-separated stack of suite, test and keyword names leading to the item.
+\"\"\"
+import csv
+import time
+
+
+class RobotGenProfiler:
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self, output="profile.csv"):
+        self._file = open(output, "w", encoding="utf-8", newline="", buffering=1024 * 1024)
+        self._writer = csv.writer(self._file)
+        self._stack = []
+
+    def _start(self, name):
+        # [stack, start_ns, time spent in children]
+        parent = self._stack[-1][0] + ";" if self._stack else ""
+        self._stack.append([parent + name.replace(";", ":"), time.time_ns(), 0])
+
+    def _end(self, kind):
+        stack, started, children = self._stack.pop()
+        elapsed = time.time_ns() - started
+        if self._stack:
+            self._stack[-1][2] += elapsed
+        self._writer.writerow((kind, started, elapsed, elapsed - children, stack))
+
+    def start_suite(self, data, result):
+        self._start(data.name)
+
+    def end_suite(self, data, result):
+        self._end("suite")
+
+    def start_test(self, data, result):
+        self._start(data.name)
+
+    def end_test(self, data, result):
+        self._end("test")
+
+    def start_keyword(self, data, result):
+        name = getattr(result, "source_name", None) or result.name
+        owner = getattr(result, "owner", None)
+        self._start(f"{owner}.{name}" if owner else name)
+
+    def end_keyword(self, data, result):
+        self._end("keyword")
+
+    def close(self):
+        self._file.close()
 """
 
+
+def _escape_braces(text):
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+# === Base template with placeholders, for formatting a whole suite at once ===
+BASE_ROBOT_TEMPLATE = (
+    SETTINGS_SECTION
+    + _escape_braces(VARIABLES_SECTION)
+    + TEST_CASES_HEADER
+    + "{test_cases}\n"
+    + _escape_braces(KEYWORDS_SECTION)
+)
+
 # === Individual test cases ===
 TEST_CASE_1 = """Sample Test Case With Local Keyword
     Some Local Keyword
@@ -42,6 +156,88 @@ Sample Test Case With Resource Keyword
     Resource Keyword With Some Embedded Argument
 """
 
+TEST_CASE_PERFORMANCE = """
+Sample Test Case With Pooled And Concurrent Library Keywords
+    ${response} =    Call Stub Service    single
+    Should Be Equal    ${response}    single
+    ${responses} =    Call Stub Service Concurrently    first    second    third
+    Should Be Equal    ${responses}    ${{['first', 'second', 'third']}}
+    ${responses} =    Call Stub Service Async    one    two
+    Should Be Equal    ${responses}    ${{['one', 'two']}}
+"""
+
+# === Large-scale generation building blocks ===
+SUITES_PER_DIRECTORY = 100
+WRITE_BUFFER_SIZE = 1024 * 1024
+DEFAULT_WRITE_WORKERS = 4
+
+GENERATED_TEST_CASE_HEADER = """
+Generated Test {index}
+    Some Local Keyword
+"""
+
+GENERATED_LIBRARY_STEPS = """    Some Library Keyword
+    Verify ${{{index}}} Is Greater Than ${{0}}
+"""
+
+GENERATED_PERFORMANCE_STEPS = """    ${{responses}} =    Call Stub Service Concurrently    {index}a    {index}b
+    Should Be Equal    ${{responses}}[1]    {index}b
+    ${{responses}} =    Call Stub Service Async    {index}c
+    Should Be Equal    ${{responses}}[0]    {index}c
+"""
+
+GENERATED_RESOURCE_STEPS = """    Some Resource Keyword
+    Resource Keyword With Some Embedded Argument
+"""
+
+# === Data-driven generation building blocks ===
+DEFAULT_TEMPLATE = "Verify ${number} Is Greater Than ${threshold}"
+DATASET_ROWS_PER_SUITE = 1000
+DATASET_BYTES_PER_SUITE = 1024 * 1024
+DATASET_READ_SIZE = 64 * 1024
+
+
+# === Keyword resolution stress building blocks ===
+STRESS_LIBRARY_NAME = "StressLibrary.py"
+STRESS_RESOURCE_NAME = "StressResource.robot"
+STRESS_SUITE_NAME = "KeywordStress.robot"
+
+STRESS_LIBRARY_HEADER = """from robot.api.deco import keyword, library
+
+
+@library(scope='GLOBAL', auto_keywords=False)
+class StressLibrary:
+"""
+
+STRESS_LIBRARY_KEYWORDS = """
+    @keyword('Library Keyword {index}')
+    def library_keyword_{index}(self):
+        pass
+
+    @keyword('Library Keyword {index} With ${{value}} Argument')
+    def library_keyword_{index}_with_argument(self, value):
+        return value
+"""
+
+STRESS_RESOURCE_KEYWORDS = """
+Resource Keyword {index}
+    No Operation
+
+Resource Keyword {index} With ${{value}} Argument
+    Should Be Equal    ${{value}}    value {index}
+"""
+
+STRESS_SETTINGS_BLOCK = f"""Library    ../libraries/{STRESS_LIBRARY_NAME}
+Resource   ../resources/{STRESS_RESOURCE_NAME}"""
+
+STRESS_TEST_CASE = """
+Keyword Stress {test}
+    Resource Keyword {index}
+    Resource Keyword {index} With value {index} Argument
+    Library Keyword {index}
+    Library Keyword {index} With value {index} Argument
+"""
+
 
 # === Python library content ===
 MY_LIBRARY_CONTENT = """from robot.api import logger
@@ -73,6 +269,162 @@ class MyLibrary:
         return number
 """
 
+MY_PERFORMANCE_LIBRARY_CONTENT = """\"\"\"MyLibrary for fast runs: one instance per run, pooled resources, concurrent keywords.
+
+The library has GLOBAL scope, so it is created once and shared by every suite.
+Expensive resources, here HTTP clients of a local stub server, are created on
+first use and reused from a pool instead of being set up per suite or test.
+\"\"\"
+import asyncio
+import contextlib
+import functools
+import http.client
+import http.server
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, unquote
+
+from robot.api import logger
+from robot.api.deco import keyword, library
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    \"\"\"Echoes the request path back, standing in for a real service.\"\"\"
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are sent separately; without this, Nagle's algorithm delays every reply.
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        body = unquote(self.path.lstrip("/")).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ClientPool:
+    \"\"\"Keep-alive HTTP clients, created only when all existing ones are busy.\"\"\"
+
+    def __init__(self, host, port, size):
+        self.host, self.port = host, port
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    @contextlib.contextmanager
+    def client(self):
+        with self._slots:
+            try:
+                client = self._idle.get_nowait()
+            except queue.Empty:
+                client = http.client.HTTPConnection(self.host, self.port, timeout=10)
+            try:
+                yield client
+            except BaseException:
+                client.close()
+                raise
+            self._idle.put(client)
+
+    def close(self):
+        while not self._idle.empty():
+            self._idle.get_nowait().close()
+
+
+@library(scope='GLOBAL', version='0.1', auto_keywords=False)
+class MyLibrary:
+    ROBOT_LISTENER_API_VERSION = 3
+    POOL_SIZE = 8
+
+    def __init__(self):
+        # The library listens to itself to release its resources when the run ends.
+        self.ROBOT_LIBRARY_LISTENER = self
+        self._lock = threading.Lock()
+        self._server = self._clients = self._executor = None
+
+    def _resources(self):
+        with self._lock:
+            if self._clients is None:
+                self._server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+                threading.Thread(target=self._server.serve_forever, daemon=True).start()
+                host, port = self._server.server_address[:2]
+                self._clients = ClientPool(host, port, self.POOL_SIZE)
+                self._executor = ThreadPoolExecutor(max_workers=self.POOL_SIZE)
+                logger.info(f"Started stub server and resource pools on port {port}.")
+        return self._clients, self._executor
+
+    def close(self):
+        if self._clients is not None:
+            self._executor.shutdown()
+            self._clients.close()
+            self._server.shutdown()
+            self._server.server_close()
+
+    @keyword('Some Library Keyword')
+    def library_keyword(self):
+        logger.info("This is a keyword from MyLibrary.py")
+        assert True, "This is a simple assertion in MyLibrary.py"
+
+    @keyword
+    def another_library_keyword(self):
+        logger.info("This is another keyword from MyLibrary.py")
+
+    @keyword('Verify ${number} Is Greater Than ${threshold}')
+    def do_some_number_check(self, number: int, threshold: int):
+
+        if not isinstance(number, (int, float)):
+            raise TypeError(f"Invalid type for 'number': expected int or float, got {type(number).__name__}")
+        if not isinstance(threshold, (int, float)):
+            raise TypeError(f"Invalid type for 'threshold': expected int or float, got {type(threshold).__name__}")
+
+        logger.info(f"Checking if {number} is greater than {threshold}")
+        if number <= threshold:
+            raise AssertionError(f"Expected number greater than {threshold}, got {number}")
+        return number
+
+    @keyword
+    def call_stub_service(self, item):
+        \"\"\"Sends ``item`` to the stub service with a pooled client and returns the reply.\"\"\"
+        clients, _ = self._resources()
+        with clients.client() as client:
+            client.request("GET", "/" + quote(item))
+            return client.getresponse().read().decode("utf-8")
+
+    def run_batch(self, callables):
+        \"\"\"Runs ``callables`` concurrently on the shared thread pool and returns their results in order.\"\"\"
+        _, executor = self._resources()
+        futures = [executor.submit(function) for function in callables]
+        return [future.result() for future in futures]
+
+    @keyword
+    def call_stub_service_concurrently(self, *items):
+        \"\"\"Sends every item to the stub service at once and returns the replies in order.\"\"\"
+        return self.run_batch([functools.partial(self.call_stub_service, item) for item in items])
+
+    @keyword
+    async def call_stub_service_async(self, *items):
+        \"\"\"Sends every item to the stub service with non-blocking asyncio streams.\"\"\"
+        clients, _ = self._resources()
+
+        async def call(item):
+            reader, writer = await asyncio.open_connection(clients.host, clients.port)
+            writer.write(f"GET /{quote(item)} HTTP/1.1\\r\\nHost: stub\\r\\nConnection: close\\r\\n\\r\\n".encode())
+            response = await reader.read()
+            writer.close()
+            await writer.wait_closed()
+            return response.split(b"\\r\\n\\r\\n", 1)[1].decode("utf-8")
+
+        return list(await asyncio.gather(*(call(item) for item in items)))
+"""
+
+LIBRARY_PROFILES = {
+    "basic": MY_LIBRARY_CONTENT,
+    "performance": MY_PERFORMANCE_LIBRARY_CONTENT,
+}
+
 # === Resource file content ===
 MY_RESOURCE_CONTENT = """*** Variables ***
 ${SOME_NUMBER}    ${123}
@@ -92,130 +444,3018 @@ Resource Keyword With Some ${argument} Argument
 """
 
 
-@click.command()
-@click.option(
-    "--project-dir",
-    default="robot_project",
-    help="Directory to create the Robot Framework project in.",
-)
-@click.option(
-    "--suite-name",
-    default="MySuite.robot",
-    help="Name of the Robot Framework file to generate.",
-)
-@click.option(
-    "--run", is_flag=True, help="Run the generated Robot Framework test suite."
-)
-@click.option(
-    "--open-log", is_flag=True, help="Open the log file after running the test suite."
-)
-@click.option(
-    "--dry-run", is_flag=True, help="Perform a dry run without creating files."
-)
-@click.option(
-    "--with-lib",
-    is_flag=True,
-    help="Include custom Python library (libraries/MyLibrary.py).",
-)
-@click.option(
-    "--with-resource",
-    is_flag=True,
-    help="Include custom resource file (resources/MyResource.robot).",
-)
-def create_robot_project(
-    suite_name, run, open_log, dry_run, with_lib, with_resource, project_dir
-):
-    """Generates a Robot Framework test suite with optional library and resource."""
-
-    click.echo(f"Creating Robot Framework project in: {project_dir}")
-    if not dry_run:
-        os.makedirs(project_dir, exist_ok=True)
-        os.makedirs(f"{project_dir}/tests", exist_ok=True)
-        click.echo("...Project directory created.")
-
-    # === Settings block based on user flags ===
+def build_settings_block(with_lib, with_resource, depth=1):
+    """Returns the suite settings lines for a suite ``depth`` directories below the project root."""
+    prefix = "../" * depth
     settings = []
     if with_lib:
-        settings.append("Library    ../libraries/MyLibrary.py")
+        settings.append(f"Library    {prefix}libraries/MyLibrary.py")
     if with_resource:
-        settings.append("Resource   ../resources/MyResource.robot")
-    settings_block = "\n".join(settings)
+        settings.append(f"Resource   {prefix}resources/MyResource.robot")
+    return "\n".join(settings)
 
-    # === Assemble test cases and keywords ===
-    test_cases = TEST_CASE_1
 
-    if with_lib:
-        test_cases += TEST_CASE_2
+def render_robot_suite(settings_block, test_cases):
+    """Yields a suite section by section; ``test_cases`` is a string or an iterable of chunks."""
+    yield SETTINGS_SECTION.format(settings_block=settings_block)
+    yield VARIABLES_SECTION
+    yield TEST_CASES_HEADER
+    if isinstance(test_cases, str):
+        yield test_cases
+    else:
+        yield from test_cases
+    yield "\n"
+    yield KEYWORDS_SECTION
+
+
+def write_chunks(path, chunks):
+    """Writes rendered chunks to ``path`` through a buffered handle as they are produced.
+
+    The chunks go to a hidden temporary file next to ``path`` that is then renamed
+    over it, so readers see either the old file or the complete new one.
+    """
+    directory, name = os.path.split(path)
+    temporary = os.path.join(directory, f".{name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    try:
+        with open(temporary, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            f.writelines(chunks)
+        os.replace(temporary, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(temporary)
+        raise
 
+
+def iter_sample_test_cases(with_lib, with_resource, lib_profile="basic"):
+    """Yields the sample test cases matching the enabled options."""
+    yield TEST_CASE_1
+    if with_lib:
+        yield TEST_CASE_2
+        if lib_profile == "performance":
+            yield TEST_CASE_PERFORMANCE
     if with_resource:
-        test_cases += TEST_CASE_3
+        yield TEST_CASE_3
+
+
+def iter_generated_test_cases(count, with_lib, with_resource, lib_profile="basic"):
+    """Yields ``count`` numbered test cases chunk by chunk."""
+    for index in range(1, count + 1):
+        yield GENERATED_TEST_CASE_HEADER.format(index=index)
+        if with_lib:
+            yield GENERATED_LIBRARY_STEPS.format(index=index)
+            if lib_profile == "performance":
+                yield GENERATED_PERFORMANCE_STEPS.format(index=index)
+        if with_resource:
+            yield GENERATED_RESOURCE_STEPS
 
-    # === Fill final content ===
-    robot_content = BASE_ROBOT_TEMPLATE.format(
-        settings_block=settings_block,
-        test_cases=test_cases,
+
+def generated_suite_directories(tests_dir, suites):
+    """Returns the group directories holding ``SUITES_PER_DIRECTORY`` generated suites each."""
+    groups = (suites - 1) // SUITES_PER_DIRECTORY
+    width = len(str(groups))
+    return [os.path.join(tests_dir, f"group_{group:0{width}d}") for group in range(groups + 1)]
+
+
+def iter_generated_suite_paths(tests_dir, suites):
+    """Yields suite file paths spread over group directories of ``SUITES_PER_DIRECTORY`` suites."""
+    width = len(str(suites))
+    directories = generated_suite_directories(tests_dir, suites)
+    for index in range(1, suites + 1):
+        directory = directories[(index - 1) // SUITES_PER_DIRECTORY]
+        yield os.path.join(directory, f"suite_{index:0{width}d}.robot")
+
+
+def write_generated_suites(
+    writer, suites, tests_per_suite, with_lib, with_resource, lib_profile="basic"
+):
+    """Writes the large-scale suite tree, streaming each test case straight to disk."""
+    settings_block = build_settings_block(with_lib, with_resource, depth=2)
+
+    def render():
+        test_cases = iter_generated_test_cases(tests_per_suite, with_lib, with_resource, lib_profile)
+        return render_robot_suite(settings_block, test_cases)
+
+    for robot_path in iter_generated_suite_paths("tests", suites):
+        writer.write(robot_path, render)
+
+
+# Words that Robot reads as control structures or row continuation where it expects a keyword.
+ROBOT_STATEMENT_MARKERS = frozenset([
+    "FOR", "IF", "ELSE", "ELSE IF", "END", "WHILE", "TRY", "EXCEPT", "FINALLY",
+    "RETURN", "BREAK", "CONTINUE", "VAR", "GROUP", "...",
+])
+
+
+def robot_cell(value):
+    """Returns a dataset value escaped as a single Robot Framework data cell."""
+    if value is None:
+        return "${None}"
+    if isinstance(value, bool):
+        return f"${{{value}}}"
+    if isinstance(value, (int, float)):
+        return str(value)
+    if not isinstance(value, str):
+        value = json.dumps(value)
+    if not value:
+        return "${EMPTY}"
+    value = value.replace("\\", "\\\\")
+    value = re.sub(r"([$@&%]){", r"\\\1{", value)
+    value = value.replace("\n", "\\n").replace("\r", "\\r").replace("\t", "\\t")
+    # Two or more spaces separate cells, so escape leading, trailing and repeated spaces.
+    value = re.sub(r"^ | $|(?<= ) ", r"\\ ", value)
+    if value.startswith("#"):
+        value = "\\" + value
+    if re.match(r"[^=\\]+=", value):
+        # Would otherwise be passed as a named argument.
+        value = value.replace("=", "\\=", 1)
+    if value in ROBOT_STATEMENT_MARKERS or re.fullmatch(r"\[.*\]", value):
+        # The first cell of a row sits where Robot expects a keyword; escaping is harmless elsewhere.
+        value = "\\" + value
+    return value
+
+
+def iter_json_array(f, path):
+    """Yields the items of a top-level JSON array without loading the whole array."""
+    decoder = json.JSONDecoder()
+    whitespace = re.compile(r"[\s,]*")
+    buffer, position, exhausted = "", 0, False
+    started = False
+    while True:
+        position = whitespace.match(buffer, position).end()
+        if position < len(buffer):
+            if not started:
+                if buffer[position] != "[":
+                    raise ValueError(f"{path}: expected a JSON array.")
+                started = True
+                position += 1
+                continue
+            if buffer[position] == "]":
+                return
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                end = None
+            # A value running into the end of the buffer may continue in the next read.
+            if end is not None and (end < len(buffer) or exhausted):
+                yield item
+                position = end
+                continue
+        if exhausted:
+            raise ValueError(f"{path}: unexpected end of JSON array.")
+        more = f.read(DATASET_READ_SIZE)
+        exhausted = not more
+        buffer, position = buffer[position:] + more, 0
+
+
+def iter_dataset_rows(path):
+    """Streams the rows of a CSV, JSON or JSON Lines dataset as lists of values.
+
+    CSV files start with a header row. JSON files hold an array and JSON Lines
+    files one value per line; object values are taken in the key order of the
+    first object.
+    """
+    import csv
+
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if extension == ".csv":
+            reader = csv.reader(f)
+            next(reader, None)
+            yield from reader
+            return
+        if extension in (".jsonl", ".ndjson"):
+            items = (json.loads(line) for line in f if line.strip())
+        else:
+            items = iter_json_array(f, path)
+        columns = None
+        for item in items:
+            if isinstance(item, dict):
+                if columns is None:
+                    columns = list(item)
+                yield [item.get(column) for column in columns]
+            elif isinstance(item, list):
+                yield item
+            else:
+                yield [item]
+
+
+def dataset_directory(dataset_path):
+    """Returns the directory, relative to the project, of the suites generated from a dataset."""
+    return os.path.join("tests", os.path.splitext(os.path.basename(dataset_path))[0])
+
+
+def write_dataset_suites(
+    writer,
+    dataset_path,
+    template=DEFAULT_TEMPLATE,
+    with_lib=False,
+    with_resource=False,
+    rows_per_suite=DATASET_ROWS_PER_SUITE,
+    bytes_per_suite=DATASET_BYTES_PER_SUITE,
+):
+    """Writes ``Test Template`` suites from a dataset, one test per row.
+
+    Rows are streamed and only one suite's test cases are held in memory. A new
+    suite is started when ``rows_per_suite`` rows or ``bytes_per_suite`` bytes
+    of test cases are reached. Returns the number of suites and rows written.
+    """
+    directory = dataset_directory(dataset_path)
+    settings_block = "\n".join(
+        filter(None, [build_settings_block(with_lib, with_resource, depth=2), f"Test Template    {template}"])
     )
+    shards = rows = 0
+    test_cases, size = [], 0
 
-    # === Write Robot Framework test suite ===
-    robot_path = os.path.join(project_dir, "tests", suite_name)
-    click.echo(f"Creating Robot Framework test file at: {robot_path}")
-    if not dry_run:
-        with open(robot_path, "w", encoding="utf-8") as f:
-            f.write(robot_content)
-        click.echo(f"...Robot test file created.")
+    def flush():
+        nonlocal shards, test_cases, size
+        shards += 1
+        cases = test_cases
+        writer.write(
+            os.path.join(directory, f"shard_{shards:04d}.robot"),
+            lambda: render_robot_suite(settings_block, cases),
+        )
+        test_cases, size = [], 0
 
-    # === Optional: write additional files ===
-    if with_lib:
-        lib_dir = os.path.join(project_dir, "libraries")
-        click.echo(f"Creating Python library file at: {lib_dir}/MyLibrary.py")
-        if not dry_run:
-            os.makedirs(lib_dir, exist_ok=True)
-            with open(os.path.join(lib_dir, "MyLibrary.py"), "w", encoding="utf-8") as f:
-                f.write(MY_LIBRARY_CONTENT)
-            click.echo("...Python library file created")
+    for row in iter_dataset_rows(dataset_path):
+        rows += 1
+        test_case = "    ".join([f"Row {rows}", *map(robot_cell, row)]) + "\n"
+        test_cases.append(test_case)
+        size += len(test_case.encode("utf-8"))
+        if len(test_cases) >= rows_per_suite or size >= bytes_per_suite:
+            flush()
+    if test_cases:
+        flush()
+    return shards, rows
 
-    if with_resource:
-        resource_dir = os.path.join(project_dir, "resources")
-        click.echo(f"Creating resource file at: {resource_dir}/MyResource.robot")
-        if not dry_run:
-            os.makedirs(resource_dir, exist_ok=True)
-            with open(os.path.join(resource_dir, "MyResource.robot"), "w", encoding="utf-8") as f:
-                f.write(MY_RESOURCE_CONTENT)
-            click.echo(f"...Resource file created")
-
-    if run:
-        results_dir = os.path.join(project_dir, "results")
-        os.makedirs(results_dir, exist_ok=True)
-        click.echo("Running test suite...")
+
+def iter_stress_library(keywords):
+    """Yields a library with ``keywords`` normal and ``keywords`` embedded-argument keywords."""
+    yield STRESS_LIBRARY_HEADER
+    for index in range(1, keywords + 1):
+        yield STRESS_LIBRARY_KEYWORDS.format(index=index)
+
+
+def iter_stress_resource(keywords):
+    """Yields a resource file with ``keywords`` normal and ``keywords`` embedded-argument keywords."""
+    yield "*** Keywords ***"
+    for index in range(1, keywords + 1):
+        yield STRESS_RESOURCE_KEYWORDS.format(index=index)
+
+
+def iter_stress_test_cases(keywords, tests):
+    """Yields ``tests`` test cases calling keywords spread evenly over the stress keywords."""
+    for test in range(tests):
+        yield STRESS_TEST_CASE.format(test=test + 1, index=test * keywords // tests + 1)
+
+
+def write_stress_files(writer, keywords, tests):
+    """Writes the keyword stress library, resource and the suite calling them."""
+    writer.write(
+        os.path.join("libraries", STRESS_LIBRARY_NAME), lambda: iter_stress_library(keywords)
+    )
+    writer.write(
+        os.path.join("resources", STRESS_RESOURCE_NAME), lambda: iter_stress_resource(keywords)
+    )
+    writer.write(
+        os.path.join("tests", STRESS_SUITE_NAME),
+        lambda: render_robot_suite(STRESS_SETTINGS_BLOCK, iter_stress_test_cases(keywords, tests)),
+    )
+
+
+# === Timing instrumentation ===
+class PhaseTimings:
+    """Collects the wall time of named phases for --timings."""
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.phases = []
+        self._started = time.perf_counter()
+
+    @contextlib.contextmanager
+    def phase(self, name, **details):
+        """Times the ``with`` block as one phase, with ``details`` added to its entry."""
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
         try:
-            subprocess.run(
-                [
-                    "robot",
-                    "--outputdir",
-                    results_dir,
-                    "--loglevel",
-                    "TRACE:INFO",
-                    "--pythonpath",
-                    project_dir,
-                    f"{project_dir}/tests",
-                ],
-                check=True,
+            yield
+        finally:
+            seconds = round(time.perf_counter() - started, 6)
+            self.phases.append({"phase": name, **details, "seconds": seconds})
+
+    def as_json(self):
+        """Returns the collected phases and the total wall time as JSON."""
+        total = round(time.perf_counter() - self._started, 6)
+        return json.dumps({"total_seconds": total, "phases": self.phases})
+
+
+NO_TIMINGS = PhaseTimings(enabled=False)
+
+
+# === Writing generated files ===
+MANIFEST_NAME = ".robotgen-manifest.json"
+
+
+class ProjectWriter:
+    """Writes generated files below ``project_dir``, creating directories as needed.
+
+    ``render`` arguments are callables returning a fresh iterable of chunks, so
+    writers that look at the content before writing can render it twice.
+
+    With several ``workers``, ``write`` puts files into a bounded queue drained
+    by a thread pool, so slow network and overlay filesystems write several files
+    at once. Directories are still created by the caller's thread, ideally up
+    front with ``prepare``, so the workers only write files.
+    """
+
+    action = "write"
+
+    def __init__(self, project_dir, workers=1):
+        self.project_dir = project_dir
+        self.workers = workers
+        self.written = 0
+        self._directories = set()
+        self._errors = []
+        self._queue = queue.Queue(maxsize=workers * 4)
+        self._pool = None
+
+    def prepare(self, directories):
+        """Creates ``directories``, relative to ``project_dir``, in one pass."""
+        for directory in directories:
+            self._make_directory(os.path.join(self.project_dir, directory))
+
+    def _make_directory(self, directory):
+        if directory not in self._directories:
+            os.makedirs(directory, exist_ok=True)
+            self._directories.add(directory)
+
+    def write(self, relative_path, render, phase=contextlib.nullcontext):
+        """Writes, or with several workers queues, one file and returns whether it was written.
+
+        ``phase`` returns a context manager wrapped around writing the file, on
+        the worker thread that writes it.
+        """
+        path = os.path.join(self.project_dir, relative_path)
+        self._make_directory(os.path.dirname(path))
+        if self.workers == 1:
+            with phase():
+                self._write_file(relative_path, path, render)
+        elif self._errors:
+            self.flush()
+        else:
+            if self._pool is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                # Threads start with the first file, so writers that fail earlier leave none behind.
+                self._pool = ThreadPoolExecutor(max_workers=self.workers)
+                for _ in range(self.workers):
+                    self._pool.submit(self._drain)
+            self._queue.put((relative_path, path, render, phase))
+        self.written += 1
+        return True
+
+    def _write_file(self, relative_path, path, render):
+        write_chunks(path, render())
+
+    def _drain(self):
+        while (item := self._queue.get()) is not None:
+            # After a failure the rest of the queue is discarded so writers never block.
+            if not self._errors:
+                relative_path, path, render, phase = item
+                try:
+                    with phase():
+                        self._write_file(relative_path, path, render)
+                except BaseException as error:
+                    self._errors.append(error)
+
+    def flush(self):
+        """Waits until queued files are written and raises the first error writing them."""
+        if self._pool:
+            for _ in range(self.workers):
+                self._queue.put(None)
+            self._pool.shutdown()
+            self._pool = None
+        if self._errors:
+            raise self._errors[0]
+
+    def close(self):
+        """Finishes writing and returns a one-line summary."""
+        self.flush()
+        return f"{self.written} files written."
+
+    def abort(self):
+        """Discards the output of a failed generation; files already written are kept."""
+
+
+class DryRunWriter(ProjectWriter):
+    """Renders files without writing anything, so --dry-run still measures rendering."""
+
+    action = "render"
+
+    def __init__(self, project_dir):
+        super().__init__(project_dir)
+        self.rendered = 0
+
+    def prepare(self, directories):
+        pass
+
+    def write(self, relative_path, render):
+        for chunk in render():
+            self.rendered += len(chunk)
+        return False
+
+    def close(self):
+        return f"{self.rendered} characters rendered, nothing written."
+
+
+class _ChunkReader:
+    """A file-like object reading the UTF-8 encoding of rendered chunks."""
+
+    def __init__(self, chunks):
+        self._chunks = (chunk.encode("utf-8") for chunk in chunks)
+        self._buffer = bytearray()
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        size = len(self._buffer) if size < 0 else size
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+
+class ArchiveWriter(ProjectWriter):
+    """Streams generated files into a .tar, .tar.gz, .tgz or .zip archive.
+
+    Nothing is written below ``project_dir``; its base name becomes the archive's
+    top-level directory. Files are streamed one at a time, so memory use does not
+    grow with the project. The archive is built in a hidden temporary file that
+    replaces ``archive_path`` on ``close()``, so a failed generation leaves
+    nothing behind. Timestamps come from ``SOURCE_DATE_EPOCH`` (default 0,
+    or 1980 in zip files), so the same project always gives the same archive.
+    """
+
+    action = "archive"
+
+    def __init__(self, archive_path, project_dir):
+        import gzip
+        import tarfile
+        import zipfile
+
+        super().__init__(project_dir)
+        self.archive_path = archive_path
+        self.root = os.path.basename(os.path.normpath(os.path.abspath(project_dir)))
+        self.mtime = int(os.environ.get("SOURCE_DATE_EPOCH", 0))
+        name = archive_path.lower()
+        if not name.endswith((".zip", ".tar", ".tar.gz", ".tgz")):
+            raise ValueError(f"{archive_path}: archives must end with .zip, .tar, .tar.gz or .tgz.")
+        directory, base = os.path.split(os.path.abspath(archive_path))
+        self._temporary = os.path.join(directory, f".{base}.{os.getpid()}-{threading.get_ident()}.tmp")
+        self._file = open(self._temporary, "wb")
+        self._zip = self._gzip = self._tar = None
+        if name.endswith(".zip"):
+            self._zip = zipfile.ZipFile(self._file, "w", zipfile.ZIP_DEFLATED)
+            # Zip timestamps cannot be earlier than 1980.
+            self._zip_time = time.gmtime(max(self.mtime, 315532800))[:6]
+        else:
+            if name.endswith((".gz", ".tgz")):
+                self._gzip = gzip.GzipFile(
+                    filename="", mode="wb", fileobj=self._file, mtime=self.mtime
+                )
+            self._tar = tarfile.open(
+                fileobj=self._gzip or self._file, mode="w|", format=tarfile.PAX_FORMAT
             )
-        except subprocess.CalledProcessError as e:
-            click.echo(f"Error running Robot Framework test suite: {e}")
-            raise
 
-    if open_log:
-        if not run:
-            click.echo("Run the test suite first to generate log files.")
+    def _tar_info(self, name, kind, mode):
+        import tarfile
+
+        info = tarfile.TarInfo(name)
+        info.type, info.mode, info.mtime = kind, mode, self.mtime
+        return info
+
+    def prepare(self, directories):
+        # Directory entries are added in front of the first file inside them.
+        pass
+
+    def _add_directories(self, directory):
+        import tarfile
+        import zipfile
+
+        if not directory or directory in self._directories:
             return
-        log_path = os.path.abspath(f"{results_dir}/log.html")
-        if os.path.exists(log_path):
-            click.echo(f"Opening log file: {log_path}")
-            webbrowser.open(f"file://{log_path}")
+        self._add_directories(posixpath.dirname(directory))
+        self._directories.add(directory)
+        if self._zip:
+            info = zipfile.ZipInfo(directory + "/", date_time=self._zip_time)
+            info.external_attr = (0o40755 << 16) | 0x10
+            self._zip.writestr(info, b"")
+        else:
+            self._tar.addfile(self._tar_info(directory, tarfile.DIRTYPE, 0o755))
+
+    def write(self, relative_path, render):
+        import tarfile
+        import zipfile
+
+        name = posixpath.join(self.root, relative_path.replace(os.sep, "/"))
+        self._add_directories(posixpath.dirname(name))
+        if self._zip:
+            info = zipfile.ZipInfo(name, date_time=self._zip_time)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o100644 << 16
+            reader = _ChunkReader(render())
+            with self._zip.open(info, "w", force_zip64=True) as f:
+                while block := reader.read(WRITE_BUFFER_SIZE):
+                    f.write(block)
         else:
-            click.echo(f"{log_path} not found!")
+            # Tar headers come first, so render once to measure and once to write.
+            info = self._tar_info(name, tarfile.REGTYPE, 0o644)
+            info.size = sum(len(chunk.encode("utf-8")) for chunk in render())
+            self._tar.addfile(info, _ChunkReader(render()))
+        self.written += 1
+        return True
+
+    def close(self):
+        try:
+            for archive in (self._zip, self._tar, self._gzip):
+                if archive:
+                    archive.close()
+            self._file.close()
+            os.replace(self._temporary, self.archive_path)
+        except BaseException:
+            self.abort()
+            raise
+        return f"{self.written} files archived in: {self.archive_path}"
+
+    def abort(self):
+        # Closing writes trailers into the temporary file, which is removed anyway.
+        for archive in (self._zip, self._tar, self._gzip, self._file):
+            if archive:
+                with contextlib.suppress(Exception):
+                    archive.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self._temporary)
+
+
+def hash_chunks(chunks):
+    """Returns the SHA-256 hex digest of rendered chunks as written to disk."""
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        digest.update(chunk.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load_manifest(manifest_path):
+    """Returns the file entries of a manifest, or an empty dict when there is none."""
+    if not os.path.exists(manifest_path):
+        return {}
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        return json.load(f)["files"]
+
+
+class IncrementalProjectWriter(ProjectWriter):
+    """Writes only files whose rendered content changed since the last generation.
+
+    A file is skipped when its content hash matches the manifest and its size and
+    modification time show it has not been touched since it was written. Files
+    recorded in the previous manifest but not generated this time are removed.
+    """
+
+    def __init__(self, project_dir, workers=1):
+        super().__init__(project_dir, workers)
+        self.manifest_path = os.path.join(project_dir, MANIFEST_NAME)
+        self.previous = load_manifest(self.manifest_path)
+        self.entries = {}
+        self.skipped = 0
+        self.removed = 0
+
+    def write(self, relative_path, render, phase=contextlib.nullcontext):
+        key = relative_path.replace(os.sep, "/")
+        path = os.path.join(self.project_dir, relative_path)
+        sha256 = hash_chunks(render())
+        previous = self.previous.get(key)
+        if previous and previous["sha256"] == sha256 and self._untouched(path, previous):
+            self.entries[key] = previous
+            self.skipped += 1
+            return False
+        self.entries[key] = {"sha256": sha256}
+        return super().write(relative_path, render, phase)
+
+    def _write_file(self, relative_path, path, render):
+        super()._write_file(relative_path, path, render)
+        stat = os.stat(path)
+        self.entries[relative_path.replace(os.sep, "/")].update(
+            size=stat.st_size, mtime_ns=stat.st_mtime_ns
+        )
+
+    @staticmethod
+    def _untouched(path, entry):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return False
+        return stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"]
+
+    def close(self):
+        self.flush()
+        for key in sorted(self.previous.keys() - self.entries.keys()):
+            path = os.path.join(self.project_dir, *key.split("/"))
+            if os.path.exists(path):
+                os.remove(path)
+                self._remove_empty_parents(os.path.dirname(path))
+            self.removed += 1
+        with open(self.manifest_path, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "files": self.entries}, f, indent=1, sort_keys=True)
+        return (
+            f"Manifest: {self.written} written, {self.skipped} skipped, "
+            f"{self.removed} removed."
+        )
+
+    def _remove_empty_parents(self, directory):
+        root = os.path.abspath(self.project_dir)
+        while os.path.abspath(directory) != root and not os.listdir(directory):
+            os.rmdir(directory)
+            directory = os.path.dirname(directory)
+
+
+def robot_options(project_dir, output_dir, profiler=False, lean=False, tests=()):
+    """Returns the Robot Framework options shared by every ``--run`` invocation.
+
+    Keyword arguments come from the ``run_settings`` dict threaded through the
+    run functions. ``profiler`` registers the generated profiling listener,
+    ``lean`` drops TRACE messages and writes only output.xml, and ``tests``
+    selects tests by their full names.
+    """
+    options = {
+        "outputdir": output_dir,
+        "loglevel": "TRACE:INFO",
+        "pythonpath": [project_dir],
+    }
+    if lean:
+        options.update(loglevel="INFO", log="NONE", report="NONE")
+    if tests:
+        # Escape glob characters so that names are matched literally.
+        options["test"] = [re.sub(r"[*?[]", r"[\g<0>]", test) for test in tests]
+    if profiler:
+        listener = os.path.abspath(os.path.join(project_dir, "libraries", PROFILER_FILE_NAME))
+        profile = os.path.abspath(os.path.join(output_dir, PROFILE_CSV_NAME))
+        options["listener"] = [f"{listener}:{profile}"]
+    return options
+
+
+def robot_arguments(project_dir, output_dir, run_settings=None):
+    """Returns ``robot_options`` as command line arguments for the ``robot`` command."""
+    arguments = []
+    for name, value in robot_options(project_dir, output_dir, **(run_settings or {})).items():
+        for item in value if isinstance(value, list) else [value]:
+            arguments.extend([f"--{name}", item])
+    return arguments
+
+
+def run_robot_in_process(project_dir, output_dir, run_settings=None, **options):
+    """Runs the project through ``robot.run`` in this interpreter and returns Robot's exit code.
+
+    ``options`` are passed to ``robot.run`` on top of ``robot_options``.
+    """
+    import robot
+
+    options = {
+        "stdout": sys.stdout,
+        "stderr": sys.stderr,
+        **robot_options(project_dir, output_dir, **(run_settings or {})),
+        **options,
+    }
+    saved_path = list(sys.path)
+    try:
+        return robot.run(f"{project_dir}/tests", **options)
+    finally:
+        # robot.run prepends --pythonpath entries to sys.path and never removes them.
+        sys.path[:] = saved_path
+
+
+def discover_suites(tests_dir):
+    """Returns all suite files below ``tests_dir`` in a stable order."""
+    suites = []
+    for root, dirs, files in os.walk(tests_dir):
+        dirs.sort()
+        suites.extend(
+            os.path.join(root, name) for name in sorted(files) if name.endswith(".robot")
+        )
+    return suites
+
+
+def status_elapsed(status):
+    """Returns the elapsed seconds of an output.xml ``<status>`` element."""
+    from datetime import datetime
+
+    if "elapsed" in status.attrib:
+        return float(status.get("elapsed"))
+    # Robot Framework 6 writes start and end timestamps instead of elapsed time.
+    timestamp_format = "%Y%m%d %H:%M:%S.%f"
+    start = datetime.strptime(status.get("starttime"), timestamp_format)
+    end = datetime.strptime(status.get("endtime"), timestamp_format)
+    return (end - start).total_seconds()
+
+
+def read_suite_durations(output_path):
+    """Returns elapsed seconds of each suite file in a previous output.xml, keyed by path."""
+    from xml.etree.ElementTree import iterparse
+
+    durations = {}
+    for _, element in iterparse(output_path, events=("end",)):
+        if element.tag == "suite":
+            source = element.get("source", "")
+            status = element.find("status")
+            if source.endswith(".robot") and status is not None:
+                durations[os.path.abspath(source)] = status_elapsed(status)
+            element.clear()
+        elif element.tag == "test":
+            element.clear()
+    return durations
+
+
+def schedule_suites(suites, durations, processes):
+    """Assigns suites to at most ``processes`` shards, longest known duration first.
+
+    Suites without history are estimated with the median of the known durations.
+    """
+    import heapq
+    import statistics
+
+    known = [durations[os.path.abspath(suite)] for suite in suites if os.path.abspath(suite) in durations]
+    default = statistics.median(known) if known else 1.0
+
+    def estimate(suite):
+        return durations.get(os.path.abspath(suite), default)
+
+    shards = [[] for _ in range(min(processes, len(suites)))]
+    loads = [(0.0, index) for index in range(len(shards))]
+    for suite in sorted(suites, key=estimate, reverse=True):
+        load, index = heapq.heappop(loads)
+        shards[index].append(suite)
+        heapq.heappush(loads, (load + estimate(suite), index))
+    return shards
+
+
+def run_robot_worker(project_dir, worker_dir, suites, in_process=False, run_settings=None):
+    """Runs one shard of suites into ``worker_dir`` and returns Robot's exit code."""
+    import subprocess
+
+    os.makedirs(worker_dir, exist_ok=True)
+    suites = [os.path.abspath(suite) for suite in suites]
+    with open(os.path.join(worker_dir, "console.txt"), "w", encoding="utf-8") as console:
+        if in_process:
+            return run_robot_in_process(
+                project_dir,
+                worker_dir,
+                run_settings,
+                parseinclude=suites,
+                log="NONE",
+                report="NONE",
+                stdout=console,
+                stderr=console,
+            )
+        # Shards can hold thousands of suites and tests, so pass them through an argument file.
+        argument_file = os.path.join(worker_dir, "arguments.txt")
+        arguments = robot_arguments(project_dir, worker_dir, run_settings)
+        options = list(zip(arguments[::2], arguments[1::2]))
+        with open(argument_file, "w", encoding="utf-8") as f:
+            for name, value in options:
+                if name == "--test":
+                    f.write(f"--test {value}\n")
+            for suite in suites:
+                f.write(f"--parseinclude {suite}\n")
+        completed = subprocess.run(
+            [
+                "robot",
+                *(item for option in options if option[0] != "--test" for item in option),
+                "--log",
+                "NONE",
+                "--report",
+                "NONE",
+                "--argumentfile",
+                argument_file,
+                f"{project_dir}/tests",
+            ],
+            stdout=console,
+            stderr=subprocess.STDOUT,
+        )
+    return completed.returncode
+
+
+def _graft_suites(target, source):
+    """Moves the child suites of ``source`` into the matching suites of ``target``."""
+    for suite in list(source.suites):
+        existing = next((item for item in target.suites if item.name == suite.name), None)
+        if existing is None:
+            target.suites.append(suite)
+        else:
+            _graft_suites(existing, suite)
+    target.suites = sorted(target.suites, key=lambda item: str(item.source))
+    # Workers ran side by side, so the merged suite spans the earliest start to the latest end.
+    if source.start_time and (not target.start_time or source.start_time < target.start_time):
+        target.start_time = source.start_time
+    if source.end_time and (not target.end_time or source.end_time > target.end_time):
+        target.end_time = source.end_time
+    target.elapsed_time = None
+
+
+def merge_outputs(output_paths, merged_path, cached_paths=()):
+    """Combines outputs of suites run in separate workers into one output.xml.
+
+    Tests coming from ``cached_paths`` are tagged with ``CACHED_TAG``. Returns
+    the merged result.
+    """
+    from robot.api import ExecutionResult
+
+    merged = None
+    for path in output_paths:
+        result = ExecutionResult(path)
+        if path in cached_paths:
+            _mark_cached(result.suite)
+        if merged is None:
+            merged = result
+        else:
+            _graft_suites(merged.suite, result.suite)
+            merged.errors.add(result.errors)
+    merged.save(merged_path)
+    return merged
+
+
+def combine_return_codes(return_codes):
+    """Combines worker exit codes the way a single Robot run would report them."""
+    errors = [code for code in return_codes if code > 250]
+    if errors:
+        return max(errors)
+    return min(sum(return_codes), 250)
+
+
+def previous_suite_durations(results_dir, suites):
+    """Returns suite timings from the previous run's output.xml, if there is one."""
+    previous_output = os.path.join(results_dir, "output.xml")
+    if not os.path.exists(previous_output):
+        return {}
+    durations = read_suite_durations(previous_output)
+    known = sum(os.path.abspath(suite) in durations for suite in suites)
+    click.echo(f"Using timings of {known}/{len(suites)} suites from: {previous_output}")
+    return durations
+
+
+def run_shards(project_dir, results_dir, shards, in_process=False, run_settings=None, tests=None):
+    """Runs each shard in its own worker directory and returns exit codes and outputs.
+
+    ``tests`` optionally maps suite files to the tests to select in them, so each
+    worker only gets the tests of the suites in its own shard.
+    """
+    import shutil
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers_dir = os.path.join(results_dir, "workers")
+    shutil.rmtree(workers_dir, ignore_errors=True)
+    worker_dirs = [
+        os.path.join(workers_dir, f"worker_{index:02d}") for index in range(1, len(shards) + 1)
+    ]
+    click.echo(f"Running {sum(map(len, shards))} suites in {len(shards)} worker processes...")
+
+    def run_worker(worker_dir, shard):
+        settings = run_settings
+        if tests is not None:
+            settings = dict(run_settings or {}, tests=[test for suite in shard for test in tests[suite]])
+        return run_robot_worker(project_dir, worker_dir, shard, in_process, settings)
+
+    with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+        return_codes = list(pool.map(run_worker, worker_dirs, shards))
+
+    outputs = []
+    for worker_dir, shard, code in zip(worker_dirs, shards, return_codes):
+        click.echo(f"...{os.path.basename(worker_dir)}: {len(shard)} suites, exit code {code}")
+        output = os.path.join(worker_dir, "output.xml")
+        if os.path.exists(output):
+            outputs.append(output)
+        else:
+            click.echo(f"{output} not found! See {worker_dir}/console.txt")
+    combine_profiles(worker_dirs, results_dir)
+    return return_codes, outputs
+
+
+def render_reports(results_dir, lean=False):
+    """Generates log.html and report.html from results/output.xml with rebot.
+
+    ``lean`` removes the keywords of passed tests from the log.
+    """
+    import subprocess
+
+    output_path = os.path.join(results_dir, "output.xml")
+    if not os.path.exists(output_path):
+        click.echo(f"{output_path} not found!")
+        return
+    subprocess.run(
+        ["rebot", *(LEAN_REBOT_OPTIONS if lean else []), "--outputdir", results_dir, output_path]
+    )
+    click.echo(f"...Log and report written to: {results_dir}")
+
+
+def run_suites_in_parallel(project_dir, results_dir, processes, run_settings=None):
+    """Runs suites across a pool of Robot processes and merges their results with rebot."""
+    suites = discover_suites(os.path.join(project_dir, "tests"))
+    durations = previous_suite_durations(results_dir, suites)
+    shards = schedule_suites(suites, durations, processes)
+    return_codes, outputs = run_shards(project_dir, results_dir, shards, False, run_settings)
+    if outputs:
+        merge_outputs(outputs, os.path.join(results_dir, "output.xml"))
+        if not (run_settings or {}).get("lean"):
+            render_reports(results_dir)
+    return combine_return_codes(return_codes)
+
+
+# === Result cache ===
+CACHE_DIR = ".robotgen-cache"
+CACHED_TAG = "robotgen-cached"
+
+
+def read_settings_imports(path):
+    """Returns the files imported by ``Library`` and ``Resource`` settings of ``path``."""
+    imports = []
+    in_settings = False
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("***"):
+                in_settings = line.strip("* \n").lower().startswith("setting")
+                continue
+            if not in_settings:
+                continue
+            cells = re.split(r"\s{2,}|\t", line.strip())
+            if len(cells) > 1 and cells[0].lower() in ("library", "resource"):
+                if cells[1].endswith((".py", ".robot", ".resource")):
+                    imports.append(
+                        os.path.normpath(os.path.join(os.path.dirname(path), cells[1]))
+                    )
+    return imports
+
+
+def collect_dependencies(suite_path):
+    """Returns every library and resource file a suite imports, following resource imports."""
+    dependencies = set()
+    pending = read_settings_imports(suite_path)
+    while pending:
+        path = pending.pop()
+        if path in dependencies:
+            continue
+        dependencies.add(path)
+        if path.endswith((".robot", ".resource")) and os.path.exists(path):
+            pending.extend(read_settings_imports(path))
+    return sorted(dependencies)
+
+
+def suite_cache_key(project_dir, suite_path, run_settings=None):
+    """Hashes a suite, the files it imports and the Robot options it runs with."""
+    options = {
+        name: value
+        for name, value in robot_options(project_dir, "", **(run_settings or {})).items()
+        if name not in ("outputdir", "pythonpath", "listener")
+    }
+    digest = hashlib.sha256(json.dumps(options, sort_keys=True).encode("utf-8"))
+    suite_dir = os.path.dirname(suite_path)
+    # The suite is keyed by its place in the project, since generated suites share content.
+    names = [os.path.relpath(suite_path, project_dir)]
+    dependencies = collect_dependencies(suite_path)
+    names.extend(os.path.relpath(path, suite_dir) for path in dependencies)
+    for name, path in zip(names, [suite_path, *dependencies]):
+        digest.update(name.encode("utf-8") + b"\0")
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
+def _leaf_suites(suite):
+    if not suite.suites:
+        yield suite
+    for child in suite.suites:
+        yield from _leaf_suites(child)
+
+
+def _mark_cached(suite):
+    for leaf in _leaf_suites(suite):
+        leaf.metadata["Result"] = "Reused from the result cache"
+    for test in suite.all_tests:
+        test.tags.add(CACHED_TAG)
+
+
+def save_suite_fragments(output_path, fragment_paths):
+    """Splits an output.xml into one output file per suite file.
+
+    ``fragment_paths`` maps absolute suite sources to the file their result is
+    saved to. Each fragment keeps the suite's ancestors, so fragments can be
+    merged back into one tree. Returns the fragment paths of suites whose tests
+    did not all pass.
+    """
+    from robot.api import ExecutionResult
+    from robot.result import Result, TestSuite
+
+    result = ExecutionResult(output_path)
+    not_passed = []
+    for leaf in list(_leaf_suites(result.suite)):
+        fragment_path = fragment_paths.get(os.path.abspath(str(leaf.source)))
+        if fragment_path is None:
+            continue
+        if leaf.statistics.passed < leaf.statistics.total:
+            not_passed.append(fragment_path)
+        fragment, parent = leaf, leaf.parent
+        while parent is not None:
+            wrapper = TestSuite(name=parent.name, source=parent.source, doc=parent.doc)
+            wrapper.suites.append(fragment)
+            fragment, parent = wrapper, parent.parent
+        Result(suite=fragment, rpa=result.rpa).save(fragment_path)
+    return not_passed
+
+
+def run_suites_with_cache(
+    project_dir, results_dir, processes, in_process=False, run_settings=None
+):
+    """Runs only suites whose cache key changed and merges them with cached results.
+
+    Results of suites whose tests did not all pass are not cached, so those
+    suites run again next time.
+    """
+    cache_dir = os.path.join(project_dir, CACHE_DIR, "results")
+    os.makedirs(cache_dir, exist_ok=True)
+    suites = discover_suites(os.path.join(project_dir, "tests"))
+    fragments = {
+        os.path.abspath(suite): os.path.join(
+            cache_dir, f"{suite_cache_key(project_dir, suite, run_settings)}.xml"
+        )
+        for suite in suites
+    }
+    dirty = [suite for suite in suites if not os.path.exists(fragments[os.path.abspath(suite)])]
+    click.echo(f"Result cache: {len(suites) - len(dirty)} suites cached, {len(dirty)} to run.")
+
+    return_codes = []
+    uncached = []
+    if dirty:
+        shards = schedule_suites(dirty, previous_suite_durations(results_dir, dirty), processes)
+        return_codes, outputs = run_shards(
+            project_dir, results_dir, shards, in_process, run_settings
+        )
+        for output in outputs:
+            uncached.extend(save_suite_fragments(output, fragments))
+
+    current = set(fragments.values())
+    for name in os.listdir(cache_dir):
+        if os.path.join(cache_dir, name) not in current:
+            os.remove(os.path.join(cache_dir, name))
+
+    dirty = {os.path.abspath(suite) for suite in dirty}
+    outputs = [path for path in fragments.values() if os.path.exists(path)]
+    if not outputs:
+        return combine_return_codes(return_codes)
+    cached = {path for source, path in fragments.items() if source not in dirty}
+    try:
+        merged = merge_outputs(outputs, os.path.join(results_dir, "output.xml"), cached)
+    finally:
+        # Failed results are merged into this run only.
+        for path in uncached:
+            os.remove(path)
+    if not (run_settings or {}).get("lean"):
+        render_reports(results_dir)
+    errors = [code for code in return_codes if code > 250]
+    return combine_return_codes(errors + [merged.statistics.total.failed])
+
+
+def combine_profiles(worker_dirs, results_dir):
+    """Concatenates the profiler CSV files of parallel workers into ``results_dir``."""
+    import shutil
+
+    profiles = [
+        os.path.join(worker_dir, PROFILE_CSV_NAME)
+        for worker_dir in worker_dirs
+        if os.path.exists(os.path.join(worker_dir, PROFILE_CSV_NAME))
+    ]
+    if not profiles:
+        return
+    with open(os.path.join(results_dir, PROFILE_CSV_NAME), "wb") as combined:
+        for profile in profiles:
+            with open(profile, "rb") as f:
+                shutil.copyfileobj(f, combined)
+
+
+def collapse_profile_lines(profile_path, min_microseconds=1):
+    """Aggregates a profiler CSV into collapsed stacks for flame graph tools.
+
+    Yields ``"frame;frame;frame value"`` lines, where the value is the self time
+    of the stack in microseconds.
+    """
+    import csv
+
+    totals = {}
+    with open(profile_path, "r", encoding="utf-8", newline="") as f:
+        for kind, started, elapsed, self_time, stack in csv.reader(f):
+            totals[stack] = totals.get(stack, 0) + int(self_time)
+    for stack, nanoseconds in sorted(totals.items()):
+        if nanoseconds // 1000 >= min_microseconds:
+            yield f"{stack} {nanoseconds // 1000}"
+
+
+# === Suite validation ===
+VALIDATION_CACHE_NAME = "validation.json"
+BDD_PREFIXES = ("given ", "when ", "then ", "and ", "but ")
+
+# Keywords of libraries and resources, cached per process across validated files.
+_library_keywords = {}
+_resource_keywords = {}
+
+
+def _normalize_keyword(name):
+    return name.lower().replace(" ", "").replace("_", "")
+
+
+class KeywordSet:
+    """Keyword names available to a file, with embedded-argument patterns matched like Robot does."""
+
+    def __init__(self):
+        self.names = set()
+        self.embedded = []
+
+    def add(self, name):
+        from robot.running.arguments.embedded import EmbeddedArguments
+
+        embedded = EmbeddedArguments.from_name(name)
+        if embedded:
+            self.embedded.append(embedded)
+        else:
+            self.names.add(_normalize_keyword(name))
+
+    def update(self, other):
+        self.names |= other.names
+        self.embedded.extend(other.embedded)
+
+    def __contains__(self, name):
+        candidates = [name]
+        if name.lower().startswith(BDD_PREFIXES):
+            candidates.append(name.split(" ", 1)[1])
+        # Library or resource prefixes such as ``BuiltIn.Log``.
+        candidates.extend([candidate.rsplit(".", 1)[-1] for candidate in candidates if "." in candidate])
+        return any(
+            _normalize_keyword(candidate) in self.names
+            or any(embedded.matches(candidate) for embedded in self.embedded)
+            for candidate in candidates
+        )
+
+
+def library_keywords(name):
+    """Returns the keywords of a library, or raises ``DataError`` when it cannot be imported."""
+    if name not in _library_keywords:
+        from robot.libdocpkg import LibraryDocumentation
+        from robot.errors import DataError
+
+        if os.path.isfile(name):
+            # Robot reuses a module already imported from the same path, even if the file changed.
+            module_name = os.path.splitext(os.path.basename(name))[0]
+            module_file = getattr(sys.modules.get(module_name), "__file__", None)
+            if module_file and os.path.abspath(module_file) == os.path.abspath(name):
+                del sys.modules[module_name]
+        keywords = KeywordSet()
+        try:
+            for keyword in LibraryDocumentation(name).keywords:
+                keywords.add(keyword.name)
+        except DataError as error:
+            keywords = error
+        _library_keywords[name] = keywords
+    keywords = _library_keywords[name]
+    if isinstance(keywords, Exception):
+        raise keywords
+    return keywords
+
+
+def _import_path(name, directory, project_dir):
+    """Resolves an imported file like Robot: next to the importing file, then on the python path."""
+    for base in (directory, project_dir):
+        path = os.path.normpath(os.path.join(base, name))
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def _collect_keywords(model, path, project_dir, keywords, problems, seen):
+    """Adds the keywords defined in and imported by ``model`` to ``keywords``."""
+    from robot.api.parsing import ModelVisitor
+    from robot.errors import DataError
+
+    directory = os.path.dirname(path)
+
+    class ImportVisitor(ModelVisitor):
+        def visit_Keyword(self, node):
+            keywords.add(node.name)
+
+        def visit_LibraryImport(self, node):
+            name = node.name
+            if not name or "${" in name:
+                return
+            if name.endswith(".py") or "/" in name:
+                resolved = _import_path(name, directory, project_dir)
+                if resolved is None:
+                    problems.append((node.lineno, f"Library '{name}' not found."))
+                    return
+                name = resolved
+            try:
+                keywords.update(library_keywords(name))
+            except DataError as error:
+                problems.append((node.lineno, str(error).splitlines()[0]))
+
+        def visit_ResourceImport(self, node):
+            name = node.name
+            if not name or "${" in name:
+                return
+            resolved = _import_path(name, directory, project_dir)
+            if resolved is None:
+                problems.append((node.lineno, f"Resource file '{name}' not found."))
+                return
+            keywords.update(resource_keywords(resolved, project_dir, seen))
+
+    ImportVisitor().visit(model)
+
+
+def resource_keywords(path, project_dir, seen=None):
+    """Returns the keywords a resource file defines and imports, following nested imports."""
+    if path not in _resource_keywords:
+        from robot.api import get_resource_model
+
+        seen = set() if seen is None else seen
+        keywords = KeywordSet()
+        if path in seen:
+            return keywords
+        seen.add(path)
+        model = get_resource_model(path)
+        # Problems of imported resources are reported when the resource itself is validated.
+        _collect_keywords(model, path, project_dir, keywords, [], seen)
+        _resource_keywords[path] = keywords
+    return _resource_keywords[path]
+
+
+def validate_file(path, project_dir):
+    """Parses a suite or resource file and returns its ``(line, message)`` problems.
+
+    Reports syntax errors, imports that cannot be found and keyword calls that
+    match no keyword of the file, its imports or BuiltIn.
+    """
+    from robot.api import get_model, get_resource_model
+    from robot.api.parsing import ModelVisitor
+
+    if project_dir not in sys.path:
+        sys.path.insert(0, project_dir)
+    is_resource = not os.path.abspath(path).startswith(
+        os.path.join(os.path.abspath(project_dir), "tests", "")
+    )
+    model = get_resource_model(path) if is_resource else get_model(path)
+    problems = []
+    keywords = KeywordSet()
+    keywords.update(library_keywords("BuiltIn"))
+    _collect_keywords(model, path, project_dir, keywords, problems, set())
+
+    class CallVisitor(ModelVisitor):
+        file_template = None
+        test_template = None
+
+        def generic_visit(self, node):
+            for error in getattr(node, "errors", ()):
+                message = " ".join(line.strip() for line in error.splitlines())
+                problems.append((getattr(node, "lineno", 0), message))
+            super().generic_visit(node)
+
+        def check(self, node, name):
+            if name and name.upper() != "NONE" and not re.fullmatch(r"[$&@%]\{.*\}", name):
+                if name not in keywords:
+                    problems.append((node.lineno, f"No keyword with name '{name}' found."))
+
+        def visit_TestTemplate(self, node):
+            self.file_template = node.value
+            self.check(node, node.value)
+
+        def visit_Template(self, node):
+            self.check(node, node.value)
+
+        def visit_TestCase(self, node):
+            templates = [item for item in node.body if type(item).__name__ == "Template"]
+            self.test_template = templates[-1].value if templates else self.file_template
+            self.generic_visit(node)
+            self.test_template = None
+
+        def visit_Keyword(self, node):
+            self.test_template = None
+            self.generic_visit(node)
+
+        def visit_KeywordCall(self, node):
+            # Rows of templated tests are arguments, not keyword calls.
+            if not (self.test_template and self.test_template.upper() != "NONE"):
+                self.check(node, node.keyword)
+            self.generic_visit(node)
+
+        def visit_Fixture(self, node):
+            self.check(node, node.name)
+            self.generic_visit(node)
+
+        visit_Setup = visit_Teardown = visit_Fixture
+        visit_SuiteSetup = visit_SuiteTeardown = visit_Fixture
+        visit_TestSetup = visit_TestTeardown = visit_Fixture
+
+    CallVisitor().visit(model)
+    return sorted(problems)
+
+
+def validation_cache_key(path, file_hashes):
+    """Hashes a file's content and the files it imports, relative to it, with the Robot version."""
+    from robot.version import VERSION
+
+    def file_hash(file_path):
+        if file_path not in file_hashes:
+            try:
+                with open(file_path, "rb") as f:
+                    file_hashes[file_path] = hashlib.sha256(f.read()).hexdigest()
+            except FileNotFoundError:
+                file_hashes[file_path] = "missing"
+        return file_hashes[file_path]
+
+    digest = hashlib.sha256(VERSION.encode("utf-8") + b"\0" + file_hash(path).encode("utf-8"))
+    directory = os.path.dirname(path)
+    for dependency in collect_dependencies(path):
+        digest.update(os.path.relpath(dependency, directory).encode("utf-8") + b"\0")
+        digest.update(file_hash(dependency).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def discover_validation_files(project_dir):
+    """Returns the suites under tests/ and the resource files under resources/."""
+    files = discover_suites(os.path.join(project_dir, "tests"))
+    for root, dirs, names in os.walk(os.path.join(project_dir, "resources")):
+        dirs.sort()
+        files.extend(
+            os.path.join(root, name) for name in sorted(names) if name.endswith((".robot", ".resource"))
+        )
+    return files
+
+
+def validate_project(project_dir, workers=None):
+    """Validates every suite and resource, reusing results cached by content hash.
+
+    Identical files share one cache entry, so only distinct, changed content is
+    parsed. Uncached files are parsed in parallel processes. Returns the problems
+    per file, the number of files parsed and the number of files validated.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    cache_path = os.path.join(project_dir, CACHE_DIR, VALIDATION_CACHE_NAME)
+    cached = {}
+    if os.path.exists(cache_path):
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)["files"]
+    # Libraries and resources may have been regenerated since the last call in this process.
+    _library_keywords.clear()
+    _resource_keywords.clear()
+    file_hashes = {}
+    keys = {path: validation_cache_key(path, file_hashes) for path in discover_validation_files(project_dir)}
+    pending = {}
+    for path, key in keys.items():
+        if key not in cached:
+            pending.setdefault(key, path)
+    project_root = os.path.abspath(project_dir)
+    paths = list(pending.values())
+    if len(paths) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(paths) // ((workers or os.cpu_count() or 1) * 4))
+            results = list(
+                executor.map(validate_file, paths, [project_root] * len(paths), chunksize=chunksize)
+            )
+    else:
+        results = [validate_file(path, project_root) for path in paths]
+    cached.update(zip(pending, ([list(problem) for problem in result] for result in results)))
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    with open(cache_path, "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "files": {key: cached[key] for key in set(keys.values())}}, f)
+    problems = {path: cached[key] for path, key in keys.items() if cached[key]}
+    return problems, len(pending), len(keys)
+
+
+def report_validation(project_dir, workers=None):
+    """Validates the project, prints its problems and raises ``ClickException`` if there are any."""
+    problems, parsed, total = validate_project(project_dir, workers)
+    for path, file_problems in problems.items():
+        for line, message in file_problems:
+            click.echo(f"{path}:{line}: {message}")
+    count = sum(len(file_problems) for file_problems in problems.values())
+    click.echo(
+        f"Validated {total} files, {parsed} parsed and {total - parsed} reused by content hash:"
+        f" {count} problems."
+    )
+    if count:
+        raise click.ClickException(f"Validation found {count} problems in {len(problems)} files.")
+
+
+# === Streaming output.xml analysis ===
+def _keyword_name(element):
+    """Returns a keyword's definition name, so embedded argument calls are grouped together."""
+    name = element.get("source_name") or element.get("sourcename") or element.get("name", "")
+    owner = element.get("owner") or element.get("library")
+    return f"{owner}.{name}" if owner else name
+
+
+def iter_output_elements(output_path):
+    """Stream-parses an output.xml and yields its finished suites, tests and keywords.
+
+    Yields ``(tag, element, name, test)`` tuples where ``name`` is the full name
+    of a suite or test and ``test`` the full name of the enclosing test. Each
+    element is cleared when the consumer moves on, so memory use stays bounded
+    on outputs of any size.
+    """
+    from xml.etree.ElementTree import iterparse
+
+    suite_names = []
+    current_test = None
+    for event, element in iterparse(output_path, events=("start", "end")):
+        tag = element.tag
+        if event == "start":
+            if tag == "suite":
+                suite_names.append(element.get("name", ""))
+            elif tag == "test":
+                current_test = ".".join([*suite_names, element.get("name", "")])
+            elif tag == "statistics":
+                # Statistics and errors follow the results and reuse the <suite> tag.
+                return
+        elif tag == "kw":
+            yield tag, element, element.get("name", ""), current_test
+            element.clear()
+        elif tag == "test":
+            yield tag, element, current_test, current_test
+            current_test = None
+            element.clear()
+        elif tag == "suite":
+            yield tag, element, ".".join(suite_names), None
+            suite_names.pop()
+            element.clear()
+
+
+def analyze_output(output_path, top=10):
+    """Stream-parses an output.xml and returns timing and status statistics.
+
+    Keywords, tests and suites are cleared as soon as they have been counted,
+    so memory use stays bounded on outputs of any size.
+    """
+    import heapq
+
+    test_statuses = {}
+    keyword_statuses = {}
+    keyword_totals = {}
+    slowest_tests = []
+    slowest_keywords = []
+    tiebreaker = itertools.count()
+
+    def keep_slowest(heap, elapsed, entry):
+        item = (elapsed, next(tiebreaker), entry)
+        if len(heap) < top:
+            heapq.heappush(heap, item)
+        elif elapsed > heap[0][0]:
+            heapq.heapreplace(heap, item)
+
+    for tag, element, name, test in iter_output_elements(output_path):
+        if tag == "kw":
+            status = element.find("status")
+            result, elapsed = status.get("status"), status_elapsed(status)
+            keyword = _keyword_name(element)
+            keyword_statuses[result] = keyword_statuses.get(result, 0) + 1
+            totals = keyword_totals.setdefault(keyword, [0, 0.0, 0.0])
+            totals[0] += 1
+            totals[1] += elapsed
+            if elapsed > totals[2]:
+                totals[2] = elapsed
+            if len(slowest_keywords) < top or elapsed > slowest_keywords[0][0]:
+                keep_slowest(
+                    slowest_keywords,
+                    elapsed,
+                    {
+                        "name": name,
+                        "keyword": keyword,
+                        "test": test,
+                        "status": result,
+                        "elapsed": elapsed,
+                    },
+                )
+        elif tag == "test":
+            status = element.find("status")
+            result, elapsed = status.get("status"), status_elapsed(status)
+            test_statuses[result] = test_statuses.get(result, 0) + 1
+            keep_slowest(
+                slowest_tests,
+                elapsed,
+                {"name": name, "status": result, "elapsed": elapsed},
+            )
+
+    def by_elapsed(heap):
+        return [entry for _, _, entry in sorted(heap, key=lambda item: item[0], reverse=True)]
+
+    return {
+        "tests": {"total": sum(test_statuses.values()), "statuses": test_statuses},
+        "keywords": {"total": sum(keyword_statuses.values()), "statuses": keyword_statuses},
+        "slowest_tests": by_elapsed(slowest_tests),
+        "slowest_keywords": by_elapsed(slowest_keywords),
+        "keyword_totals": [
+            {
+                "keyword": name,
+                "calls": calls,
+                "total": round(total, 6),
+                "average": round(total / calls, 6),
+                "max": longest,
+            }
+            for name, (calls, total, longest) in sorted(
+                keyword_totals.items(), key=lambda item: item[1][1], reverse=True
+            )
+        ],
+    }
+
+
+def format_analysis(report, top=10):
+    """Returns the analysis report as terminal table lines."""
+
+    def counts(section):
+        statuses = ", ".join(f"{count} {status}" for status, count in sorted(section["statuses"].items()))
+        return f"{section['total']} ({statuses})" if statuses else "0"
+
+    lines = [
+        f"Tests: {counts(report['tests'])}",
+        f"Keywords: {counts(report['keywords'])}",
+        "",
+        "Slowest tests:",
+        f"  {'Seconds':>10}  {'Status':<6}  Test",
+    ]
+    lines.extend(
+        f"  {test['elapsed']:>10.3f}  {test['status']:<6}  {test['name']}"
+        for test in report["slowest_tests"][:top]
+    )
+    lines.extend(["", "Slowest keyword calls:", f"  {'Seconds':>10}  {'Status':<6}  Keyword"])
+    lines.extend(
+        f"  {keyword['elapsed']:>10.3f}  {keyword['status']:<6}  {keyword['name']}"
+        for keyword in report["slowest_keywords"][:top]
+    )
+    lines.extend(
+        ["", "Total time per keyword:", f"  {'Seconds':>10}  {'Calls':>8}  {'Average':>10}  Keyword"]
+    )
+    lines.extend(
+        f"  {keyword['total']:>10.3f}  {keyword['calls']:>8}  {keyword['average']:>10.4f}  {keyword['keyword']}"
+        for keyword in report["keyword_totals"][:top]
+    )
+    return lines
+
+
+def report_analysis(output_path, json_path=None, top=10):
+    """Analyzes an output.xml and prints the tables, optionally saving the JSON report."""
+    if not os.path.exists(output_path):
+        click.echo(f"{output_path} not found!")
+        return
+    click.echo(f"Analyzing: {output_path}")
+    report = analyze_output(output_path, top)
+    for line in format_analysis(report, top):
+        click.echo(line)
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        click.echo(f"Analysis written to: {json_path}")
+
+
+# === Run history database ===
+HISTORY_BATCH_SIZE = 5000
+
+HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started TEXT NOT NULL,
+    project_dir TEXT,
+    output TEXT
+);
+CREATE TABLE IF NOT EXISTS suites (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    name TEXT NOT NULL,
+    status TEXT,
+    elapsed REAL
+);
+CREATE TABLE IF NOT EXISTS tests (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    name TEXT NOT NULL,
+    status TEXT,
+    elapsed REAL
+);
+CREATE TABLE IF NOT EXISTS keywords (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    name TEXT NOT NULL,
+    calls INTEGER,
+    failures INTEGER,
+    total REAL,
+    max REAL
+);
+CREATE INDEX IF NOT EXISTS runs_started ON runs(started);
+CREATE INDEX IF NOT EXISTS suites_name ON suites(name, run_id);
+CREATE INDEX IF NOT EXISTS tests_name ON tests(name, run_id);
+CREATE INDEX IF NOT EXISTS keywords_name ON keywords(name, run_id);
+"""
+
+# Compares each test's latest duration with the mean of its previous runs.
+REGRESSION_QUERY = """
+SELECT name, started, elapsed, baseline, samples
+FROM (
+    SELECT
+        tests.name,
+        runs.started,
+        tests.elapsed,
+        AVG(tests.elapsed) OVER history AS baseline,
+        COUNT(tests.elapsed) OVER history AS samples,
+        ROW_NUMBER() OVER (
+            PARTITION BY tests.name ORDER BY runs.started DESC, runs.id DESC
+        ) AS age
+    FROM tests JOIN runs ON runs.id = tests.run_id
+    WINDOW history AS (
+        PARTITION BY tests.name ORDER BY runs.started DESC, runs.id DESC
+        ROWS BETWEEN 1 FOLLOWING AND ? FOLLOWING
+    )
+)
+WHERE age = 1 AND samples > 0 AND elapsed > baseline * (1 + ? / 100.0)
+ORDER BY elapsed - baseline DESC
+"""
+
+
+def open_history(db_path):
+    """Opens the run history database, creating the tables and indexes if needed."""
+    import sqlite3
+
+    connection = sqlite3.connect(db_path)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(HISTORY_SCHEMA)
+    return connection
+
+
+def status_started(status):
+    """Returns the start time of an output.xml ``<status>`` element in ISO format."""
+    from datetime import datetime
+
+    if "starttime" in status.attrib:
+        # Robot Framework 6 timestamp format.
+        return datetime.strptime(status.get("starttime"), "%Y%m%d %H:%M:%S.%f").isoformat()
+    return status.get("start")
+
+
+def ingest_output(db_path, output_path, project_dir=None):
+    """Streams an output.xml into the run history database and returns the new run id.
+
+    Suites and tests are inserted in batches of ``HISTORY_BATCH_SIZE`` rows and
+    keywords are stored as per-run totals, all in a single transaction.
+    """
+    from datetime import datetime
+
+    connection = open_history(db_path)
+    try:
+        with connection:
+            run_id = connection.execute(
+                "INSERT INTO runs (started, project_dir, output) VALUES (?, ?, ?)",
+                (datetime.now().isoformat(), project_dir, os.path.abspath(output_path)),
+            ).lastrowid
+            batches = {"suites": [], "tests": []}
+            keyword_totals = {}
+            started = None
+
+            def flush(table):
+                connection.executemany(
+                    f"INSERT INTO {table} (run_id, name, status, elapsed) VALUES (?, ?, ?, ?)",
+                    batches[table],
+                )
+                batches[table].clear()
+
+            for tag, element, name, test in iter_output_elements(output_path):
+                status = element.find("status")
+                result, elapsed = status.get("status"), status_elapsed(status)
+                if tag == "kw":
+                    totals = keyword_totals.setdefault(_keyword_name(element), [0, 0, 0.0, 0.0])
+                    totals[0] += 1
+                    totals[1] += result == "FAIL"
+                    totals[2] += elapsed
+                    if elapsed > totals[3]:
+                        totals[3] = elapsed
+                    continue
+                table = "tests" if tag == "test" else "suites"
+                batches[table].append((run_id, name, result, elapsed))
+                if len(batches[table]) >= HISTORY_BATCH_SIZE:
+                    flush(table)
+                if tag == "suite":
+                    # The top-level suite ends last, so its start is the run's start.
+                    started = status_started(status)
+            for table in batches:
+                flush(table)
+            connection.executemany(
+                "INSERT INTO keywords (run_id, name, calls, failures, total, max)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                ((run_id, name, *totals) for name, totals in keyword_totals.items()),
+            )
+            if started:
+                connection.execute("UPDATE runs SET started = ? WHERE id = ?", (started, run_id))
+    finally:
+        connection.close()
+    return run_id
+
+
+def find_regressions(db_path, threshold=20.0, baseline_runs=5):
+    """Returns tests whose latest duration exceeds their rolling baseline by ``threshold`` percent.
+
+    The baseline is the mean duration of the test's previous ``baseline_runs`` runs.
+    """
+    connection = open_history(db_path)
+    try:
+        rows = connection.execute(REGRESSION_QUERY, (baseline_runs, threshold)).fetchall()
+    finally:
+        connection.close()
+    return [
+        {
+            "name": name,
+            "started": started,
+            "elapsed": elapsed,
+            "baseline": baseline,
+            "samples": samples,
+            "change": (elapsed - baseline) / baseline * 100 if baseline else float("inf"),
+        }
+        for name, started, elapsed, baseline, samples in rows
+    ]
+
+
+def record_history(db_path, output_path, project_dir):
+    """Adds an output.xml to the run history database and prints the run id."""
+    if not os.path.exists(output_path):
+        click.echo(f"{output_path} not found!")
+        return
+    run_id = ingest_output(db_path, output_path, project_dir)
+    click.echo(f"Run {run_id} recorded in: {db_path}")
+
+
+def report_regressions(db_path, threshold=20.0, baseline_runs=5):
+    """Prints the tests that regressed against the mean of their previous runs."""
+    regressions = find_regressions(db_path, threshold, baseline_runs)
+    if not regressions:
+        click.echo(f"No tests regressed more than {threshold:g}%.")
+        return
+    click.echo(
+        f"Tests {threshold:g}% slower than the mean of their previous {baseline_runs} runs:"
+    )
+    for regression in regressions:
+        click.echo(
+            f"  {regression['change']:+8.1f}%  {regression['elapsed']:9.3f}s"
+            f"  (baseline {regression['baseline']:.3f}s over {regression['samples']} runs)"
+            f"  {regression['name']}"
+        )
+
+
+# === Rerun failed tests ===
+def read_failed_tests(output_path):
+    """Stream-parses an output.xml and returns the failed tests of each suite file.
+
+    Returns ``{suite source: (suite elapsed seconds, [failed test full names])}``
+    for suites with at least one failed test.
+    """
+    failed = {}
+    suite_failures = []
+    for tag, element, name, test in iter_output_elements(output_path):
+        if tag == "test":
+            if element.find("status").get("status") == "FAIL":
+                suite_failures.append(name)
+        elif tag == "suite" and suite_failures:
+            # Tests live in leaf suites, so all pending failures belong to this suite.
+            elapsed = status_elapsed(element.find("status"))
+            failed[os.path.abspath(element.get("source"))] = (elapsed, suite_failures)
+            suite_failures = []
+    return failed
+
+
+def merge_rerun(results_dir, rerun_output, lean=False):
+    """Merges rerun results into results/output.xml with ``rebot --merge``."""
+    import subprocess
+
+    output_path = os.path.join(results_dir, "output.xml")
+    reports = ["--log", "NONE", "--report", "NONE"] if lean else []
+    subprocess.run(
+        [
+            "rebot",
+            "--merge",
+            *reports,
+            "--outputdir",
+            results_dir,
+            "--output",
+            "output.xml",
+            output_path,
+            rerun_output,
+        ],
+        stdout=subprocess.DEVNULL,
+    )
+    click.echo(f"...Rerun results merged into: {output_path}")
+
+
+def rerun_failed_tests(
+    project_dir, processes=1, in_process=False, timings=NO_TIMINGS, run_settings=None
+):
+    """Runs only the tests that failed in results/output.xml and merges the new results.
+
+    Only the suite files with failures are parsed, so the cost scales with the
+    number of failures. Raises ``CalledProcessError`` when tests still fail.
+    """
+    import shutil
+    import subprocess
+
+    results_dir = os.path.join(project_dir, "results")
+    output_path = os.path.join(results_dir, "output.xml")
+    if not os.path.exists(output_path):
+        raise click.ClickException(f"{output_path} not found! Run the test suite first.")
+    with timings.phase("read failures"):
+        failed = read_failed_tests(output_path)
+    if not failed:
+        click.echo(f"No failed tests in: {output_path}")
+        return
+    tests = {source: suite_tests for source, (_, suite_tests) in failed.items()}
+    click.echo(f"Rerunning {sum(map(len, tests.values()))} failed tests from {len(failed)} suites...")
+    rerun_dir = os.path.join(results_dir, "rerun")
+    shutil.rmtree(rerun_dir, ignore_errors=True)
+    durations = {source: elapsed for source, (elapsed, _) in failed.items()}
+    shards = schedule_suites(list(failed), durations, min(processes, len(failed)))
+    with timings.phase("robot rerun"):
+        return_codes, outputs = run_shards(
+            project_dir, rerun_dir, shards, in_process, run_settings, tests
+        )
+    if not outputs:
+        raise subprocess.CalledProcessError(combine_return_codes(return_codes), "robot")
+    rerun_output = os.path.join(rerun_dir, "output.xml")
+    with timings.phase("merge"):
+        merge_outputs(outputs, rerun_output)
+        merge_rerun(results_dir, rerun_output, (run_settings or {}).get("lean"))
+    return_code = combine_return_codes(return_codes)
+    if return_code:
+        click.echo(f"{return_code} tests still failing after the rerun.")
+        raise subprocess.CalledProcessError(return_code, "robot")
+
+
+# === Warm runner daemon ===
+@contextlib.contextmanager
+def isolated_request(cwd, project_dir):
+    """Restores process state changed while serving one daemon request.
+
+    Modules imported from the project directory are dropped afterwards, so a
+    regenerated ``libraries/MyLibrary.py`` is imported again on the next run.
+    """
+    saved_cwd = os.getcwd()
+    saved_path = list(sys.path)
+    saved_modules = set(sys.modules)
+    os.chdir(cwd)
+    project_root = os.path.join(os.path.abspath(project_dir), "")
+    try:
+        yield
+    finally:
+        os.chdir(saved_cwd)
+        sys.path[:] = saved_path
+        for name in set(sys.modules) - saved_modules:
+            module_file = getattr(sys.modules[name], "__file__", None) or ""
+            if os.path.abspath(module_file).startswith(project_root):
+                del sys.modules[name]
+        importlib.invalidate_caches()
+
+
+def handle_daemon_request(request):
+    """Runs one forwarded command in this process and returns its exit code and output."""
+    import traceback
+
+    params = request["params"]
+    output = io.StringIO()
+    with isolated_request(request["cwd"], params["project_dir"]):
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            try:
+                command = command_line()
+                with command.make_context("robot_generator.py", []) as ctx:
+                    ctx.invoke(command, **params)
+                exit_code = 0
+            except click.exceptions.Exit as e:
+                exit_code = e.exit_code
+            except click.ClickException as e:
+                e.show()
+                exit_code = e.exit_code
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+    return {"exit_code": exit_code, "output": output.getvalue()}
+
+
+def warm_up_robot():
+    """Imports Robot's runner and BuiltIn library now, so the first in-process run starts fast."""
+    for module in ("robot.running", "robot.libraries.BuiltIn"):
+        importlib.import_module(module)
+
+
+def remove_stale_socket(socket_path):
+    """Removes a socket left behind by a daemon that is no longer running.
+
+    Raises ``ClickException`` when the path is not a socket or a daemon still
+    accepts connections on it, so neither is ever deleted.
+    """
+    import socket
+    import stat
+
+    try:
+        mode = os.stat(socket_path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise click.ClickException(f"{socket_path} exists and is not a socket.")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(socket_path)
+        except ConnectionRefusedError:
+            os.unlink(socket_path)
+            return
+    raise click.ClickException(f"A daemon is already serving on: {socket_path}")
+
+
+def serve_daemon(socket_path):
+    """Serves generate-and-run requests over a Unix socket, one at a time, with Robot kept warm."""
+    import socketserver
+
+    remove_stale_socket(socket_path)
+    warm_up_robot()
+
+    class RequestHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            request = json.loads(self.rfile.readline())
+            response = handle_daemon_request(request)
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+    click.echo(f"Serving robot_generator requests on: {socket_path}")
+    try:
+        with socketserver.UnixStreamServer(socket_path, RequestHandler) as server:
+            server.serve_forever()
+    finally:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def send_daemon_request(socket_path, params):
+    """Forwards command parameters to a running daemon and returns its response."""
+    import socket
+
+    request = {"cwd": os.getcwd(), "params": params}
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+            client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with client.makefile("rb") as response:
+                return json.loads(response.readline())
+    except OSError as e:
+        raise click.ClickException(f"Cannot reach daemon at {socket_path}: {e}")
+
+
+# === Generating, running and opening a project ===
+def emit_file(writer, relative_path, render, label, timings=NO_TIMINGS, echo=None):
+    """Writes one file through ``writer``, timing it and reporting the outcome.
+
+    With several write workers the file is only queued here, so the writer times
+    it on the worker thread that writes it.
+    """
+    echo = echo or click.echo
+    phase = functools.partial(timings.phase, writer.action, path=relative_path.replace(os.sep, "/"))
+    if writer.workers == 1:
+        with phase():
+            written = writer.write(relative_path, render)
+    else:
+        written = writer.write(relative_path, render, phase)
+    if writer.action == "write":
+        echo(f"...{label} {'created' if written else 'unchanged'}.")
+
+
+def generate_project(
+    project_dir,
+    suite_name="MySuite.robot",
+    dry_run=False,
+    with_lib=False,
+    with_resource=False,
+    lib_profile="basic",
+    suites=None,
+    tests_per_suite=10,
+    incremental=False,
+    with_profiler=False,
+    dataset=None,
+    template=DEFAULT_TEMPLATE,
+    rows_per_suite=DATASET_ROWS_PER_SUITE,
+    bytes_per_suite=DATASET_BYTES_PER_SUITE,
+    keywords=None,
+    archive=None,
+    write_workers=DEFAULT_WRITE_WORKERS,
+    timings=NO_TIMINGS,
+    echo=None,
+):
+    """Writes the project files, or with ``dry_run`` only renders them.
+
+    Files are written by ``write_workers`` threads. Progress messages go to
+    ``echo``, by default ``click.echo``. Returns the closed writer, whose
+    counters tell how many files were written.
+    """
+    echo = echo or click.echo
+    if lib_profile not in LIBRARY_PROFILES:
+        raise ValueError(
+            f"Unknown library profile '{lib_profile}', expected one of: {', '.join(LIBRARY_PROFILES)}"
+        )
+    echo(f"Creating Robot Framework project in: {archive or project_dir}")
+    if dry_run:
+        writer = DryRunWriter(project_dir)
+    elif archive:
+        writer = ArchiveWriter(archive, project_dir)
+    else:
+        writer_class = IncrementalProjectWriter if incremental else ProjectWriter
+        writer = writer_class(project_dir, write_workers)
+        with timings.phase("create directories"):
+            writer.prepare(
+                project_directories(with_lib, with_resource, suites, dataset, keywords, with_profiler)
+            )
+        echo("...Project directory created.")
+
+    # Queued files are only reported as created once flush() has written them.
+    reports = []
+    file_echo = echo if writer.workers == 1 else reports.append
+    try:
+        if suites:
+            # === Large-scale mode: nested suite tree written case by case ===
+            tests_dir = os.path.join(project_dir, "tests")
+            echo(
+                f"Creating {suites} test suites with {tests_per_suite} test cases each under: {tests_dir}"
+            )
+            # Suites are timed as one phase; an entry per file would dwarf the output.
+            with timings.phase(f"{writer.action} suites", files=suites):
+                write_generated_suites(
+                    writer, suites, tests_per_suite, with_lib, with_resource, lib_profile
+                )
+            if not dry_run:
+                echo(f"...{suites * tests_per_suite} test cases created.")
+        else:
+            # === Settings block based on user flags ===
+            settings_block = build_settings_block(with_lib, with_resource)
+
+            # === Write Robot Framework test suite, section by section ===
+            def render_suite():
+                test_cases = iter_sample_test_cases(with_lib, with_resource, lib_profile)
+                return render_robot_suite(settings_block, test_cases)
+
+            robot_path = os.path.join(project_dir, "tests", suite_name)
+            echo(f"Creating Robot Framework test file at: {robot_path}")
+            emit_file(
+                writer,
+                os.path.join("tests", suite_name),
+                render_suite,
+                "Robot test file",
+                timings,
+                file_echo,
+            )
+
+        if dataset:
+            # === Data-driven mode: dataset rows sharded into Test Template suites ===
+            echo(f"Creating data-driven suites from: {dataset}")
+            with timings.phase(f"{writer.action} dataset suites"):
+                shards, rows = write_dataset_suites(
+                    writer, dataset, template, with_lib, with_resource, rows_per_suite, bytes_per_suite
+                )
+            echo(f"...{rows} rows written as {shards} suites using '{template}'.")
+
+        if keywords:
+            # === Keyword resolution stress mode ===
+            echo(f"Creating {2 * keywords} library and {2 * keywords} resource keywords for stress testing.")
+            with timings.phase(f"{writer.action} keyword stress files", keywords=keywords):
+                write_stress_files(writer, keywords, tests_per_suite)
+            echo(f"...{STRESS_SUITE_NAME} calls them from {tests_per_suite} test cases.")
+
+        # === Optional: write additional files ===
+        if with_lib:
+            lib_dir = os.path.join(project_dir, "libraries")
+            echo(f"Creating Python library file at: {lib_dir}/MyLibrary.py")
+            emit_file(
+                writer,
+                os.path.join("libraries", "MyLibrary.py"),
+                lambda: [LIBRARY_PROFILES[lib_profile]],
+                "Python library file",
+                timings,
+                file_echo,
+            )
+
+        if with_resource:
+            resource_dir = os.path.join(project_dir, "resources")
+            echo(f"Creating resource file at: {resource_dir}/MyResource.robot")
+            emit_file(
+                writer,
+                os.path.join("resources", "MyResource.robot"),
+                lambda: [MY_RESOURCE_CONTENT],
+                "Resource file",
+                timings,
+                file_echo,
+            )
+
+        if with_profiler:
+            lib_dir = os.path.join(project_dir, "libraries")
+            echo(f"Creating profiling listener at: {lib_dir}/{PROFILER_FILE_NAME}")
+            emit_file(
+                writer,
+                os.path.join("libraries", PROFILER_FILE_NAME),
+                lambda: [PROFILER_LISTENER_CONTENT],
+                "Profiling listener",
+                timings,
+                file_echo,
+            )
+    except BaseException:
+        writer.abort()
+        raise
+    finally:
+        # Let queued writes finish even when rendering failed, so no thread is left blocked.
+        with timings.phase("finish write") if writer.workers > 1 else contextlib.nullcontext():
+            writer.flush()
+    for message in reports:
+        echo(message)
+    echo(writer.close())
+    return writer
+
+
+def generate(project_dir="robot_project", quiet=False, **options):
+    """Generates a project from Python, without click.
+
+    ``options`` are the ``generate_project`` keyword arguments, named like the
+    command line options, e.g. ``generate("out", with_lib=True, suites=100)``.
+    Progress messages are printed unless ``quiet``. Returns the closed writer.
+    Invalid datasets, archive names and options raise ``ValueError``.
+    """
+    echo = (lambda message: None) if quiet else print
+    return generate_project(project_dir, echo=echo, **options)
+
+
+def project_directories(
+    with_lib=False, with_resource=False, suites=None, dataset=None, keywords=None, with_profiler=False
+):
+    """Returns the directories of the generated files, relative to the project directory."""
+    directories = ["tests"]
+    if suites:
+        directories.extend(generated_suite_directories("tests", suites))
+    if dataset:
+        directories.append(dataset_directory(dataset))
+    if with_lib or with_profiler or keywords:
+        directories.append("libraries")
+    if with_resource or keywords:
+        directories.append("resources")
+    return directories
+
+
+def run_project(
+    project_dir,
+    processes=1,
+    in_process=False,
+    cache=False,
+    timings=NO_TIMINGS,
+    run_settings=None,
+):
+    """Runs the generated suites and raises ``CalledProcessError`` when Robot fails.
+
+    ``run_settings`` are keyword arguments for ``robot_options``.
+    """
+    import subprocess
+
+    results_dir = os.path.join(project_dir, "results")
+    os.makedirs(results_dir, exist_ok=True)
+    click.echo("Running test suite...")
+    try:
+        with timings.phase("robot run"):
+            if cache:
+                return_code = run_suites_with_cache(
+                    project_dir, results_dir, processes, in_process, run_settings
+                )
+            elif processes > 1:
+                return_code = run_suites_in_parallel(
+                    project_dir, results_dir, processes, run_settings
+                )
+            elif in_process:
+                return_code = run_robot_in_process(project_dir, results_dir, run_settings)
+            else:
+                subprocess.run(
+                    [
+                        "robot",
+                        *robot_arguments(project_dir, results_dir, run_settings),
+                        f"{project_dir}/tests",
+                    ],
+                    check=True,
+                )
+                return_code = 0
+        if return_code:
+            raise subprocess.CalledProcessError(return_code, "robot")
+    except subprocess.CalledProcessError as e:
+        click.echo(f"Error running Robot Framework test suite: {e}")
+        raise
+
+
+def open_log_file(project_dir):
+    """Opens results/log.html in the default browser."""
+    import webbrowser
+
+    log_path = os.path.abspath(os.path.join(project_dir, "results", "log.html"))
+    if os.path.exists(log_path):
+        click.echo(f"Opening log file: {log_path}")
+        webbrowser.open(f"file://{log_path}")
+    else:
+        click.echo(f"{log_path} not found!")
+
+
+# === Watch mode ===
+WATCH_IGNORED_DIRECTORIES = ("results", CACHE_DIR)
+
+
+def _watched_directory(name):
+    return not name.startswith(".") and name not in WATCH_IGNORED_DIRECTORIES
+
+
+class PollingWatcher:
+    """Detects changed files by comparing ``os.stat`` snapshots."""
+
+    name = "stat polling"
+
+    def __init__(self, project_dir, files=(), interval=0.5):
+        self.project_dir = project_dir
+        self.files = [os.path.abspath(path) for path in files]
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self):
+        snapshot = {}
+        for root, directories, names in os.walk(self.project_dir):
+            directories[:] = [name for name in directories if _watched_directory(name)]
+            for name in names:
+                self._stat(os.path.abspath(os.path.join(root, name)), snapshot)
+        for path in self.files:
+            self._stat(path, snapshot)
+        return snapshot
+
+    @staticmethod
+    def _stat(path, snapshot):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return
+        snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+
+    def changes(self, timeout=None):
+        """Returns the paths changed since the last call, waiting up to ``timeout`` seconds."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snapshot = self._scan()
+            changed = {
+                path
+                for path in snapshot.keys() | self.snapshot.keys()
+                if snapshot.get(path) != self.snapshot.get(path)
+            }
+            self.snapshot = snapshot
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+            time.sleep(self.interval)
+
+
+class InotifyWatcher:
+    """Detects changed files with Linux inotify through the optional ``inotify_simple`` package."""
+
+    name = "inotify"
+    # Editors often write a file in several steps, so wait for events to settle.
+    SETTLE_MS = 50
+
+    def __init__(self, project_dir, files=(), interval=0.5):
+        from inotify_simple import INotify, flags
+
+        self.flags = flags
+        self.mask = (
+            flags.CLOSE_WRITE | flags.CREATE | flags.DELETE | flags.MOVED_TO | flags.MOVED_FROM
+        )
+        self.inotify = INotify()
+        self.directories = {}
+        self.files = {os.path.abspath(path) for path in files}
+        for root, directories, _ in os.walk(project_dir):
+            directories[:] = [name for name in directories if _watched_directory(name)]
+            self._add(root)
+        for path in self.files:
+            self._add(os.path.dirname(path), files_only=True)
+
+    def _add(self, directory, files_only=False):
+        directory = os.path.abspath(directory)
+        watch = self.inotify.add_watch(directory, self.mask)
+        # Directories holding watched files report only those files.
+        if not files_only or watch not in self.directories:
+            self.directories[watch] = (directory, files_only)
+
+    def _read(self, timeout_ms):
+        changed = set()
+        for event in self.inotify.read(timeout=timeout_ms, read_delay=self.SETTLE_MS):
+            directory, files_only = self.directories.get(event.wd, (None, True))
+            if directory is None:
+                continue
+            path = os.path.join(directory, event.name)
+            if files_only and path not in self.files:
+                continue
+            if event.mask & self.flags.ISDIR:
+                if event.mask & (self.flags.CREATE | self.flags.MOVED_TO) and _watched_directory(
+                    event.name
+                ):
+                    self._add(path)
+                continue
+            changed.add(path)
+        return changed
+
+    def changes(self, timeout=None):
+        """Returns the paths changed since the last call, waiting up to ``timeout`` seconds."""
+        changed = self._read(None if timeout is None else int(timeout * 1000))
+        while timeout is None and not changed:
+            changed = self._read(None)
+        return changed
+
+
+def create_watcher(project_dir, files=(), interval=0.5):
+    """Returns an inotify watcher where available and a polling watcher otherwise."""
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(project_dir, files, interval)
+        except (ImportError, OSError):
+            pass
+    return PollingWatcher(project_dir, files, interval)
+
+
+def affected_suites(project_dir, changed, dependencies):
+    """Returns the suites to rerun for ``changed`` paths.
+
+    ``dependencies`` maps each suite to the files it imports and is updated for
+    changed suites, so only edited suites are read again.
+    """
+    tests_dir = os.path.join(os.path.abspath(project_dir), "tests", "")
+    changed = {os.path.abspath(path) for path in changed}
+    suites = set()
+    for path in changed:
+        if path.startswith(tests_dir) and path.endswith(".robot"):
+            if os.path.exists(path):
+                dependencies[path] = set(map(os.path.abspath, collect_dependencies(path)))
+                suites.add(path)
+            else:
+                dependencies.pop(path, None)
+    suites.update(suite for suite, imports in dependencies.items() if imports & changed)
+    return sorted(suites)
+
+
+def watch_project(project_dir, generate_options, run_settings=None, interval=0.5):
+    """Regenerates on template changes and reruns affected suites until interrupted.
+
+    The generator module is reloaded when its source changes, and suites run
+    through ``robot.run`` in this process, so every iteration starts warm.
+    """
+    import traceback
+
+    warm_up_robot()
+    generator = importlib.import_module("robot_generator")
+    template_inputs = {os.path.abspath(generator.__file__)}
+    if generate_options.get("dataset"):
+        template_inputs.add(os.path.abspath(generate_options["dataset"]))
+
+    def regenerate():
+        generator.generate_project(
+            project_dir, incremental=True, echo=lambda message: None, **generate_options
+        )
+
+    regenerate()
+    results_dir = os.path.join(project_dir, "results")
+    dependencies = {
+        os.path.abspath(suite): set(map(os.path.abspath, collect_dependencies(suite)))
+        for suite in discover_suites(os.path.join(project_dir, "tests"))
+    }
+    watcher = create_watcher(project_dir, template_inputs, interval)
+    click.echo(f"Watching {project_dir} with {watcher.name}. Press Ctrl+C to stop.")
+    try:
+        while True:
+            changed = watcher.changes()
+            started = time.perf_counter()
+            if changed & template_inputs:
+                if os.path.abspath(generator.__file__) in changed:
+                    try:
+                        generator = importlib.reload(generator)
+                    except Exception:
+                        traceback.print_exc()
+                        continue
+                regenerate()
+                # Pick up the regenerated files right away instead of on the next wait.
+                changed |= watcher.changes(timeout=0)
+            suites = affected_suites(project_dir, changed, dependencies)
+            if not suites:
+                continue
+            click.echo(f"Rerunning {len(suites)} affected suites...")
+            with isolated_request(os.getcwd(), project_dir):
+                return_code = generator.run_robot_in_process(
+                    project_dir, results_dir, run_settings, parseinclude=suites
+                )
+            click.echo(
+                f"...exit code {return_code} in {time.perf_counter() - started:.2f}s."
+                " Watching for changes."
+            )
+    except KeyboardInterrupt:
+        click.echo("Stopped watching.")
+
+
+# === Batch generation ===
+def _parse_bool(value):
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in ("1", "true", "yes", "y", "on"):
+        return True
+    if text in ("", "0", "false", "no", "n", "off"):
+        return False
+    raise ValueError(f"Expected a boolean, got '{value}'")
+
+
+BATCH_FIELDS = {
+    "project_dir": str,
+    "suite_name": str,
+    "with_lib": _parse_bool,
+    "with_resource": _parse_bool,
+    "lib_profile": str,
+    "suites": int,
+    "tests_per_suite": int,
+    "incremental": _parse_bool,
+    "dry_run": _parse_bool,
+    "with_profiler": _parse_bool,
+    "dataset": str,
+    "template": str,
+    "rows_per_suite": int,
+    "bytes_per_suite": int,
+    "keywords": int,
+    "archive": str,
+    "write_workers": int,
+}
+
+
+def load_batch_manifest(path):
+    """Returns the project entries of a JSON, YAML or CSV batch manifest."""
+    import csv
+
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if extension == ".csv":
+            return list(csv.DictReader(f))
+        if extension in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise click.ClickException(
+                    "Reading YAML manifests requires PyYAML: pip install pyyaml"
+                )
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get("projects")
+    if not isinstance(data, list):
+        raise click.ClickException(
+            f"{path}: expected a list of projects or a 'projects' list."
+        )
+    return data
+
+
+def batch_project_options(entry):
+    """Converts one manifest entry into ``generate_project`` keyword arguments."""
+    if not isinstance(entry, dict):
+        raise ValueError(f"Expected a mapping of options, got {entry!r}")
+    options = {}
+    for key, value in entry.items():
+        if not isinstance(key, str):
+            # csv.DictReader stores the cells of rows longer than the header under None.
+            raise ValueError(f"Unexpected option {key!r} with value {value!r}")
+        name = key.strip().replace("-", "_")
+        if name not in BATCH_FIELDS:
+            raise ValueError(f"Unknown option '{key}'")
+        if value is None or value == "":
+            continue
+        options[name] = BATCH_FIELDS[name](value)
+    if not options.get("project_dir"):
+        raise ValueError("Missing 'project_dir'")
+    if options.get("lib_profile", "basic") != "basic" and not options.get("with_lib"):
+        raise ValueError("'lib_profile' requires 'with_lib'")
+    if options.get("archive") and (options.get("dry_run") or options.get("incremental")):
+        raise ValueError("'archive' cannot be combined with 'dry_run' or 'incremental'")
+    return options
+
+
+def generate_batch(manifest_path, workers=None):
+    """Generates every project of a batch manifest on a thread pool.
+
+    Returns ``(label, error, files_written)`` per manifest entry, where
+    ``error`` is ``None`` for projects generated successfully.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    entries = load_batch_manifest(manifest_path)
+    jobs = []
+    seen = set()
+    for number, entry in enumerate(entries, 1):
+        label = f"#{number}"
+        try:
+            options = batch_project_options(entry)
+            label = f"#{number} {options['project_dir']}"
+            project_dir = os.path.abspath(options["project_dir"])
+            if project_dir in seen:
+                raise ValueError("Project directory is listed more than once")
+            seen.add(project_dir)
+            if options.get("archive"):
+                archive = ("archive", os.path.abspath(options["archive"]))
+                if archive in seen:
+                    raise ValueError("Archive is listed more than once")
+                seen.add(archive)
+        except ValueError as e:
+            jobs.append((label, None, str(e)))
+        else:
+            jobs.append((label, options, None))
+
+    def generate_job(job):
+        label, options, error = job
+        if error:
+            return label, error, 0
+        try:
+            writer = generate_project(**options, echo=lambda message: None)
+        except Exception as e:
+            return label, f"{type(e).__name__}: {e}", 0
+        return label, None, writer.written
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(generate_job, jobs))
+
+
+def report_batch(results, elapsed):
+    """Prints the aggregate summary and per-project errors of a batch."""
+    failures = [(label, error) for label, error, _ in results if error]
+    written = sum(files for _, _, files in results)
+    click.echo(
+        f"Batch: {len(results) - len(failures)}/{len(results)} projects generated, "
+        f"{written} files written in {elapsed:.2f}s."
+    )
+    for label, error in failures:
+        click.echo(f"...{label}: {error}")
+    if failures:
+        raise click.ClickException(f"{len(failures)} of {len(results)} projects failed.")
+
+
+# === Command line interface ===
+@functools.lru_cache(maxsize=None)
+def command_line():
+    """Returns the ``create_robot_project`` click command, built on first use.
+
+    Building the command imports click, so ``import robot_generator`` and
+    ``generate`` stay fast and work without it.
+    """
+
+    @click.command()
+    @click.option(
+        "--project-dir",
+        default="robot_project",
+        help="Directory to create the Robot Framework project in.",
+    )
+    @click.option(
+        "--suite-name",
+        default="MySuite.robot",
+        help="Name of the Robot Framework file to generate.",
+    )
+    @click.option(
+        "--run", is_flag=True, help="Run the generated Robot Framework test suite."
+    )
+    @click.option(
+        "--open-log", is_flag=True, help="Open the log file after running the test suite."
+    )
+    @click.option(
+        "--dry-run", is_flag=True, help="Perform a dry run without creating files."
+    )
+    @click.option(
+        "--with-lib",
+        is_flag=True,
+        help="Include custom Python library (libraries/MyLibrary.py).",
+    )
+    @click.option(
+        "--with-resource",
+        is_flag=True,
+        help="Include custom resource file (resources/MyResource.robot).",
+    )
+    @click.option(
+        "--lib-profile",
+        type=click.Choice(list(LIBRARY_PROFILES)),
+        default="basic",
+        show_default=True,
+        help="Library template for --with-lib; 'performance' is GLOBAL scoped with pooled resources and concurrent keywords.",
+    )
+    @click.option(
+        "--suites",
+        type=click.IntRange(min=1),
+        default=None,
+        help="Generate this many suites in a nested tests/group_*/ tree instead of a single suite.",
+    )
+    @click.option(
+        "--tests-per-suite",
+        type=click.IntRange(min=1),
+        default=10,
+        show_default=True,
+        help="Number of test cases in each suite generated with --suites.",
+    )
+    @click.option(
+        "--dataset",
+        type=click.Path(exists=True, dir_okay=False),
+        default=None,
+        help="Generate data-driven suites from a CSV, JSON or JSON Lines dataset, one test per row.",
+    )
+    @click.option(
+        "--template",
+        default=DEFAULT_TEMPLATE,
+        show_default=True,
+        help="Test Template keyword the --dataset rows are passed to.",
+    )
+    @click.option(
+        "--rows-per-suite",
+        type=click.IntRange(min=1),
+        default=DATASET_ROWS_PER_SUITE,
+        show_default=True,
+        help="Start a new --dataset suite after this many rows.",
+    )
+    @click.option(
+        "--bytes-per-suite",
+        type=click.IntRange(min=1),
+        default=DATASET_BYTES_PER_SUITE,
+        show_default=True,
+        help="Start a new --dataset suite once its test cases reach this many bytes.",
+    )
+    @click.option(
+        "--keywords",
+        type=click.IntRange(min=1),
+        default=None,
+        help=(
+            f"Generate a keyword resolution stress library and resource with this many normal and "
+            f"embedded-argument keywords each, and tests/{STRESS_SUITE_NAME} calling them."
+        ),
+    )
+    @click.option(
+        "--processes",
+        type=click.IntRange(min=1),
+        default=1,
+        show_default=True,
+        help="Split suites across this many parallel Robot processes when running.",
+    )
+    @click.option(
+        "--in-process",
+        is_flag=True,
+        help="Run the test suite through robot.run in this process instead of a subprocess.",
+    )
+    @click.option(
+        "--serve",
+        metavar="SOCKET",
+        default=None,
+        help="Start a warm runner daemon listening on this Unix socket.",
+    )
+    @click.option(
+        "--connect",
+        metavar="SOCKET",
+        default=None,
+        help="Send this command to the warm runner daemon listening on this Unix socket.",
+    )
+    @click.option(
+        "--archive",
+        type=click.Path(dir_okay=False),
+        default=None,
+        help="Stream the generated files into a .zip, .tar, .tar.gz or .tgz archive instead of the project directory.",
+    )
+    @click.option(
+        "--write-workers",
+        type=click.IntRange(min=1),
+        default=DEFAULT_WRITE_WORKERS,
+        show_default=True,
+        help="Number of threads writing generated files; 1 writes them one after another.",
+    )
+    @click.option(
+        "--incremental",
+        is_flag=True,
+        help=f"Only write files whose content changed, tracked in {MANIFEST_NAME}.",
+    )
+    @click.option(
+        "--cache",
+        is_flag=True,
+        help=f"Reuse results of suites whose inputs are unchanged, cached in {CACHE_DIR}.",
+    )
+    @click.option(
+        "--timings",
+        is_flag=True,
+        help="Print the wall time of each phase as JSON when done.",
+    )
+    @click.option(
+        "--profile",
+        metavar="PATH",
+        default=None,
+        help="Write a cProfile dump of the whole command to PATH (read it with pstats).",
+    )
+    @click.option(
+        "--batch",
+        metavar="MANIFEST",
+        type=click.Path(exists=True, dir_okay=False),
+        default=None,
+        help="Generate every project listed in a JSON, YAML or CSV manifest.",
+    )
+    @click.option(
+        "--batch-workers",
+        type=click.IntRange(min=1),
+        default=None,
+        help="Number of threads used by --batch (default: Python's thread pool default).",
+    )
+    @click.option(
+        "--analyze",
+        is_flag=True,
+        help="Summarize results/output.xml after --run; without --run, analyze the existing results.",
+    )
+    @click.option(
+        "--analysis-json",
+        metavar="PATH",
+        default=None,
+        help="Also write the --analyze report as JSON to PATH.",
+    )
+    @click.option(
+        "--top",
+        type=click.IntRange(min=1),
+        default=10,
+        show_default=True,
+        help="Number of slowest tests and keywords reported by --analyze.",
+    )
+    @click.option(
+        "--validate",
+        is_flag=True,
+        help="Parse the generated suites and resources and report syntax errors, unknown keywords and missing imports.",
+    )
+    @click.option(
+        "--watch",
+        is_flag=True,
+        help="Regenerate on template changes and rerun suites affected by changed files until interrupted.",
+    )
+    @click.option(
+        "--watch-interval",
+        type=click.FloatRange(min=0.01),
+        default=0.5,
+        show_default=True,
+        help="Seconds between scans when --watch falls back to stat polling.",
+    )
+    @click.option(
+        "--rerun-failed",
+        is_flag=True,
+        help="Run only the tests that failed in results/output.xml and merge the results into it.",
+    )
+    @click.option(
+        "--lean",
+        is_flag=True,
+        help="Run with INFO log level and write only output.xml; render the log later with --reports.",
+    )
+    @click.option(
+        "--reports",
+        is_flag=True,
+        help="Generate log.html and report.html from results/output.xml with rebot.",
+    )
+    @click.option(
+        "--history",
+        metavar="DB",
+        type=click.Path(dir_okay=False),
+        default=None,
+        help="Record the results of --run in this SQLite run history database.",
+    )
+    @click.option(
+        "--regressions",
+        is_flag=True,
+        help="Report tests whose latest duration in --history regressed beyond --threshold.",
+    )
+    @click.option(
+        "--threshold",
+        type=click.FloatRange(min=0),
+        default=20.0,
+        show_default=True,
+        help="Slowdown in percent over the baseline reported by --regressions.",
+    )
+    @click.option(
+        "--baseline-runs",
+        type=click.IntRange(min=1),
+        default=5,
+        show_default=True,
+        help="Number of previous runs averaged into the --regressions baseline.",
+    )
+    @click.option(
+        "--with-profiler",
+        is_flag=True,
+        help=f"Include a keyword profiling listener (libraries/{PROFILER_FILE_NAME}) and use it with --run.",
+    )
+    @click.option(
+        "--collapse-profile",
+        metavar="CSV",
+        type=click.Path(exists=True, dir_okay=False),
+        default=None,
+        help=f"Print a {PROFILE_CSV_NAME} written by the profiling listener as collapsed stacks for flame graphs.",
+    )
+    def create_robot_project(
+        suite_name,
+        run,
+        open_log,
+        dry_run,
+        with_lib,
+        with_resource,
+        lib_profile,
+        project_dir,
+        suites,
+        tests_per_suite,
+        dataset,
+        template,
+        rows_per_suite,
+        bytes_per_suite,
+        keywords,
+        processes,
+        in_process,
+        serve,
+        connect,
+        archive,
+        write_workers,
+        incremental,
+        cache,
+        timings,
+        profile,
+        batch,
+        batch_workers,
+        analyze,
+        analysis_json,
+        top,
+        validate,
+        watch,
+        watch_interval,
+        rerun_failed,
+        lean,
+        reports,
+        history,
+        regressions,
+        threshold,
+        baseline_runs,
+        with_profiler,
+        collapse_profile,
+    ):
+        """Generates a Robot Framework test suite with optional library and resource."""
+
+        if in_process and processes > 1:
+            raise click.UsageError("--in-process cannot be combined with --processes.")
+        if archive and (run or dry_run or incremental or validate or watch or open_log):
+            raise click.UsageError(
+                "--archive writes no project directory, so it cannot be combined with "
+                "--run, --dry-run, --incremental, --validate, --watch or --open-log."
+            )
+        if lib_profile != "basic" and not with_lib:
+            raise click.UsageError("--lib-profile requires --with-lib.")
+        if regressions and not history:
+            raise click.UsageError("--regressions requires --history.")
+        if history and not (run or regressions):
+            raise click.UsageError("--history records the results of --run; add --run or --regressions.")
+
+        if serve:
+            serve_daemon(serve)
+            return
+
+        if connect:
+            params = dict(click.get_current_context().params, serve=None, connect=None)
+            # The daemon exists to keep Robot warm, so single-process runs happen in it.
+            params["in_process"] = processes == 1
+            response = send_daemon_request(connect, params)
+            click.echo(response["output"], nl=False)
+            if response["exit_code"]:
+                sys.exit(response["exit_code"])
+            return
+
+        if collapse_profile:
+            for line in collapse_profile_lines(collapse_profile):
+                click.echo(line)
+            return
+
+        timings = PhaseTimings(enabled=timings)
+        profiler = None
+        if profile:
+            import cProfile
+
+            profiler = cProfile.Profile()
+            profiler.enable()
+        try:
+            if batch:
+                started = time.perf_counter()
+                with timings.phase("batch"):
+                    results = generate_batch(batch, batch_workers)
+                report_batch(results, time.perf_counter() - started)
+                return
+
+            if watch:
+                generate_options = dict(
+                    suite_name=suite_name,
+                    with_lib=with_lib,
+                    with_resource=with_resource,
+                    lib_profile=lib_profile,
+                    suites=suites,
+                    tests_per_suite=tests_per_suite,
+                    with_profiler=with_profiler,
+                    dataset=dataset,
+                    template=template,
+                    rows_per_suite=rows_per_suite,
+                    bytes_per_suite=bytes_per_suite,
+                    keywords=keywords,
+                    write_workers=write_workers,
+                )
+                run_settings = {"profiler": with_profiler, "lean": lean}
+                watch_project(project_dir, generate_options, run_settings, watch_interval)
+                return
+
+            if rerun_failed:
+                rerun_failed_tests(
+                    project_dir, processes, in_process, timings, run_settings={"lean": lean}
+                )
+                return
+
+            output_path = os.path.join(project_dir, "results", "output.xml")
+            if (analyze or regressions or reports) and not run:
+                if reports:
+                    render_reports(os.path.dirname(output_path), lean)
+                if analyze:
+                    report_analysis(output_path, analysis_json, top)
+                if regressions:
+                    report_regressions(history, threshold, baseline_runs)
+                return
+
+            try:
+                generate_project(
+                    project_dir,
+                    suite_name=suite_name,
+                    dry_run=dry_run,
+                    with_lib=with_lib,
+                    with_resource=with_resource,
+                    lib_profile=lib_profile,
+                    suites=suites,
+                    tests_per_suite=tests_per_suite,
+                    incremental=incremental,
+                    with_profiler=with_profiler,
+                    dataset=dataset,
+                    template=template,
+                    rows_per_suite=rows_per_suite,
+                    bytes_per_suite=bytes_per_suite,
+                    keywords=keywords,
+                    archive=archive,
+                    write_workers=write_workers,
+                    timings=timings,
+                )
+            except ValueError as e:
+                # Dataset and archive errors are plain ValueErrors so that generate() needs no click.
+                raise click.ClickException(str(e))
+            if validate and not dry_run:
+                with timings.phase("validate"):
+                    report_validation(project_dir)
+            if run:
+                try:
+                    run_project(
+                        project_dir,
+                        processes,
+                        in_process,
+                        cache,
+                        timings,
+                        run_settings={"profiler": with_profiler, "lean": lean},
+                    )
+                finally:
+                    if reports:
+                        with timings.phase("reports"):
+                            render_reports(os.path.dirname(output_path), lean)
+                    if analyze:
+                        with timings.phase("analyze"):
+                            report_analysis(output_path, analysis_json, top)
+                    if history:
+                        with timings.phase("history"):
+                            record_history(history, output_path, project_dir)
+                    if regressions:
+                        report_regressions(history, threshold, baseline_runs)
+            if open_log:
+                if not run:
+                    click.echo("Run the test suite first to generate log files.")
+                    return
+                with timings.phase("open log"):
+                    open_log_file(project_dir)
+        finally:
+            if profiler:
+                profiler.disable()
+                profiler.dump_stats(profile)
+                click.echo(f"Profile written to: {profile}")
+            if timings.enabled:
+                click.echo(timings.as_json())
+
+    return create_robot_project
+
+
+def __getattr__(name):
+    if name == "create_robot_project":
+        return command_line()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
-    create_robot_project()
+    command_line()()
@@ -1,8 +1,11 @@
 import pytest
 import os
+import sys
+import json
 import tempfile
 import shutil
-from unittest.mock import patch, MagicMock, call
+from unittest.mock import patch, MagicMock, call, ANY
+import click
 from click.testing import CliRunner
 import subprocess
 
@@ -13,7 +16,49 @@ from robot_generator import (
         TEST_CASE_2,
         TEST_CASE_3,
         MY_LIBRARY_CONTENT,
-        MY_RESOURCE_CONTENT
+        MY_PERFORMANCE_LIBRARY_CONTENT,
+        TEST_CASE_PERFORMANCE,
+        MY_RESOURCE_CONTENT,
+        SUITES_PER_DIRECTORY,
+        render_robot_suite,
+        iter_sample_test_cases,
+        iter_generated_suite_paths,
+        iter_generated_test_cases,
+        discover_suites,
+        schedule_suites,
+        read_suite_durations,
+        combine_return_codes,
+        merge_outputs,
+        handle_daemon_request,
+        isolated_request,
+        remove_stale_socket,
+        MANIFEST_NAME,
+        hash_chunks,
+        CACHED_TAG,
+        read_settings_imports,
+        collect_dependencies,
+        suite_cache_key,
+        batch_project_options,
+        analyze_output,
+        ingest_output,
+        find_regressions,
+        robot_options,
+        render_reports,
+        read_failed_tests,
+        run_shards,
+        robot_cell,
+        iter_stress_test_cases,
+        validate_file,
+        validate_project,
+        PollingWatcher,
+        affected_suites,
+        generate_project,
+        iter_dataset_rows,
+        LEAN_REBOT_OPTIONS,
+        collapse_profile_lines,
+        PROFILER_FILE_NAME,
+        ProjectWriter,
+        project_directories,
     )
 
 
@@ -196,6 +241,102 @@ class TestRobotProjectGenerator:
         # Should exit with error code due to subprocess failure
         assert result.exit_code != 0
 
+    @patch('subprocess.run')
+    def test_run_option_with_processes(self, mock_subprocess, runner, temp_dir):
+        """Test --processes runs one Robot worker per shard with its own output directory."""
+        mock_subprocess.return_value = MagicMock(returncode=0)
+
+        result = runner.invoke(create_robot_project, [
+            '--project-dir', temp_dir,
+            '--suites', '5',
+            '--run',
+            '--processes', '2'
+        ])
+
+        assert result.exit_code == 0
+        assert "Running 5 suites in 2 worker processes..." in result.output
+        assert mock_subprocess.call_count == 2
+        worker_dirs = {
+            call_args[0][0][call_args[0][0].index('--outputdir') + 1]
+            for call_args in mock_subprocess.call_args_list
+        }
+        assert worker_dirs == {
+            os.path.join(temp_dir, 'results', 'workers', 'worker_01'),
+            os.path.join(temp_dir, 'results', 'workers', 'worker_02'),
+        }
+        with open(os.path.join(temp_dir, 'results', 'workers', 'worker_01', 'arguments.txt')) as f:
+            assert f.read().count('--parseinclude') == 3
+
+    @patch('subprocess.run')
+    def test_run_option_with_processes_and_failures(self, mock_subprocess, runner, temp_dir):
+        """Test a failing worker makes the parallel run exit with an error."""
+        mock_subprocess.return_value = MagicMock(returncode=1)
+
+        result = runner.invoke(create_robot_project, [
+            '--project-dir', temp_dir,
+            '--suites', '2',
+            '--run',
+            '--processes', '2'
+        ])
+
+        assert result.exit_code != 0
+        assert isinstance(result.exception, subprocess.CalledProcessError)
+        assert result.exception.returncode == 2
+
+    @patch('robot.run')
+    @patch('subprocess.run')
+    def test_run_option_in_process(self, mock_subprocess, mock_robot_run, runner, temp_dir):
+        """Test --in-process runs Robot through robot.run with the same settings."""
+        pytest.importorskip('robot')
+        mock_robot_run.return_value = 0
+        saved_path = list(sys.path)
+
+        result = runner.invoke(create_robot_project, [
+            '--project-dir', temp_dir,
+            '--run',
+            '--in-process'
+        ])
+
+        assert result.exit_code == 0
+        mock_subprocess.assert_not_called()
+        mock_robot_run.assert_called_once_with(
+            f'{temp_dir}/tests',
+            stdout=ANY,
+            stderr=ANY,
+            outputdir=os.path.join(temp_dir, 'results'),
+            loglevel='TRACE:INFO',
+            pythonpath=[temp_dir]
+        )
+        assert sys.path == saved_path
+
+    @patch('robot.run')
+    def test_run_option_in_process_with_failures(self, mock_robot_run, runner, temp_dir):
+        """Test failing tests in-process exit the same way as the subprocess path."""
+        pytest.importorskip('robot')
+        mock_robot_run.return_value = 2
+
+        result = runner.invoke(create_robot_project, [
+            '--project-dir', temp_dir,
+            '--run',
+            '--in-process'
+        ])
+
+        assert result.exit_code != 0
+        assert isinstance(result.exception, subprocess.CalledProcessError)
+        assert result.exception.returncode == 2
+
+    def test_in_process_with_processes_is_rejected(self, runner, temp_dir):
+        """Test --in-process and --processes cannot be combined."""
+        result = runner.invoke(create_robot_project, [
+            '--project-dir', temp_dir,
+            '--run',
+            '--in-process',
+            '--processes', '2'
+        ])
+
+        assert result.exit_code == 2
+        assert "--in-process cannot be combined with --processes" in result.output
+
     def test_open_log_option_without_run(self, runner, temp_dir):
         """Test open-log option without run option."""
         result = runner.invoke(create_robot_project, [
@@ -296,6 +437,41 @@ class TestRobotProjectGenerator:
                 content = f.read()
                 assert len(content) > 0
 
+    def test_large_scale_generation(self, runner, temp_dir):
+        """Test --suites generates a nested tree of suites with numbered test cases."""
+        result = runner.invoke(create_robot_project, [
+            '--project-dir', temp_dir,
+            '--suites', '3',
+            '--tests-per-suite', '4',
+            '--with-lib',
+            '--with-resource'
+        ])
+
+        assert result.exit_code == 0
+        assert "12 test cases created." in result.output
+        assert not os.path.exists(os.path.join(temp_dir, 'tests', 'MySuite.robot'))
+
+        suite_path = os.path.join(temp_dir, 'tests', 'group_0', 'suite_3.robot')
+        with open(suite_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+            assert "Library    ../../libraries/MyLibrary.py" in content
+            assert "Resource   ../../resources/MyResource.robot" in content
+            assert content.count("Generated Test ") == 4
+            assert "Verify ${4} Is Greater Than ${0}" in content
+            assert "*** Keywords ***" in content
+
+    def test_large_scale_dry_run(self, runner, temp_dir):
+        """Test --suites together with --dry-run writes nothing."""
+        result = runner.invoke(create_robot_project, [
+            '--project-dir', temp_dir,
+            '--suites', '5',
+            '--dry-run'
+        ])
+
+        assert result.exit_code == 0
+        assert "Creating 5 test suites with 10 test cases each" in result.output
+        assert not os.path.exists(os.path.join(temp_dir, 'tests'))
+
     def test_command_help(self, runner):
         """Test that help command works."""
         result = runner.invoke(create_robot_project, ['--help'])
@@ -309,6 +485,8 @@ class TestRobotProjectGenerator:
         assert "--with-resource" in result.output
         assert "--open-log" in result.output
         assert "--dry-run" in result.output
+        assert "--suites" in result.output
+        assert "--tests-per-suite" in result.output
 
 
 class TestTemplateFormatting:
@@ -367,3 +545,1419 @@ class TestTemplateFormatting:
         assert "Sample Test Case With Local Keyword" in combined
         assert "Sample Test Case With Python Library Keyword" in combined
         assert "Sample Test Case With Resource Keyword" in combined
+
+    def test_rendered_suite_matches_template(self):
+        """Test the streaming renderer produces the same suite as the whole-string template."""
+        settings_block = "Library    ../libraries/MyLibrary.py"
+        test_cases = iter_sample_test_cases(with_lib=True, with_resource=True)
+
+        rendered = "".join(render_robot_suite(settings_block, test_cases))
+
+        assert rendered == BASE_ROBOT_TEMPLATE.format(
+            settings_block=settings_block,
+            test_cases=TEST_CASE_1 + TEST_CASE_2 + TEST_CASE_3
+        )
+
+    def test_rendered_suite_is_streamed(self):
+        """Test sections are yielded before the test cases are exhausted."""
+        def endless_test_cases():
+            while True:
+                yield "Endless Test\n    No Operation\n"
+
+        chunks = render_robot_suite("", endless_test_cases())
+
+        assert "*** Settings ***" in next(chunks)
+        assert "*** Variables ***" in next(chunks)
+        assert "*** Test Cases ***" in next(chunks)
+        assert next(chunks) == "Endless Test\n    No Operation\n"
+
+
+class TestLargeScaleGeneration:
+    """Test the building blocks of the large-scale generation mode."""
+
+    def test_suite_paths_are_grouped(self):
+        """Test suites are spread over group directories with zero-padded names."""
+        paths = list(iter_generated_suite_paths('tests', SUITES_PER_DIRECTORY + 1))
+
+        assert len(paths) == SUITES_PER_DIRECTORY + 1
+        assert paths[0] == os.path.join('tests', 'group_0', 'suite_001.robot')
+        assert paths[-1] == os.path.join('tests', 'group_1', 'suite_101.robot')
+        assert len({os.path.dirname(path) for path in paths}) == 2
+
+    def test_generated_test_cases_are_lazy(self):
+        """Test test cases are produced one chunk at a time."""
+        cases = iter_generated_test_cases(10 ** 9, with_lib=True, with_resource=False)
+
+        assert "Generated Test 1" in next(cases)
+        assert "Verify ${1} Is Greater Than ${0}" in next(cases)
+        assert "Generated Test 2" in next(cases)
+
+
+class TestParallelExecution:
+    """Test suite sharding and result merging for parallel runs."""
+
+    def test_discover_suites_is_sorted_and_recursive(self, tmp_path):
+        """Test suites are found in nested directories in a stable order."""
+        for name in ['b/2.robot', 'a/1.robot', 'a/notes.txt', 'top.robot']:
+            path = tmp_path / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text('')
+
+        suites = discover_suites(str(tmp_path))
+
+        assert [os.path.relpath(suite, tmp_path) for suite in suites] == [
+            'top.robot', os.path.join('a', '1.robot'), os.path.join('b', '2.robot')
+        ]
+
+    def test_schedule_suites_without_history(self):
+        """Test suites without timings are dealt round-robin and empty shards are dropped."""
+        assert schedule_suites(['a', 'b', 'c', 'd', 'e'], {}, 2) == [['a', 'c', 'e'], ['b', 'd']]
+        assert schedule_suites(['a'], {}, 4) == [['a']]
+
+    def test_schedule_suites_longest_first(self):
+        """Test known durations are balanced and unknown suites get the median estimate."""
+        durations = {os.path.abspath(name): seconds
+                     for name, seconds in [('a', 8.0), ('b', 5.0), ('c', 4.0), ('d', 3.0)]}
+
+        shards = schedule_suites(['a', 'b', 'c', 'd', 'new'], durations, 2)
+
+        assert shards == [['a', 'c'], ['b', 'new', 'd']]
+
+    def test_read_suite_durations(self, tmp_path):
+        """Test per-suite elapsed times are read from both output.xml formats."""
+        output = tmp_path / 'output.xml'
+        output.write_text(
+            '<robot>'
+            '<suite name="Tests" source="/p/tests">'
+            '<suite name="A" source="/p/tests/a.robot">'
+            '<test name="T"><status status="PASS" elapsed="0.5"/></test>'
+            '<status status="PASS" start="2024-01-01T00:00:00" elapsed="1.25"/></suite>'
+            '<suite name="B" source="/p/tests/b.robot">'
+            '<status status="PASS" starttime="20240101 00:00:00.000" endtime="20240101 00:00:02.500"/>'
+            '</suite>'
+            '<status status="PASS" elapsed="3.75"/></suite>'
+            '</robot>'
+        )
+
+        assert read_suite_durations(str(output)) == {
+            os.path.abspath('/p/tests/a.robot'): 1.25,
+            os.path.abspath('/p/tests/b.robot'): 2.5,
+        }
+
+    def test_combine_return_codes(self):
+        """Test worker exit codes combine like a single Robot run."""
+        assert combine_return_codes([0, 0]) == 0
+        assert combine_return_codes([2, 3]) == 5
+        assert combine_return_codes([200, 100]) == 250
+        assert combine_return_codes([1, 252]) == 252
+
+    def test_merge_outputs(self, tmp_path):
+        """Test outputs of separate workers are merged into one suite tree."""
+        robot = pytest.importorskip('robot')
+        runner = CliRunner()
+        project_dir = str(tmp_path / 'project')
+        runner.invoke(create_robot_project, ['--project-dir', project_dir, '--suites', '3'])
+        suites = discover_suites(os.path.join(project_dir, 'tests'))
+        outputs = []
+        with open(os.devnull, 'w') as devnull:
+            for index, suite in enumerate(suites):
+                output = str(tmp_path / f'output_{index}.xml')
+                robot.run(os.path.join(project_dir, 'tests'), parseinclude=[suite],
+                          output=output, log=None, report=None, stdout=devnull)
+                outputs.append(output)
+
+        merged_path = str(tmp_path / 'merged.xml')
+        merge_outputs(outputs[::-1], merged_path)
+
+        from robot.api import ExecutionResult
+        merged = ExecutionResult(merged_path)
+        assert merged.statistics.total.passed == 30
+        assert [suite.name for suite in merged.suite.suites[0].suites] == [
+            'Suite 1', 'Suite 2', 'Suite 3'
+        ]
+
+
+class TestWarmRunnerDaemon:
+    """Test request handling and state isolation of the warm runner daemon."""
+
+    @pytest.fixture
+    def runner(self):
+        """Create a Click test runner."""
+        return CliRunner()
+
+    @pytest.fixture
+    def params(self):
+        """Default command parameters as a client would forward them."""
+        return {
+            'project_dir': 'project', 'suite_name': 'MySuite.robot', 'run': False,
+            'open_log': False, 'dry_run': False, 'with_lib': True, 'with_resource': False,
+            'suites': None, 'tests_per_suite': 10, 'processes': 1, 'in_process': True,
+            'serve': None, 'connect': None,
+        }
+
+    def test_request_runs_in_client_directory(self, tmp_path, params):
+        """Test a request is generated relative to the client's working directory."""
+        cwd = os.getcwd()
+
+        response = handle_daemon_request({'cwd': str(tmp_path), 'params': params})
+
+        assert response['exit_code'] == 0
+        assert "Creating Robot Framework project in: project" in response['output']
+        assert os.path.exists(tmp_path / 'project' / 'libraries' / 'MyLibrary.py')
+        assert os.getcwd() == cwd
+
+    def test_request_errors_are_reported(self, tmp_path, params):
+        """Test usage errors become a non-zero exit code and a message."""
+        params['processes'] = 2
+
+        response = handle_daemon_request({'cwd': str(tmp_path), 'params': params})
+
+        assert response['exit_code'] == 2
+        assert "--in-process cannot be combined with --processes" in response['output']
+
+    def test_project_modules_are_reloaded(self, tmp_path):
+        """Test modules imported from the project and sys.path changes do not leak."""
+        library_dir = tmp_path / 'project' / 'libraries'
+        library_dir.mkdir(parents=True)
+        (library_dir / 'DaemonProbe.py').write_text('VALUE = 1\n')
+        saved_path = list(sys.path)
+
+        with isolated_request(str(tmp_path), 'project'):
+            sys.path.insert(0, str(library_dir))
+            import DaemonProbe
+            assert DaemonProbe.VALUE == 1
+
+        assert 'DaemonProbe' not in sys.modules
+        assert sys.path == saved_path
+
+    def test_serve_keeps_other_files_and_live_daemons(self, tmp_path):
+        """Test only a socket no daemon listens on is removed before serving."""
+        import socket
+
+        regular_file = tmp_path / 'victim.txt'
+        regular_file.write_text('keep me')
+        with pytest.raises(click.ClickException, match="is not a socket"):
+            remove_stale_socket(str(regular_file))
+        assert regular_file.read_text() == 'keep me'
+
+        socket_path = str(tmp_path / 'daemon.sock')
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            server.bind(socket_path)
+            server.listen()
+            with pytest.raises(click.ClickException, match="already serving"):
+                remove_stale_socket(socket_path)
+        assert os.path.exists(socket_path)
+
+        remove_stale_socket(socket_path)
+        assert not os.path.exists(socket_path)
+
+    @patch('robot_generator.send_daemon_request')
+    def test_connect_forwards_command(self, mock_send, runner, tmp_path):
+        """Test --connect forwards the parameters and replays the daemon's result."""
+        mock_send.return_value = {'exit_code': 3, 'output': 'from daemon\n'}
+
+        result = runner.invoke(create_robot_project, [
+            '--project-dir', str(tmp_path),
+            '--run',
+            '--connect', 'daemon.sock'
+        ])
+
+        assert result.exit_code == 3
+        assert result.output == 'from daemon\n'
+        socket_path, params = mock_send.call_args[0]
+        assert socket_path == 'daemon.sock'
+        assert params['run'] and params['in_process']
+        assert params['connect'] is None
+        assert not os.path.exists(tmp_path / 'tests')
+
+
+class TestIncrementalGeneration:
+    """Test manifest-based incremental regeneration."""
+
+    @pytest.fixture
+    def runner(self):
+        """Create a Click test runner."""
+        return CliRunner()
+
+    def generate(self, runner, project_dir, *args):
+        result = runner.invoke(create_robot_project, [
+            '--project-dir', project_dir, '--incremental', *args
+        ])
+        assert result.exit_code == 0
+        return result.output
+
+    def test_unchanged_files_are_skipped(self, runner, tmp_path):
+        """Test a second identical generation writes nothing and keeps mtimes."""
+        project_dir = str(tmp_path)
+        suite_path = tmp_path / 'tests' / 'MySuite.robot'
+        output = self.generate(runner, project_dir, '--with-lib', '--with-resource')
+        assert "Manifest: 3 written, 0 skipped, 0 removed." in output
+        mtime = suite_path.stat().st_mtime_ns
+
+        output = self.generate(runner, project_dir, '--with-lib', '--with-resource')
+
+        assert "Manifest: 0 written, 3 skipped, 0 removed." in output
+        assert "...Robot test file unchanged." in output
+        assert suite_path.stat().st_mtime_ns == mtime
+
+    def test_manifest_records_content_hashes(self, runner, tmp_path):
+        """Test the manifest records the hash of each generated file."""
+        self.generate(runner, str(tmp_path), '--with-lib')
+
+        with open(tmp_path / MANIFEST_NAME, encoding='utf-8') as f:
+            files = json.load(f)['files']
+
+        assert sorted(files) == ['libraries/MyLibrary.py', 'tests/MySuite.robot']
+        assert files['libraries/MyLibrary.py']['sha256'] == hash_chunks([MY_LIBRARY_CONTENT])
+
+    def test_edited_files_are_rewritten(self, runner, tmp_path):
+        """Test a generated file changed on disk is regenerated."""
+        self.generate(runner, str(tmp_path), '--with-lib')
+        lib_path = tmp_path / 'libraries' / 'MyLibrary.py'
+        lib_path.write_text('# edited\n')
+
+        output = self.generate(runner, str(tmp_path), '--with-lib')
+
+        assert "Manifest: 1 written, 1 skipped, 0 removed." in output
+        assert lib_path.read_text(encoding='utf-8') == MY_LIBRARY_CONTENT
+
+    def test_files_no_longer_generated_are_removed(self, runner, tmp_path):
+        """Test files dropped from the generation are deleted with their empty directories."""
+        self.generate(runner, str(tmp_path), '--with-resource')
+
+        output = self.generate(runner, str(tmp_path))
+
+        assert "Manifest: 1 written, 0 skipped, 1 removed." in output
+        assert not os.path.exists(tmp_path / 'resources')
+
+
+class TestResultCache:
+    """Test suite dependency tracking and the run result cache."""
+
+    @pytest.fixture
+    def project_dir(self, tmp_path):
+        """A generated project with a library and a resource."""
+        project_dir = str(tmp_path / 'project')
+        result = CliRunner().invoke(create_robot_project, [
+            '--project-dir', project_dir, '--suites', '2', '--with-lib', '--with-resource'
+        ])
+        assert result.exit_code == 0
+        return project_dir
+
+    def suite(self, project_dir, index):
+        return os.path.join(project_dir, 'tests', 'group_0', f'suite_{index}.robot')
+
+    def test_settings_imports(self, project_dir):
+        """Test Library and Resource paths are read from the Settings section."""
+        assert read_settings_imports(self.suite(project_dir, 1)) == [
+            os.path.join(project_dir, 'libraries', 'MyLibrary.py'),
+            os.path.join(project_dir, 'resources', 'MyResource.robot'),
+        ]
+
+    def test_nested_resource_imports_are_followed(self, tmp_path):
+        """Test dependencies of imported resources are collected too."""
+        (tmp_path / 'suite.robot').write_text(
+            '*** Settings ***\nResource    outer.resource\n\n*** Test Cases ***\nT\n    No Operation\n'
+        )
+        (tmp_path / 'outer.resource').write_text('*** Settings ***\nLibrary    inner.py\n')
+
+        assert collect_dependencies(str(tmp_path / 'suite.robot')) == [
+            str(tmp_path / 'inner.py'), str(tmp_path / 'outer.resource')
+        ]
+
+    def test_cache_key_follows_inputs(self, project_dir):
+        """Test the key differs per suite and changes when an imported file changes."""
+        first = suite_cache_key(project_dir, self.suite(project_dir, 1))
+        second = suite_cache_key(project_dir, self.suite(project_dir, 2))
+        assert first != second
+        assert first == suite_cache_key(project_dir, self.suite(project_dir, 1))
+
+        with open(os.path.join(project_dir, 'resources', 'MyResource.robot'), 'a') as f:
+            f.write('# changed\n')
+
+        assert first != suite_cache_key(project_dir, self.suite(project_dir, 1))
+
+    @patch('robot_generator.render_reports')
+    def test_unchanged_suites_reuse_results(self, mock_render_reports, project_dir):
+        """Test a second cached run executes only the changed suite."""
+        pytest.importorskip('robot')
+        runner = CliRunner()
+        args = ['--project-dir', project_dir, '--dry-run', '--run', '--cache', '--in-process']
+
+        result = runner.invoke(create_robot_project, args)
+        assert result.exit_code == 0
+        assert "Result cache: 0 suites cached, 2 to run." in result.output
+
+        with open(self.suite(project_dir, 2), 'a') as f:
+            f.write('# changed\n')
+        result = runner.invoke(create_robot_project, args)
+        assert result.exit_code == 0
+        assert "Result cache: 1 suites cached, 1 to run." in result.output
+
+        from robot.api import ExecutionResult
+        merged = ExecutionResult(os.path.join(project_dir, 'results', 'output.xml'))
+        first, second = merged.suite.suites[0].suites
+        assert merged.statistics.total.passed == 20
+        assert all(CACHED_TAG in test.tags for test in first.tests)
+        assert not any(CACHED_TAG in test.tags for test in second.tests)
+
+    @patch('robot_generator.render_reports')
+    def test_failed_suites_are_not_cached(self, mock_render_reports, tmp_path):
+        """Test a suite with a failing test runs again instead of coming from the cache."""
+        project_dir = tmp_path / 'project'
+        (project_dir / 'tests').mkdir(parents=True)
+        (project_dir / 'tests' / 'Failing.robot').write_text(
+            '*** Test Cases ***\nFailing\n    Fail    flaky\n'
+        )
+        runner = CliRunner()
+        args = ['--project-dir', str(project_dir), '--run', '--cache', '--in-process']
+
+        result = runner.invoke(create_robot_project, args)
+        assert result.exit_code != 0
+        assert "Result cache: 0 suites cached, 2 to run." in result.output
+
+        result = runner.invoke(create_robot_project, args)
+        assert "Result cache: 1 suites cached, 1 to run." in result.output
+        from robot.api import ExecutionResult
+        merged = ExecutionResult(str(project_dir / 'results' / 'output.xml'))
+        assert (merged.statistics.total.passed, merged.statistics.total.failed) == (1, 1)
+
+
+class TestTimingsAndProfiling:
+    """Test --timings and --profile instrumentation."""
+
+    @pytest.fixture
+    def runner(self):
+        """Create a Click test runner."""
+        return CliRunner()
+
+    def test_timings_report_each_phase(self, runner, tmp_path):
+        """Test --timings prints directory creation and every file write as JSON."""
+        result = runner.invoke(create_robot_project, [
+            '--project-dir', str(tmp_path), '--with-lib', '--with-resource', '--timings',
+            '--write-workers', '1'
+        ])
+
+        assert result.exit_code == 0
+        report = json.loads(result.output.splitlines()[-1])
+        phases = [(phase['phase'], phase.get('path')) for phase in report['phases']]
+        assert phases == [
+            ('create directories', None),
+            ('write', 'tests/MySuite.robot'),
+            ('write', 'libraries/MyLibrary.py'),
+            ('write', 'resources/MyResource.robot'),
+        ]
+        assert report['total_seconds'] >= sum(phase['seconds'] for phase in report['phases'])
+
+    def test_timings_with_write_workers(self, runner, tmp_path):
+        """Test queued writes are timed on the workers and reported only once they are written."""
+        result = runner.invoke(create_robot_project, [
+            '--project-dir', str(tmp_path), '--with-lib', '--timings', '--write-workers', '2'
+        ])
+
+        assert result.exit_code == 0
+        report = json.loads(result.output.splitlines()[-1])
+        phases = [(phase['phase'], phase.get('path')) for phase in report['phases']]
+        # Worker threads record their writes as they finish, in any order.
+        assert phases[0] == ('create directories', None)
+        assert sorted(phases[1:3]) == [('write', 'libraries/MyLibrary.py'), ('write', 'tests/MySuite.robot')]
+        assert phases[3:] == [('finish write', None)]
+        assert result.output.splitlines()[-4:-1] == [
+            "...Robot test file created.", "...Python library file created.", "2 files written."
+        ]
+
+    @patch('subprocess.run')
+    def test_timings_include_robot_run(self, mock_subprocess, runner, tmp_path):
+        """Test the robot run is reported as its own phase."""
+        result = runner.invoke(create_robot_project, [
+            '--project-dir', str(tmp_path), '--run', '--timings'
+        ])
+
+        assert result.exit_code == 0
+        report = json.loads(result.output.splitlines()[-1])
+        assert report['phases'][-1]['phase'] == 'robot run'
+
+    def test_dry_run_timings_measure_rendering(self, runner, tmp_path):
+        """Test --dry-run renders everything without writing and times the rendering."""
+        project_dir = str(tmp_path / 'project')
+        result = runner.invoke(create_robot_project, [
+            '--project-dir', project_dir, '--suites', '3', '--dry-run', '--timings'
+        ])
+
+        assert result.exit_code == 0
+        assert "nothing written." in result.output
+        report = json.loads(result.output.splitlines()[-1])
+        assert report['phases'] == [
+            {'phase': 'render suites', 'files': 3, 'seconds': report['phases'][0]['seconds']}
+        ]
+        assert not os.path.exists(project_dir)
+
+    def test_profile_dump(self, runner, tmp_path):
+        """Test --profile writes a pstats-readable dump of the whole command."""
+        import pstats
+        profile_path = str(tmp_path / 'generator.prof')
+
+        result = runner.invoke(create_robot_project, [
+            '--project-dir', str(tmp_path / 'project'), '--dry-run', '--profile', profile_path
+        ])
+
+        assert result.exit_code == 0
+        assert f"Profile written to: {profile_path}" in result.output
+        functions = {function for _, _, function in pstats.Stats(profile_path).stats}
+        assert 'generate_project' in functions
+
+
+class TestBatchGeneration:
+    """Test generating many projects from one manifest."""
+
+    @pytest.fixture
+    def runner(self):
+        """Create a Click test runner."""
+        return CliRunner()
+
+    def test_json_manifest(self, runner, tmp_path):
+        """Test every project of a JSON manifest is generated."""
+        manifest = tmp_path / 'projects.json'
+        manifest.write_text(json.dumps({'projects': [
+            {'project_dir': str(tmp_path / 'one'), 'with-lib': True},
+            {'project_dir': str(tmp_path / 'two'), 'suites': 2, 'tests_per_suite': 1},
+        ]}))
+
+        result = runner.invoke(create_robot_project, ['--batch', str(manifest)])
+
+        assert result.exit_code == 0
+        assert "Batch: 2/2 projects generated, 4 files written" in result.output
+        assert os.path.exists(tmp_path / 'one' / 'libraries' / 'MyLibrary.py')
+        assert os.path.exists(tmp_path / 'two' / 'tests' / 'group_0' / 'suite_2.robot')
+
+    def test_csv_manifest_with_errors(self, runner, tmp_path):
+        """Test failing entries are reported per project without stopping the others."""
+        manifest = tmp_path / 'projects.csv'
+        manifest.write_text(
+            'project_dir,with_resource,suites\n'
+            f'{tmp_path / "ok"},yes,\n'
+            f'{tmp_path / "bad"},maybe,\n'
+            f'{tmp_path / "ok"},,\n'
+            f'{tmp_path / "long"},,,extra\n'
+        )
+
+        result = runner.invoke(create_robot_project, ['--batch', str(manifest), '--batch-workers', '2'])
+
+        assert result.exit_code == 1
+        assert "Batch: 1/4 projects generated" in result.output
+        assert "#2: Expected a boolean, got 'maybe'" in result.output
+        assert f"#3 {tmp_path / 'ok'}: Project directory is listed more than once" in result.output
+        assert "#4: Unexpected option None with value ['extra']" in result.output
+        assert "Error: 3 of 4 projects failed." in result.output
+        assert os.path.exists(tmp_path / 'ok' / 'resources' / 'MyResource.robot')
+        assert not os.path.exists(tmp_path / 'bad')
+
+    def test_batch_profile_and_timings(self, runner, tmp_path):
+        """Test --profile and --timings also cover batch generation."""
+        manifest = tmp_path / 'projects.json'
+        manifest.write_text(json.dumps([{'project_dir': str(tmp_path / 'one')}]))
+        profile = tmp_path / 'batch.prof'
+
+        result = runner.invoke(create_robot_project, [
+            '--batch', str(manifest), '--profile', str(profile), '--timings'
+        ])
+
+        assert result.exit_code == 0, result.output
+        assert profile.is_file()
+        report = json.loads(result.output.splitlines()[-1])
+        assert [phase['phase'] for phase in report['phases']] == ['batch']
+
+    def test_duplicate_archives_are_rejected(self, runner, tmp_path):
+        """Test two entries cannot write the same archive."""
+        archive = str(tmp_path / 'shared.zip')
+        manifest = tmp_path / 'projects.json'
+        manifest.write_text(json.dumps([
+            {'project_dir': str(tmp_path / 'aa'), 'archive': archive},
+            {'project_dir': str(tmp_path / 'bb'), 'archive': archive},
+        ]))
+
+        result = runner.invoke(create_robot_project, ['--batch', str(manifest)])
+
+        assert result.exit_code == 1
+        assert f"#2 {tmp_path / 'bb'}: Archive is listed more than once" in result.output
+        assert sorted(os.listdir(tmp_path)) == ['projects.json', 'shared.zip']
+
+    def test_batch_project_options(self):
+        """Test manifest values are converted to generate_project arguments."""
+        assert batch_project_options(
+            {'project-dir': 'p', 'with_lib': 'true', 'suites': '3', 'suite_name': ''}
+        ) == {'project_dir': 'p', 'with_lib': True, 'suites': 3}
+
+        with pytest.raises(ValueError, match="Unknown option 'run'"):
+            batch_project_options({'project_dir': 'p', 'run': True})
+        with pytest.raises(ValueError, match="Unexpected option 1"):
+            batch_project_options({'project_dir': 'p', 1: True})
+        with pytest.raises(ValueError, match="'lib_profile' requires 'with_lib'"):
+            batch_project_options({'project_dir': 'p', 'lib_profile': 'performance'})
+        with pytest.raises(ValueError, match="'archive' cannot be combined"):
+            batch_project_options({'project_dir': 'p', 'archive': 'p.zip', 'incremental': True})
+
+
+SAMPLE_OUTPUT_XML = (
+    '<robot><suite name="Tests" source="/p/tests">'
+    '<suite name="Suite" source="/p/tests/suite.robot">'
+    '<test name="Fast">'
+    '<kw name="Some Library Keyword" owner="MyLibrary">'
+    '<msg level="INFO">This is a keyword from MyLibrary.py</msg>'
+    '<status status="PASS" elapsed="0.1"/></kw>'
+    '<kw name="Verify ${101} Is Greater Than ${100}" owner="MyLibrary"'
+    ' source_name="Verify ${number} Is Greater Than ${threshold}">'
+    '<status status="PASS" elapsed="0.2"/></kw>'
+    '<status status="PASS" elapsed="0.3"/></test>'
+    '<test name="Slow">'
+    '<kw name="Some Local Keyword">'
+    '<kw name="Log" owner="BuiltIn"><status status="PASS" elapsed="0.5"/></kw>'
+    '<status status="PASS" elapsed="0.6"/></kw>'
+    '<kw name="Verify ${1} Is Greater Than ${2}" owner="MyLibrary"'
+    ' source_name="Verify ${number} Is Greater Than ${threshold}">'
+    '<status status="FAIL" elapsed="0.4"/></kw>'
+    '<status status="FAIL" elapsed="1.0"/></test>'
+    '<status status="FAIL" elapsed="1.3"/></suite>'
+    '<status status="FAIL" elapsed="1.3"/></suite></robot>'
+)
+
+
+class TestOutputAnalysis:
+    """Test the streaming output.xml analyzer."""
+
+    @pytest.fixture
+    def output_path(self, tmp_path):
+        """An output.xml with passing and failing tests in results/."""
+        results_dir = tmp_path / 'results'
+        results_dir.mkdir()
+        (results_dir / 'output.xml').write_text(SAMPLE_OUTPUT_XML)
+        return str(results_dir / 'output.xml')
+
+    def test_counts_and_slowest(self, output_path):
+        """Test status counts and the slowest tests and keyword calls."""
+        report = analyze_output(output_path, top=2)
+
+        assert report['tests'] == {'total': 2, 'statuses': {'PASS': 1, 'FAIL': 1}}
+        assert report['keywords'] == {'total': 5, 'statuses': {'PASS': 4, 'FAIL': 1}}
+        assert [test['name'] for test in report['slowest_tests']] == [
+            'Tests.Suite.Slow', 'Tests.Suite.Fast'
+        ]
+        assert [(kw['name'], kw['test']) for kw in report['slowest_keywords']] == [
+            ('Some Local Keyword', 'Tests.Suite.Slow'), ('Log', 'Tests.Suite.Slow')
+        ]
+
+    def test_embedded_argument_calls_are_grouped(self, output_path):
+        """Test keyword totals group calls by the keyword definition."""
+        totals = {kw['keyword']: kw for kw in analyze_output(output_path)['keyword_totals']}
+
+        verify = totals['MyLibrary.Verify ${number} Is Greater Than ${threshold}']
+        assert verify['calls'] == 2
+        assert verify['total'] == pytest.approx(0.6)
+        assert verify['max'] == pytest.approx(0.4)
+        assert set(totals) == {
+            'MyLibrary.Some Library Keyword',
+            'MyLibrary.Verify ${number} Is Greater Than ${threshold}',
+            'Some Local Keyword',
+            'BuiltIn.Log',
+        }
+
+    def test_analyze_existing_results(self, output_path, tmp_path):
+        """Test --analyze without --run reports on the existing results only."""
+        json_path = str(tmp_path / 'analysis.json')
+
+        result = CliRunner().invoke(create_robot_project, [
+            '--project-dir', str(tmp_path), '--analyze', '--analysis-json', json_path
+        ])
+
+        assert result.exit_code == 0
+        assert "Tests: 2 (1 FAIL, 1 PASS)" in result.output
+        assert "MyLibrary.Verify ${number} Is Greater Than ${threshold}" in result.output
+        assert not os.path.exists(tmp_path / 'tests')
+        with open(json_path, encoding='utf-8') as f:
+            assert json.load(f)['tests']['total'] == 2
+
+
+def history_output_xml(started, fast_elapsed):
+    """An output.xml with one fast and one slow test, and statistics after the results."""
+    return (
+        f'<robot><suite name="Tests"><test name="Fast">'
+        f'<kw name="Log" owner="BuiltIn"><status status="PASS" elapsed="{fast_elapsed}"/></kw>'
+        f'<status status="PASS" elapsed="{fast_elapsed}"/></test>'
+        f'<test name="Slow"><status status="PASS" elapsed="1.0"/></test>'
+        f'<status status="PASS" start="{started}" elapsed="2.0"/></suite>'
+        f'<statistics><suite><stat name="Tests" id="s1" pass="2" fail="0">Tests</stat></suite>'
+        f'</statistics><errors/></robot>'
+    )
+
+
+class TestLeanOutput:
+    """Tests for the lean result output profile."""
+
+    def test_lean_robot_options(self, tmp_path):
+        """Test --lean lowers the log level and writes only output.xml."""
+        options = robot_options(str(tmp_path), 'out', lean=True)
+
+        assert options['loglevel'] == 'INFO'
+        assert options['log'] == options['report'] == 'NONE'
+        assert robot_options(str(tmp_path), 'out')['loglevel'] == 'TRACE:INFO'
+
+    @patch('subprocess.run')
+    def test_render_reports_on_demand(self, mock_run, tmp_path):
+        """Test lean reports are rendered by rebot with passed keywords removed."""
+        (tmp_path / 'output.xml').write_text('<robot/>')
+
+        render_reports(str(tmp_path), lean=True)
+
+        mock_run.assert_called_once_with([
+            'rebot', *LEAN_REBOT_OPTIONS, '--outputdir', str(tmp_path),
+            os.path.join(str(tmp_path), 'output.xml')
+        ])
+
+    @patch('robot_generator.render_reports')
+    def test_reports_without_run_use_existing_results(self, mock_render_reports, tmp_path):
+        """Test --reports without --run only renders the existing output.xml."""
+        result = CliRunner().invoke(create_robot_project, [
+            '--project-dir', str(tmp_path), '--reports', '--lean'
+        ])
+
+        assert result.exit_code == 0
+        mock_render_reports.assert_called_once_with(str(tmp_path / 'results'), True)
+        assert not os.path.exists(tmp_path / 'tests')
+
+    def test_lean_parallel_run_skips_reports(self, tmp_path):
+        """Test a lean parallel run merges output.xml without rendering log and report."""
+        project_dir = str(tmp_path / 'project')
+
+        result = CliRunner().invoke(create_robot_project, [
+            '--project-dir', project_dir, '--suites', '2', '--tests-per-suite', '2',
+            '--run', '--processes', '2', '--lean'
+        ])
+
+        assert result.exit_code == 0
+        results_dir = os.path.join(project_dir, 'results')
+        assert os.path.exists(os.path.join(results_dir, 'output.xml'))
+        assert not os.path.exists(os.path.join(results_dir, 'log.html'))
+        assert not os.path.exists(os.path.join(results_dir, 'report.html'))
+
+
+class TestDataDrivenGeneration:
+    """Tests for Test Template suites generated from datasets."""
+
+    @pytest.mark.parametrize('value, cell', [
+        ('plain', 'plain'),
+        ('two  spaces', 'two \\ spaces'),
+        (' padded ', '\\ padded\\ '),
+        ('${var}', '\\${var}'),
+        ('# not a comment', '\\# not a comment'),
+        ('name=value', 'name\\=value'),
+        ('', '${EMPTY}'),
+        (None, '${None}'),
+        (42, '42'),
+        ('IF', '\\IF'),
+        ('ELSE IF', '\\ELSE IF'),
+        ('END', '\\END'),
+        ('FOR', '\\FOR'),
+        ('VAR', '\\VAR'),
+        ('...', '\\...'),
+        ('[Tags]', '\\[Tags]'),
+        ('If', 'If'),
+    ])
+    def test_robot_cell(self, value, cell):
+        """Test dataset values are escaped into single literal cells."""
+        assert robot_cell(value) == cell
+
+    def test_dataset_formats(self, tmp_path, monkeypatch):
+        """Test CSV, JSON and JSON Lines datasets stream the same rows."""
+        monkeypatch.setattr('robot_generator.DATASET_READ_SIZE', 5)
+        (tmp_path / 'data.csv').write_text('number,threshold\n2,1\n30,20\n')
+        (tmp_path / 'data.json').write_text(
+            '[{"number": 2, "threshold": 1},\n {"threshold": 20, "number": 30}]'
+        )
+        (tmp_path / 'data.jsonl').write_text('{"number": 2, "threshold": 1}\n\n[30, 20]\n')
+
+        assert list(iter_dataset_rows(str(tmp_path / 'data.csv'))) == [['2', '1'], ['30', '20']]
+        assert list(iter_dataset_rows(str(tmp_path / 'data.json'))) == [[2, 1], [30, 20]]
+        assert list(iter_dataset_rows(str(tmp_path / 'data.jsonl'))) == [[2, 1], [30, 20]]
+
+    def test_rows_are_sharded(self, tmp_path):
+        """Test suites are split by row count and by size."""
+        dataset = tmp_path / 'numbers.csv'
+        dataset.write_text('number,threshold\n' + ''.join(f'{i},0\n' for i in range(1, 8)))
+        project_dir = tmp_path / 'project'
+
+        result = CliRunner().invoke(create_robot_project, [
+            '--project-dir', str(project_dir), '--with-lib',
+            '--dataset', str(dataset), '--rows-per-suite', '3'
+        ])
+
+        assert result.exit_code == 0
+        assert "7 rows written as 3 suites" in result.output
+        shards = sorted(os.listdir(project_dir / 'tests' / 'numbers'))
+        assert shards == ['shard_0001.robot', 'shard_0002.robot', 'shard_0003.robot']
+        content = (project_dir / 'tests' / 'numbers' / 'shard_0003.robot').read_text()
+        assert 'Library    ../../libraries/MyLibrary.py' in content
+        assert 'Test Template    Verify ${number} Is Greater Than ${threshold}' in content
+        assert 'Row 7    7    0\n' in content
+
+        result = CliRunner().invoke(create_robot_project, [
+            '--project-dir', str(project_dir), '--dataset', str(dataset), '--bytes-per-suite', '1'
+        ])
+        assert "7 rows written as 7 suites" in result.output
+
+    def test_dataset_suites_run(self, tmp_path):
+        """Test the generated template suites pass and fail per row."""
+        dataset = tmp_path / 'numbers.jsonl'
+        dataset.write_text('{"number": 5, "threshold": 1}\n{"number": 1, "threshold": 5}\n')
+        project_dir = tmp_path / 'project'
+
+        result = CliRunner().invoke(create_robot_project, [
+            '--project-dir', str(project_dir), '--with-lib', '--dataset', str(dataset),
+            '--run', '--in-process', '--lean'
+        ])
+
+        assert result.exit_code != 0
+        report = analyze_output(str(project_dir / 'results' / 'output.xml'))
+        assert report['tests']['statuses'] == {'PASS': 3, 'FAIL': 1}
+
+
+class TestArchiveOutput:
+    """Tests for streaming generated projects into archives."""
+
+    @pytest.mark.parametrize('archive_name', ['project.tar.gz', 'project.zip'])
+    def test_archive_layout(self, tmp_path, archive_name):
+        """Test archives hold the project layout and the project directory is not created."""
+        import tarfile
+        import zipfile
+
+        project_dir = tmp_path / 'my_project'
+        archive = tmp_path / archive_name
+
+        result = CliRunner().invoke(create_robot_project, [
+            '--project-dir', str(project_dir), '--with-lib', '--suites', '2',
+            '--archive', str(archive)
+        ])
+
+        assert result.exit_code == 0, result.output
+        assert "3 files archived in:" in result.output
+        assert not project_dir.exists()
+        if archive_name.endswith('.zip'):
+            with zipfile.ZipFile(archive) as f:
+                names = f.namelist()
+                suite = f.read('my_project/tests/group_0/suite_1.robot').decode('utf-8')
+                assert {info.date_time for info in f.infolist()} == {(1980, 1, 1, 0, 0, 0)}
+        else:
+            with tarfile.open(archive) as f:
+                names = [member.name + ('/' if member.isdir() else '') for member in f]
+                suite = f.extractfile('my_project/tests/group_0/suite_1.robot').read().decode('utf-8')
+                assert {member.mtime for member in f} == {0}
+        assert names == [
+            'my_project/', 'my_project/tests/', 'my_project/tests/group_0/',
+            'my_project/tests/group_0/suite_1.robot', 'my_project/tests/group_0/suite_2.robot',
+            'my_project/libraries/', 'my_project/libraries/MyLibrary.py',
+        ]
+        assert suite == ''.join(render_robot_suite(
+            'Library    ../../libraries/MyLibrary.py',
+            iter_generated_test_cases(10, True, False),
+        ))
+
+    def test_archives_are_reproducible(self, tmp_path):
+        """Test generating the same project twice gives byte-identical archives."""
+        runner = CliRunner()
+        for name in ('first.tar.gz', 'second.tar.gz'):
+            runner.invoke(create_robot_project, [
+                '--project-dir', str(tmp_path / 'project'), '--with-resource',
+                '--archive', str(tmp_path / name)
+            ])
+
+        assert (tmp_path / 'first.tar.gz').read_bytes() == (tmp_path / 'second.tar.gz').read_bytes()
+
+    @pytest.mark.parametrize('archive_name', ['project.tar.gz', 'project.zip'])
+    def test_failed_generation_leaves_no_archive(self, tmp_path, archive_name):
+        """Test an archive is not created, nor an existing one replaced, when rendering fails."""
+        dataset = tmp_path / 'numbers.json'
+        dataset.write_text('[{"number": 2, "threshold": 1}, {"number": 3')
+        archive = tmp_path / archive_name
+        archive.write_bytes(b'previous archive')
+
+        result = CliRunner().invoke(create_robot_project, [
+            '--project-dir', str(tmp_path / 'project'), '--dataset', str(dataset),
+            '--archive', str(archive)
+        ])
+
+        assert result.exit_code != 0
+        assert "unexpected end of JSON array" in result.output
+        assert archive.read_bytes() == b'previous archive'
+        assert {path.name for path in tmp_path.iterdir()} == {archive_name, 'numbers.json'}
+
+    def test_archive_cannot_run(self, tmp_path):
+        """Test --archive is rejected together with options that need the project directory."""
+        result = CliRunner().invoke(create_robot_project, [
+            '--project-dir', str(tmp_path), '--archive', str(tmp_path / 'p.zip'), '--run'
+        ])
+
+        assert result.exit_code != 0
+        assert "--archive writes no project directory" in result.output
+
+
+class TestKeywordStress:
+    """Tests for the keyword resolution stress generator."""
+
+    def test_calls_are_spread_over_keywords(self):
+        """Test the stress tests call keywords spread over the whole range."""
+        test_cases = ''.join(iter_stress_test_cases(keywords=100, tests=4))
+
+        for index in (1, 26, 51, 76):
+            assert f'    Library Keyword {index} With value {index} Argument\n' in test_cases
+        assert 'Resource Keyword 100' not in test_cases
+
+    def test_stress_project_resolves_and_passes(self, tmp_path):
+        """Test every generated keyword is defined and the stress suite passes."""
+        from robot.libdocpkg import LibraryDocumentation
+
+        project_dir = tmp_path / 'project'
+
+        result = CliRunner().invoke(create_robot_project, [
+            '--project-dir', str(project_dir), '--keywords', '5', '--tests-per-suite', '5',
+            '--validate', '--run', '--in-process', '--lean'
+        ])
+
+        assert result.exit_code == 0, result.output
+        library = LibraryDocumentation(str(project_dir / 'libraries' / 'StressLibrary.py'))
+        resource = LibraryDocumentation(str(project_dir / 'resources' / 'StressResource.robot'))
+        assert len(library.keywords) == len(resource.keywords) == 10
+        report = analyze_output(str(project_dir / 'results' / 'output.xml'))
+        assert report['tests']['statuses'] == {'PASS': 6}
+
+
+class TestValidation:
+    """Tests for in-process validation of generated suites."""
+
+    def test_generated_project_is_valid(self, tmp_path):
+        """Test sample, generated and data-driven suites validate cleanly."""
+        dataset = tmp_path / 'numbers.csv'
+        dataset.write_text('number,threshold\n2,1\n')
+        project_dir = str(tmp_path / 'project')
+
+        result = CliRunner().invoke(create_robot_project, [
+            '--project-dir', project_dir, '--with-lib', '--with-resource', '--suites', '3',
+            '--dataset', str(dataset), '--validate'
+        ])
+
+        assert result.exit_code == 0, result.output
+        assert "Validated 5 files, 3 parsed and 2 reused by content hash: 0 problems." in result.output
+
+    def test_problems_are_reported(self, tmp_path):
+        """Test syntax errors, missing imports and unknown keywords are found."""
+        project_dir = tmp_path / 'project'
+        generate_project(str(project_dir), with_lib=True, echo=lambda message: None)
+        suite = project_dir / 'tests' / 'Broken.robot'
+        suite.write_text(
+            '*** Settings ***\n'
+            'Library    ../libraries/MyLibrary.py\n'
+            'Resource    ../resources/Missing.robot\n'
+            'Suite Setup    Undefined Setup\n'
+            '\n*** Test Cases ***\n'
+            'Broken\n'
+            '    Verify ${2} Is Greater Than ${1}\n'
+            '    BuiltIn.Log    fine\n'
+            '    Given Some Library Keyword\n'
+            '    Unknown Keyword\n'
+            '    FOR    ${i}    IN RANGE    2\n'
+            '        Log    ${i}\n'
+        )
+
+        problems = validate_file(str(suite), str(project_dir))
+
+        assert problems == [
+            (3, "Resource file '../resources/Missing.robot' not found."),
+            (4, "No keyword with name 'Undefined Setup' found."),
+            (11, "No keyword with name 'Unknown Keyword' found."),
+            (12, 'FOR loop must have closing END.'),
+        ]
+
+    def test_results_are_cached_by_content(self, tmp_path):
+        """Test unchanged files are not parsed again and edits invalidate only that file."""
+        project_dir = str(tmp_path / 'project')
+        generate_project(project_dir, with_resource=True, suites=4, echo=lambda message: None)
+
+        assert validate_project(project_dir, workers=1) == ({}, 2, 5)
+        with patch('robot_generator.validate_file') as mock_validate:
+            assert validate_project(project_dir, workers=1) == ({}, 0, 5)
+            mock_validate.assert_not_called()
+
+        suite = os.path.join(project_dir, 'tests', 'group_0', 'suite_2.robot')
+        with open(suite, 'a', encoding='utf-8') as f:
+            f.write('    Missing Keyword\n')
+        problems, parsed, total = validate_project(project_dir, workers=1)
+        assert parsed == 1
+        assert list(problems) == [suite]
+
+    def test_regenerated_library_is_validated_again(self, tmp_path):
+        """Test keywords of a library regenerated in the same process are not taken from an earlier call."""
+        project_dir = str(tmp_path / 'project')
+        generate_project(project_dir, with_lib=True, echo=lambda message: None)
+        assert validate_project(project_dir, workers=1) == ({}, 1, 1)
+
+        generate_project(project_dir, with_lib=True, lib_profile='performance', echo=lambda message: None)
+
+        assert validate_project(project_dir, workers=1) == ({}, 1, 1)
+
+    def test_validation_failure_stops_run(self, tmp_path):
+        """Test --run does not start when validation fails."""
+        project_dir = tmp_path / 'project'
+        (project_dir / 'tests').mkdir(parents=True)
+        (project_dir / 'tests' / 'Broken.robot').write_text(
+            '*** Test Cases ***\nBroken\n    Unknown Keyword\n'
+        )
+
+        with patch('robot_generator.run_project') as mock_run:
+            result = CliRunner().invoke(create_robot_project, [
+                '--project-dir', str(project_dir), '--validate', '--run'
+            ])
+
+        assert result.exit_code != 0
+        assert "No keyword with name 'Unknown Keyword' found." in result.output
+        mock_run.assert_not_called()
+
+
+class TestWatchMode:
+    """Tests for --watch change detection and suite selection."""
+
+    def test_polling_watcher_reports_changes(self, tmp_path):
+        """Test the polling watcher reports edited, created and deleted files but not results."""
+        (tmp_path / 'tests').mkdir()
+        (tmp_path / 'results').mkdir()
+        edited = tmp_path / 'tests' / 'A.robot'
+        deleted = tmp_path / 'tests' / 'B.robot'
+        edited.write_text('a')
+        deleted.write_text('b')
+        template = tmp_path.parent / f'{tmp_path.name}-template.txt'
+        template.write_text('t')
+        watcher = PollingWatcher(str(tmp_path), [str(template)], interval=0.01)
+
+        edited.write_text('changed')
+        deleted.unlink()
+        (tmp_path / 'tests' / 'C.robot').write_text('c')
+        (tmp_path / 'results' / 'output.xml').write_text('<robot/>')
+        template.write_text('changed')
+
+        assert watcher.changes(timeout=0) == {
+            str(edited), str(deleted), str(tmp_path / 'tests' / 'C.robot'), str(template)
+        }
+        assert watcher.changes(timeout=0) == set()
+
+    def test_affected_suites(self, tmp_path):
+        """Test changed suites and suites importing changed files are selected."""
+        project_dir = tmp_path / 'project'
+        generate_project(str(project_dir), with_lib=True, with_resource=True, suites=3,
+                         echo=lambda message: None)
+        suites = discover_suites(str(project_dir / 'tests'))
+        dependencies = {
+            os.path.abspath(suite): set(map(os.path.abspath, collect_dependencies(suite)))
+            for suite in suites
+        }
+        library = os.path.abspath(project_dir / 'libraries' / 'MyLibrary.py')
+
+        assert affected_suites(str(project_dir), {library}, dependencies) == sorted(
+            os.path.abspath(suite) for suite in suites
+        )
+        assert affected_suites(str(project_dir), {suites[1]}, dependencies) == [
+            os.path.abspath(suites[1])
+        ]
+        assert affected_suites(str(project_dir), {str(tmp_path / 'other.py')}, dependencies) == []
+
+    def test_watch_reruns_affected_suites(self, tmp_path):
+        """Test one watch iteration reruns only the suite that changed."""
+        project_dir = str(tmp_path / 'project')
+        changed_suite = os.path.abspath(
+            os.path.join(project_dir, 'tests', 'group_0', 'suite_2.robot')
+        )
+
+        class FakeWatcher:
+            name = 'fake'
+
+            def __init__(self):
+                self.calls = 0
+
+            def changes(self, timeout=None):
+                self.calls += 1
+                if self.calls > 1:
+                    raise KeyboardInterrupt
+                return {changed_suite}
+
+        with patch('robot_generator.create_watcher', return_value=FakeWatcher()), \
+                patch('robot_generator.run_robot_in_process', return_value=0) as mock_run:
+            runner = CliRunner()
+            result = runner.invoke(create_robot_project, [
+                '--project-dir', project_dir, '--suites', '3', '--watch'
+            ])
+
+        assert result.exit_code == 0
+        assert "Rerunning 1 affected suites..." in result.output
+        assert "Stopped watching." in result.output
+        mock_run.assert_called_once_with(
+            project_dir, os.path.join(project_dir, 'results'), {'profiler': False, 'lean': False},
+            parseinclude=[changed_suite]
+        )
+
+
+class TestRerunFailed:
+    """Tests for rerunning only the failed tests."""
+
+    def test_read_failed_tests(self, tmp_path):
+        """Test failed tests are grouped by suite file together with the suite's duration."""
+        output_path = tmp_path / 'output.xml'
+        output_path.write_text(SAMPLE_OUTPUT_XML)
+
+        assert read_failed_tests(str(output_path)) == {
+            os.path.abspath('/p/tests/suite.robot'): (1.3, ['Tests.Suite.Slow'])
+        }
+
+    def test_test_names_are_matched_literally(self, tmp_path):
+        """Test glob characters in rerun test names are escaped."""
+        options = robot_options(str(tmp_path), 'out', tests=['Suite.Test [1]*?'])
+
+        assert options['test'] == ['Suite.Test [[]1][*][?]']
+
+    def test_rerun_failed_merges_results(self, tmp_path):
+        """Test only the failed test is rerun and its result replaces the failure."""
+        project_dir = tmp_path / 'project'
+        flag = tmp_path / 'flag'
+        (project_dir / 'tests').mkdir(parents=True)
+        (project_dir / 'tests' / 'Flaky.robot').write_text(
+            '*** Settings ***\nLibrary    OperatingSystem\n\n'
+            '*** Test Cases ***\n'
+            f'Stable\n    Log    ok\n\nFlaky [1]\n    File Should Exist    {flag}\n'
+        )
+        runner = CliRunner()
+        first = runner.invoke(create_robot_project, [
+            '--project-dir', str(project_dir), '--suite-name', 'Other.robot', '--run', '--in-process'
+        ])
+        assert first.exit_code != 0
+
+        flag.write_text('')
+        result = runner.invoke(create_robot_project, [
+            '--project-dir', str(project_dir), '--rerun-failed', '--in-process', '--timings'
+        ])
+
+        assert result.exit_code == 0
+        assert "Rerunning 1 failed tests from 1 suites..." in result.output
+        report = json.loads(result.output.splitlines()[-1])
+        assert [phase['phase'] for phase in report['phases']] == ['read failures', 'robot rerun', 'merge']
+        results_dir = project_dir / 'results'
+        rerun = analyze_output(str(results_dir / 'rerun' / 'output.xml'))
+        assert rerun['tests'] == {'total': 1, 'statuses': {'PASS': 1}}
+        merged = analyze_output(str(results_dir / 'output.xml'))
+        assert merged['tests'] == {'total': 3, 'statuses': {'PASS': 3}}
+        assert os.path.exists(results_dir / 'log.html')
+
+    @patch('robot_generator.run_robot_worker', return_value=0)
+    def test_shards_get_only_their_failed_tests(self, mock_worker, tmp_path):
+        """Test each rerun worker selects only the failed tests of its own suites."""
+        shards = [['/p/a.robot'], ['/p/b.robot', '/p/c.robot']]
+        tests = {'/p/a.robot': ['A.One'], '/p/b.robot': ['B.One', 'B.Two'], '/p/c.robot': ['C.One']}
+
+        run_shards(str(tmp_path), str(tmp_path / 'rerun'), shards, True, {'lean': True}, tests)
+
+        settings = {tuple(worker.args[2]): worker.args[4] for worker in mock_worker.call_args_list}
+        assert settings == {
+            ('/p/a.robot',): {'lean': True, 'tests': ['A.One']},
+            ('/p/b.robot', '/p/c.robot'): {'lean': True, 'tests': ['B.One', 'B.Two', 'C.One']},
+        }
+
+    def test_rerun_failed_without_results(self, tmp_path):
+        """Test --rerun-failed needs a previous output.xml."""
+        result = CliRunner().invoke(create_robot_project, [
+            '--project-dir', str(tmp_path), '--rerun-failed'
+        ])
+
+        assert result.exit_code != 0
+        assert "Run the test suite first." in result.output
+
+
+class TestRunHistory:
+    """Tests for the SQLite run history and regression query."""
+
+    def record_runs(self, tmp_path, fast_durations):
+        db_path = str(tmp_path / 'history.db')
+        output_path = tmp_path / 'output.xml'
+        for day, elapsed in enumerate(fast_durations, start=1):
+            output_path.write_text(history_output_xml(f'2024-01-{day:02d}T10:00:00', elapsed))
+            ingest_output(db_path, str(output_path), 'project')
+        return db_path
+
+    def test_ingest_suites_tests_and_keywords(self, tmp_path):
+        """Test a run is stored with its start time, results and keyword totals."""
+        import sqlite3
+
+        db_path = self.record_runs(tmp_path, [0.1])
+
+        with sqlite3.connect(db_path) as connection:
+            assert connection.execute('SELECT started, project_dir FROM runs').fetchall() == [
+                ('2024-01-01T10:00:00', 'project')
+            ]
+            assert connection.execute('SELECT name, elapsed FROM suites').fetchall() == [
+                ('Tests', 2.0)
+            ]
+            assert connection.execute('SELECT name FROM tests ORDER BY name').fetchall() == [
+                ('Tests.Fast',), ('Tests.Slow',)
+            ]
+            assert connection.execute('SELECT name, calls, failures FROM keywords').fetchall() == [
+                ('BuiltIn.Log', 1, 0)
+            ]
+
+    def test_regression_against_rolling_baseline(self, tmp_path):
+        """Test only the latest run is compared against the mean of the previous runs."""
+        db_path = self.record_runs(tmp_path, [10.0, 0.1, 0.1, 0.1, 0.2])
+
+        regression, = find_regressions(db_path, threshold=50, baseline_runs=3)
+
+        assert regression['name'] == 'Tests.Fast'
+        assert regression['samples'] == 3
+        assert regression['baseline'] == pytest.approx(0.1)
+        assert regression['change'] == pytest.approx(100)
+        assert find_regressions(db_path, threshold=150, baseline_runs=3) == []
+        assert find_regressions(db_path, threshold=50, baseline_runs=4) == []
+
+    def test_regressions_cli(self, tmp_path):
+        """Test --regressions queries the history without generating a project."""
+        db_path = self.record_runs(tmp_path, [0.1, 0.3])
+        project_dir = str(tmp_path / 'project')
+
+        result = CliRunner().invoke(create_robot_project, [
+            '--project-dir', project_dir, '--history', db_path, '--regressions'
+        ])
+
+        assert result.exit_code == 0
+        assert "+200.0%" in result.output
+        assert "Tests.Fast" in result.output
+        assert not os.path.exists(project_dir)
+
+    def test_history_requires_run_or_regressions(self, tmp_path):
+        """Test --history alone is rejected."""
+        result = CliRunner().invoke(create_robot_project, [
+            '--history', str(tmp_path / 'history.db')
+        ])
+
+        assert result.exit_code != 0
+        assert "--history records the results of --run" in result.output
+
+
+class TestProfilingListener:
+    """Tests for the generated keyword profiling listener."""
+
+    def test_listener_file_and_registration(self, tmp_path):
+        """Test --with-profiler writes the listener and robot_options registers it."""
+        project_dir = str(tmp_path / 'project')
+
+        result = CliRunner().invoke(create_robot_project, [
+            '--project-dir', project_dir, '--with-profiler'
+        ])
+
+        assert result.exit_code == 0
+        assert os.path.exists(os.path.join(project_dir, 'libraries', PROFILER_FILE_NAME))
+        assert 'listener' not in robot_options(project_dir, 'out')
+        listener, = robot_options(project_dir, 'out', profiler=True)['listener']
+        assert listener.startswith(os.path.abspath(os.path.join(project_dir, 'libraries')))
+        assert listener.endswith(':' + os.path.abspath(os.path.join('out', 'profile.csv')))
+
+    def test_profiler_does_not_change_cache_key(self, tmp_path):
+        """Test the listener is not part of the result cache key."""
+        suite = tmp_path / 'Suite.robot'
+        suite.write_text('*** Test Cases ***\nT\n    Log    x\n')
+
+        assert suite_cache_key(str(tmp_path), str(suite)) == suite_cache_key(
+            str(tmp_path), str(suite), {'profiler': True}
+        )
+
+    def test_run_writes_profile(self, tmp_path):
+        """Test a profiled run records self time for suites, tests and keywords."""
+        project_dir = str(tmp_path / 'project')
+
+        result = CliRunner().invoke(create_robot_project, [
+            '--project-dir', project_dir, '--with-lib', '--with-profiler', '--run', '--in-process'
+        ])
+
+        assert result.exit_code == 0
+        profile = os.path.join(project_dir, 'results', 'profile.csv')
+        lines = list(collapse_profile_lines(profile, min_microseconds=0))
+        stacks = {line.rsplit(' ', 1)[0] for line in lines}
+        assert 'Tests' in stacks
+        assert any(stack.endswith(';MyLibrary.Some Library Keyword') for stack in stacks)
+        assert all(int(line.rsplit(' ', 1)[1]) >= 0 for line in lines)
+
+    def test_collapse_profile_sums_self_time(self, tmp_path):
+        """Test collapsed stacks sum the self time of repeated stacks."""
+        profile = tmp_path / 'profile.csv'
+        profile.write_text(
+            'keyword,1,5000,5000,S;T;Log\n'
+            'keyword,2,7000,7000,S;T;Log\n'
+            'test,0,20000,8000,S;T\n'
+        )
+
+        result = CliRunner().invoke(create_robot_project, ['--collapse-profile', str(profile)])
+
+        assert result.exit_code == 0
+        assert result.output.splitlines() == ['S;T 8', 'S;T;Log 12']
+
+
+class TestWritePipeline:
+    """Tests for the threaded, atomic write pipeline."""
+
+    @staticmethod
+    def read_tree(directory):
+        return {
+            path.relative_to(directory).as_posix(): path.read_text()
+            for path in directory.rglob('*')
+            if path.is_file()
+        }
+
+    def test_workers_write_the_same_project(self, tmp_path):
+        """Test several write workers produce the same files as one and leave no temporary files."""
+        trees = []
+        for workers in ('1', '8'):
+            project_dir = tmp_path / f'workers_{workers}'
+            result = CliRunner().invoke(create_robot_project, [
+                '--project-dir', str(project_dir), '--with-lib', '--with-resource',
+                '--suites', '250', '--write-workers', workers
+            ])
+            assert result.exit_code == 0, result.output
+            assert "252 files written." in result.output
+            trees.append(self.read_tree(project_dir))
+
+        assert len(trees[0]) == 252
+        assert trees[0] == trees[1]
+        assert not [path for path in trees[1] if path.endswith('.tmp')]
+
+    def test_project_directories_are_known_up_front(self):
+        """Test the directory list covers the suite groups, dataset and optional directories."""
+        assert project_directories(True, False, suites=250, dataset='data/rows.csv') == [
+            'tests',
+            os.path.join('tests', 'group_0'),
+            os.path.join('tests', 'group_1'),
+            os.path.join('tests', 'group_2'),
+            os.path.join('tests', 'rows'),
+            'libraries',
+        ]
+
+    @pytest.mark.parametrize('workers', [1, 4])
+    def test_failed_write_leaves_previous_file(self, tmp_path, workers):
+        """Test a failing render keeps the old file intact and removes its temporary file."""
+        (tmp_path / 'suite.robot').write_text('old content')
+
+        def failing_render():
+            yield 'partial content'
+            raise RuntimeError('render failed')
+
+        writer = ProjectWriter(str(tmp_path), workers)
+        with pytest.raises(RuntimeError, match='render failed'):
+            writer.write('other.robot', lambda: ['new file'])
+            writer.write('suite.robot', failing_render)
+            writer.close()
+
+        assert sorted(os.listdir(tmp_path)) == ['other.robot', 'suite.robot']
+        assert (tmp_path / 'suite.robot').read_text() == 'old content'
+        assert (tmp_path / 'other.robot').read_text() == 'new file'
+
+
+class TestStartupTime:
+    """Tests that importing the generator stays cheap for library and CLI use."""
+
+    REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    # Measured around 25 ms with cached bytecode; click alone used to add about 60 ms.
+    IMPORT_BUDGET_MICROSECONDS = 100_000
+    # click itself is loaded lazily, so -X importtime only reports its submodules.
+    HEAVY_MODULES = {'click.core', 'subprocess', 'webbrowser', 'sqlite3', 'zipfile', 'tarfile'}
+
+    def import_times(self, code):
+        """Returns the cumulative ``-X importtime`` microseconds of every module ``code`` imports."""
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            cwd=self.REPO_DIR, capture_output=True, text=True, check=True
+        )
+        times = {}
+        for line in result.stderr.splitlines():
+            _, cumulative, name = line.split('|')
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+        return times
+
+    def test_import_stays_within_budget(self):
+        """Test importing the module skips heavy modules and meets the time budget."""
+        runs = [self.import_times('import robot_generator') for _ in range(3)]
+
+        assert not self.HEAVY_MODULES & runs[0].keys()
+        assert min(run['robot_generator'] for run in runs) < self.IMPORT_BUDGET_MICROSECONDS
+
+    def test_cli_loads_click_on_first_use(self):
+        """Test accessing the click command imports click but not the run-only modules."""
+        times = self.import_times('import robot_generator; robot_generator.create_robot_project')
+
+        assert 'click.core' in times
+        assert not (self.HEAVY_MODULES - {'click.core'}) & times.keys()
+
+    def test_generate_works_without_click(self, tmp_path):
+        """Test the programmatic generate() entry point never needs click."""
+        code = (
+            "import sys; sys.modules['click'] = None\n"
+            "import robot_generator\n"
+            f"writer = robot_generator.generate({str(tmp_path)!r}, quiet=True, with_lib=True, suites=2)\n"
+            "print(writer.written)\n"
+            "try:\n"
+            f"    robot_generator.generate({str(tmp_path / 'other')!r}, quiet=True, archive='out.rar')\n"
+            "except ValueError as e:\n"
+            "    print(e)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code], cwd=self.REPO_DIR, capture_output=True, text=True
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout == '3\nout.rar: archives must end with .zip, .tar, .tar.gz or .tgz.\n'
+        assert (tmp_path / 'tests' / 'group_0' / 'suite_1.robot').is_file()
+        assert (tmp_path / 'libraries' / 'MyLibrary.py').is_file()
+
+
+class TestPerformanceLibraryProfile:
+    """Tests for the --lib-profile performance library template."""
+
+    def test_sample_suite_uses_performance_library(self, tmp_path):
+        """Test the performance profile writes the GLOBAL library and a test using its keywords."""
+        result = CliRunner().invoke(create_robot_project, [
+            '--project-dir', str(tmp_path), '--with-lib', '--lib-profile', 'performance'
+        ])
+
+        assert result.exit_code == 0, result.output
+        library = (tmp_path / 'libraries' / 'MyLibrary.py').read_text(encoding='utf-8')
+        assert library == MY_PERFORMANCE_LIBRARY_CONTENT
+        assert "@library(scope='GLOBAL'" in library
+        suite = (tmp_path / 'tests' / 'MySuite.robot').read_text(encoding='utf-8')
+        assert TEST_CASE_2 in suite
+        assert TEST_CASE_PERFORMANCE in suite
+
+    def test_lib_profile_requires_with_lib(self, tmp_path):
+        """Test --lib-profile other than the default is rejected without --with-lib."""
+        result = CliRunner().invoke(create_robot_project, [
+            '--project-dir', str(tmp_path), '--lib-profile', 'performance'
+        ])
+
+        assert result.exit_code != 0
+        assert "--lib-profile requires --with-lib." in result.output
+
+    def test_unknown_profile_is_rejected(self, tmp_path):
+        """Test generate_project rejects unknown profiles, e.g. from batch manifests."""
+        with pytest.raises(ValueError, match="Unknown library profile 'fast'"):
+            generate_project(str(tmp_path), with_lib=True, lib_profile='fast', echo=lambda message: None)
+
+    def test_generated_tests_pass_with_one_library_instance(self, tmp_path):
+        """Test pooled, concurrent and async keywords pass and the resources start once per run."""
+        result = CliRunner().invoke(create_robot_project, [
+            '--project-dir', str(tmp_path), '--with-lib', '--lib-profile', 'performance',
+            '--suites', '3', '--tests-per-suite', '2', '--validate', '--run', '--in-process'
+        ])
+
+        assert result.exit_code == 0, result.output
+        output = (tmp_path / 'results' / 'output.xml').read_text(encoding='utf-8')
+        assert output.count('Started stub server and resource pools') == 1
+        report = analyze_output(str(tmp_path / 'results' / 'output.xml'))
+        assert report['tests']['statuses'] == {'PASS': 6}